@@ -40,9 +40,93 @@ def _start_linter():
                 raise
 
 
+def _manage_cache():
+    """
+    Manages the pickled syntax trees in the cache directory::
+
+        python -m jedi cache [info|prune|clear]
+        python -m jedi cache populate <path>...
+        python -m jedi cache bundle <bundle-file>
+        python -m jedi cache import <bundle-file>
+
+    ``populate`` parses all Python files of the given paths and pickles them.
+    ``bundle`` and ``import`` create and import a bundle of the caches for
+    the project in the current directory (see :mod:`jedi.api.cache_bundle`).
+    """
+    from jedi import settings
+    from jedi.inference import parse_store
+
+    args = sys.argv[2:] or ['info']
+    command = args[0]
+    cache_path = settings.cache_directory
+    if command == 'populate':
+        _populate_cache(args[1:])
+    elif command in ('bundle', 'import') and len(args) == 2:
+        from jedi.api import cache_bundle
+        if command == 'bundle':
+            count = cache_bundle.create_bundle(args[1])
+            print('Wrote the caches of %s files to %s' % (count, args[1]))
+        else:
+            count = cache_bundle.import_bundle(args[1])
+            print('Imported the caches of %s files' % count)
+    elif command in ('info', 'prune', 'clear'):
+        for directory in parse_store.get_store_directories(cache_path):
+            if command == 'prune':
+                if settings.max_parse_cache_size is None:
+                    print('There is no maximum cache size to prune to.')
+                    return
+                count = parse_store.prune(directory, settings.max_parse_cache_size)
+                print('%s: Deleted %s files' % (directory, count))
+            elif command == 'clear':
+                count = parse_store.clear_store(directory)
+                print('%s: Deleted %s files' % (directory, count))
+            else:
+                count, size = parse_store.get_store_info(directory)
+                print('%s: %s files, %.1f MB' % (directory, count, size / 2. ** 20))
+    else:
+        print('Unknown cache command %r, use info, prune, clear, populate, bundle or import.'
+              % command)
+        sys.exit(1)
+
+
+def _populate_cache(paths):
+    import os
+
+    from jedi import settings
+    from jedi.api.project import Project
+    from jedi.file_io import FileIO
+    from jedi.inference import InferenceState
+
+    inference_state = InferenceState(Project(os.getcwd()))
+    count = 0
+    for path in paths:
+        if isdir(path):
+            file_paths = [
+                join(root, filename)
+                for root, dirnames, filenames in os.walk(path)
+                for filename in filenames if filename.endswith('.py')
+            ]
+        else:
+            file_paths = [path]
+        for file_path in file_paths:
+            try:
+                inference_state.parse(
+                    file_io=FileIO(abspath(file_path)),
+                    cache=True,
+                    cache_path=settings.cache_directory,
+                )
+            except (IOError, OSError) as e:
+                print('Could not parse %s: %s' % (file_path, e))
+                continue
+            count += 1
+    print('Parsed %s files' % count)
+
+
 if len(sys.argv) == 2 and sys.argv[1] == 'repl':
     # don't want to use __main__ only for repl yet, maybe we want to use it for
     # something else. So just use the keyword ``repl`` for now.
     print(join(dirname(abspath(__file__)), 'api', 'replstartup.py'))
 elif len(sys.argv) > 1 and sys.argv[1] == 'linter':
     _start_linter()
+elif len(sys.argv) > 1 and sys.argv[1] == 'cache':
+    _manage_cache()
@@ -9,11 +9,14 @@ arguments.
 
 .. warning:: Please, note that Jedi is **not thread safe**.
 """
+import bisect
 import os
 import sys
 import warnings
+from copy import copy
 
 import parso
+from parso import python_bytes_to_unicode
 from parso.python import tree
 
 from jedi._compatibility import force_unicode, cast_path, is_py3
@@ -37,6 +40,7 @@ from jedi.inference.arguments import try_iter_content
 from jedi.inference.helpers import get_module_names, infer_call_of_leaf
 from jedi.inference.sys_path import transform_path_to_dotted
 from jedi.inference.syntax_tree import tree_name_to_values
+from jedi.inference.outline import get_outline
 from jedi.inference.value import ModuleValue
 from jedi.inference.base_value import ValueSet
 from jedi.inference.value.iterable import unpack_tuple_to_dict
@@ -111,27 +115,60 @@ class Script(object):
             )
         # TODO deprecate and remove sys_path from the Script API.
         if sys_path is not None:
+            if _project is None:
+                # Default projects are cached and shared, don't modify them.
+                project = copy(project)
             project._sys_path = sys_path
         self._inference_state = InferenceState(
             project, environment=environment, script_path=self.path
         )
         debug.speed('init')
-        self._module_node, source = self._inference_state.parse_and_get_code(
-            code=source,
+        self._source = python_bytes_to_unicode(source, encoding, errors='replace')
+        self._removed_ranges = []
+        self._kept_range = None
+        self._parse()
+        debug.speed('parsed')
+        self._pos = line, column
+
+        cache.clear_time_caches()
+        debug.reset_time()
+
+    def _parse(self, keep_line=None):
+        code = self._source
+        if len(code) > settings._outline_file_size:
+            code, self._removed_ranges = get_outline(code, keep_line)
+        self._module_node, code = self._inference_state.parse_and_get_code(
+            code=code,
             path=self.path,
-            encoding=encoding,
-            use_latest_grammar=path and path.endswith('.pyi'),
+            use_latest_grammar=self.path and self.path.endswith('.pyi'),
+            outline=False,
             cache=False,  # No disk cache, because the current script often changes.
             diff_cache=settings.fast_parser,
             cache_path=settings.cache_directory,
         )
-        debug.speed('parsed')
-        self._code_lines = parso.split_lines(source, keepends=True)
-        self._code = source
-        self._pos = line, column
+        self._code_lines = parso.split_lines(code, keepends=True)
+        self._code = code
 
-        cache.clear_time_caches()
-        debug.reset_time()
+    def _parse_function_of_line(self, line):
+        """
+        Huge files are only parsed as an outline. If a line is in the body of
+        a function that was left away, the file is parsed again with that
+        function. Nothing is parsed again for lines in the function that was
+        restored last.
+        """
+        if self._kept_range is not None \
+                and self._kept_range[0] <= line <= self._kept_range[1]:
+            # The function was already restored.
+            return
+
+        # The ranges are sorted and don't overlap.
+        index = bisect.bisect_right(self._removed_ranges, (line, float('inf'))) - 1
+        if index >= 0 and line <= self._removed_ranges[index][1]:
+            debug.dbg('Parse the function around line %s of an outline', line)
+            kept_range = self._removed_ranges[index]
+            self._parse(keep_line=line)
+            self._kept_range = kept_range
+            self.__dict__.pop('_memoize_method_dct', None)
 
     # Cache the module, this is mostly useful for testing, since this shouldn't
     # be called multiple times.
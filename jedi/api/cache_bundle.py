@@ -0,0 +1,313 @@
+"""
+Cache bundles contain the caches that Jedi creates for a project and its
+environment: Parsed modules (including typeshed stubs), snapshots of compiled
+modules and the index of called names. A bundle is usually created in CI and
+imported on other machines, where Jedi would otherwise need to parse all the
+dependencies again::
+
+    python -m jedi cache bundle jedi-cache.zip
+    python -m jedi cache import jedi-cache.zip
+
+Bundles are relocatable. Files are stored relative to the project, the sys
+path entries of the environment or typeshed, together with a hash of their
+content. When importing, the caches of files that differ are skipped. A bundle
+can only be imported for an environment with the same Python executable (see
+``Environment._sha256``).
+
+Bundles contain pickles, only import bundles from sources you trust.
+"""
+import os
+import json
+import zipfile
+
+from jedi._compatibility import force_unicode
+from jedi import settings
+from jedi import debug
+from jedi.file_io import FileIO
+from jedi.api.environment import _calculate_sha256_for_file
+from jedi.api.exceptions import InvalidCacheBundle
+from jedi.api.project import get_default_project
+from jedi.inference import InferenceState, parse_store, call_sites
+from jedi.inference.compiled import snapshot
+from jedi.inference.gradual.typeshed import TYPESHED_PATH, \
+    _get_typeshed_directories
+
+_BUNDLE_VERSION = 1
+_MANIFEST_NAME = 'manifest.json'
+# Pickles of stubs are stored in parso's default cache directory.
+_JEDI_CACHE = 'jedi'
+_PARSO_CACHE = 'parso'
+
+
+def _get_roots(inference_state):
+    """
+    Returns a list of ``(name, path)``. The names are the same on all
+    machines.
+    """
+    project = inference_state.project
+    roots = [('project', project._path), ('typeshed', TYPESHED_PATH)]
+    sys_path = project._get_base_sys_path(
+        inference_state, environment=inference_state.environment)
+    for i, path in enumerate(sys_path):
+        roots.append(('sys_path-%s' % i, os.path.abspath(path)))
+    return roots
+
+
+def _get_relative_path(roots, path):
+    """
+    Returns the name of the root that contains the path and the path relative
+    to it, or None if no root contains the path.
+    """
+    best = None
+    for name, root_path in roots:
+        if path.startswith(os.path.join(root_path, '')) \
+                and (best is None or len(root_path) > len(best[1])):
+            best = name, root_path
+    if best is None:
+        return None
+    relative_path = os.path.relpath(path, best[1])
+    return best[0], relative_path.replace(os.path.sep, '/')
+
+
+def _iter_python_files(directories):
+    seen = set()
+    for directory in directories:
+        if not os.path.isdir(directory):
+            # e.g. zip files in the sys path
+            continue
+        for root, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            for filename in filenames:
+                if filename.endswith(('.py', '.pyi')):
+                    path = os.path.join(root, filename)
+                    if path not in seen:
+                        seen.add(path)
+                        yield path
+
+
+def _get_parser_args(inference_state, path):
+    """
+    Returns the grammar and the cache path that Jedi uses for a file.
+    """
+    if path.endswith('.pyi'):
+        return inference_state.latest_grammar, _PARSO_CACHE
+    return inference_state.grammar, _JEDI_CACHE
+
+
+def _get_cache_path(cache):
+    return settings.cache_directory if cache == _JEDI_CACHE else None
+
+
+def _parse(inference_state, path):
+    from parso.cache import parser_cache
+
+    grammar, cache = _get_parser_args(inference_state, path)
+    if parse_store.get_valid_pickle(grammar, path, _get_cache_path(cache)):
+        return
+    try:
+        inference_state.parse(
+            file_io=FileIO(path),
+            cache=True,
+            cache_path=_get_cache_path(cache),
+            use_latest_grammar=grammar is inference_state.latest_grammar,
+        )
+    except (IOError, OSError) as e:
+        debug.warning('Could not parse %s: %s', path, e)
+    # Don't keep the trees of all the files in memory.
+    parser_cache.get(grammar._hashed, {}).pop(path, None)
+
+
+class _BundleWriter(object):
+    def __init__(self, zip_file, roots):
+        self._zip_file = zip_file
+        self._roots = roots
+        self._file_indexes = {}
+        self.manifest = dict(
+            version=_BUNDLE_VERSION,
+            store_tag=parse_store.get_store_tag(),
+            files=[],
+            parse_cache=[],
+            snapshots=[],
+            call_sites=[],
+        )
+
+    def add_file(self, path):
+        """
+        Returns the index of a file in the manifest, None if it's not
+        relocatable.
+        """
+        try:
+            return self._file_indexes[path]
+        except KeyError:
+            pass
+
+        relative = _get_relative_path(self._roots, path)
+        if relative is not None:
+            try:
+                sha256 = _calculate_sha256_for_file(path)
+            except (IOError, OSError):
+                relative = None
+        if relative is None:
+            index = None
+        else:
+            index = len(self.manifest['files'])
+            self.manifest['files'].append([relative[0], relative[1], sha256])
+        self._file_indexes[path] = index
+        return index
+
+    def add_artifact(self, kind, file_path):
+        name = '%s/%s' % (kind, len(self._zip_file.namelist()))
+        self._zip_file.write(file_path, name)
+        return name
+
+
+def create_bundle(bundle_path, project=None, environment=None, populate=True):
+    """
+    Writes a bundle of the caches for a project and its environment to a zip
+    file. Returns the number of files with caches in the bundle.
+
+    :param populate: If True, the Python files of the project, the sys path and
+        typeshed are parsed first if they are not cached yet. Otherwise only
+        the existing caches are bundled.
+    """
+    if project is None:
+        project = get_default_project()
+    inference_state = InferenceState(project, environment=environment)
+    environment = inference_state.environment
+    roots = _get_roots(inference_state)
+    directories = [path for name, path in roots if name != 'typeshed']
+    directories += list(_get_typeshed_directories(environment.version_info))
+
+    with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        writer = _BundleWriter(zip_file, roots)
+        manifest = writer.manifest
+        manifest['environment'] = environment._sha256
+
+        folders = set()
+        for path in _iter_python_files(directories):
+            folders.add(os.path.dirname(path))
+            if populate:
+                _parse(inference_state, path)
+            grammar, cache = _get_parser_args(inference_state, path)
+            pickle_path = parse_store.get_valid_pickle(
+                grammar, path, _get_cache_path(cache))
+            if pickle_path is None:
+                continue
+            index = writer.add_file(path)
+            if index is not None:
+                manifest['parse_cache'].append([
+                    index, grammar._hashed, cache,
+                    writer.add_artifact('parse_cache', pickle_path),
+                ])
+
+        for dotted_name, path, snapshot_path in snapshot.get_snapshots(environment):
+            index = None
+            if path is not None:
+                index = writer.add_file(path)
+                if index is None:
+                    continue
+            manifest['snapshots'].append([
+                dotted_name, index,
+                writer.add_artifact('snapshots', snapshot_path),
+            ])
+
+        for folder in sorted(folders):
+            folder_index = call_sites.get_folder_index(folder)
+            for file_name, names in sorted(folder_index.items()):
+                index = writer.add_file(os.path.join(folder, file_name))
+                if index is not None:
+                    manifest['call_sites'].append([index, sorted(names)])
+
+        zip_file.writestr(_MANIFEST_NAME, json.dumps(manifest))
+    debug.dbg('Wrote a cache bundle of %s files', len(manifest['files']))
+    return len(manifest['files'])
+
+
+def _read_manifest(zip_file, environment):
+    try:
+        manifest = json.loads(force_unicode(zip_file.read(_MANIFEST_NAME)))
+    except (KeyError, ValueError):
+        raise InvalidCacheBundle('The cache bundle has no valid manifest.')
+    if manifest.get('version') != _BUNDLE_VERSION:
+        raise InvalidCacheBundle(
+            'The cache bundle version %s is not supported.' % manifest.get('version'))
+    if manifest['environment'] != environment._sha256:
+        raise InvalidCacheBundle(
+            'The cache bundle was created for another Python executable.')
+    return manifest
+
+
+def import_bundle(bundle_path, project=None, environment=None):
+    """
+    Imports the caches of a bundle that was created with :func:`create_bundle`
+    (possibly on another machine). Caches of files that are different on this
+    machine are skipped. Returns the number of files with imported caches.
+
+    :raises: :exc:`jedi.api.exceptions.InvalidCacheBundle` if the bundle is
+        broken or was created for another environment.
+    """
+    if project is None:
+        project = get_default_project()
+    inference_state = InferenceState(project, environment=environment)
+    environment = inference_state.environment
+    roots = dict(_get_roots(inference_state))
+
+    try:
+        zip_file = zipfile.ZipFile(bundle_path)
+    except zipfile.BadZipfile:
+        raise InvalidCacheBundle('The cache bundle is not a zip file.')
+    with zip_file:
+        manifest = _read_manifest(zip_file, environment)
+
+        local_paths = []
+        for root_name, relative_path, sha256 in manifest['files']:
+            path = None
+            if root_name in roots:
+                path = os.path.join(roots[root_name], *relative_path.split('/'))
+                try:
+                    if _calculate_sha256_for_file(path) != sha256:
+                        path = None
+                except (IOError, OSError):
+                    path = None
+            local_paths.append(path)
+
+        imported = set()
+        if manifest['store_tag'] == parse_store.get_store_tag():
+            grammars = dict(
+                (grammar._hashed, grammar)
+                for grammar in (inference_state.grammar, inference_state.latest_grammar)
+            )
+            for index, hashed_grammar, cache, artifact in manifest['parse_cache']:
+                path = local_paths[index]
+                grammar = grammars.get(hashed_grammar)
+                if path is None or grammar is None:
+                    continue
+                cache_path = _get_cache_path(cache)
+                if parse_store.get_valid_pickle(grammar, path, cache_path) \
+                        or parse_store.import_pickle(
+                            grammar, path, zip_file.read(artifact), cache_path):
+                    imported.add(index)
+
+        for dotted_name, index, artifact in manifest['snapshots']:
+            path = None
+            if index is not None:
+                path = local_paths[index]
+                if path is None:
+                    continue
+            code = force_unicode(zip_file.read(artifact))
+            if snapshot.save_snapshot(environment, dotted_name, path, code) \
+                    and index is not None:
+                imported.add(index)
+
+        names_by_folder = {}
+        for index, names in manifest['call_sites']:
+            path = local_paths[index]
+            if path is not None:
+                folder, file_name = os.path.split(path)
+                names_by_folder.setdefault(folder, {})[file_name] = names
+                imported.add(index)
+        for folder, names_by_file in names_by_folder.items():
+            call_sites.update_folder_index(folder, names_by_file)
+
+    debug.dbg('Imported the caches of %s files', len(imported))
+    return len(imported)
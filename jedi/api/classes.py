@@ -43,6 +43,8 @@ def _values_to_definitions(values):
 
 
 class BaseDefinition(object):
+    __slots__ = ('_inference_state', '_name', 'is_keyword', '_memoize_method_dct')
+
     _mapping = {
         'posixpath': 'os.path',
         'riscospath': 'os.path',
@@ -515,6 +517,9 @@ class Completion(BaseDefinition):
     `Completion` objects are returned from :meth:`api.Script.complete`. They
     provide additional information about a completion.
     """
+    __slots__ = ('_like_name_length', '_stack', '_is_fuzzy', '_cached_name',
+                 '_same_name_completions')
+
     def __init__(self, inference_state, name, stack, like_name_length,
                  is_fuzzy, cached_name=None):
         super(Completion, self).__init__(inference_state, name)
@@ -653,6 +658,8 @@ class Definition(BaseDefinition):
     *Definition* objects are returned from :meth:`api.Script.goto`
     or :meth:`api.Script.infer`.
     """
+    __slots__ = ()
+
     def __init__(self, inference_state, definition):
         super(Definition, self).__init__(inference_state, definition)
 
@@ -712,6 +719,8 @@ class BaseSignature(Definition):
     It knows what functions you are currently in. e.g. `isinstance(` would
     return the `isinstance` function. without `(` it would return nothing.
     """
+    __slots__ = ('_signature',)
+
     def __init__(self, inference_state, signature):
         super(BaseSignature, self).__init__(inference_state, signature.name)
         self._signature = signature
@@ -735,6 +744,8 @@ class Signature(BaseSignature):
     return the `isinstance` function with its params. Without `(` it would
     return nothing.
     """
+    __slots__ = ('_call_details',)
+
     def __init__(self, inference_state, signature, call_details):
         super(Signature, self).__init__(inference_state, signature)
         self._call_details = call_details
@@ -767,6 +778,8 @@ class Signature(BaseSignature):
 
 
 class ParamDefinition(Definition):
+    __slots__ = ()
+
     def infer_default(self):
         """
         :return list of Definition:
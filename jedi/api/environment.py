@@ -4,12 +4,16 @@ static analysis. The Python binary in that environment is going to be executed.
 """
 import os
 import sys
+import json
 import hashlib
 import filecmp
 from collections import namedtuple
 
 from jedi._compatibility import highest_pickle_protocol, which
 from jedi.cache import memoize_method, time_cache
+from jedi.common.utils import write_file_atomically, get_mtimes
+from jedi import settings
+from jedi import debug
 from jedi.inference.compiled.subprocess import CompiledSubprocess, \
     InferenceStateSameProcess, InferenceStateSubprocess
 
@@ -22,6 +26,9 @@ _SAFE_PATHS = ['/usr/bin', '/usr/local/bin']
 _CONDA_VAR = 'CONDA_PREFIX'
 _CURRENT_VERSION = '%s.%s' % (sys.version_info.major, sys.version_info.minor)
 
+_REGISTRY_FILE_NAME = 'environments.json'
+_REGISTRY_VERSION = 2
+
 
 class InvalidPythonEnvironment(Exception):
     """
@@ -41,7 +48,7 @@ class _BaseEnvironment(object):
         try:
             return self._hash
         except AttributeError:
-            self._hash = _calculate_sha256_for_file(self.executable)
+            self._hash = _environment_registry.get_sha256(self.executable)
             return self._hash
 
 
@@ -63,8 +70,14 @@ class Environment(_BaseEnvironment):
 
     def __init__(self, executable):
         self._start_executable = executable
-        # Initialize the environment
-        self._get_subprocess()
+        info = _environment_registry.get_info(executable)
+        if info is None:
+            # Initialize the environment
+            self._get_subprocess()
+        else:
+            # The environment was already inspected and has not changed since,
+            # the subprocess is only started once it's really needed.
+            self._set_info(*info)
 
     def _get_subprocess(self):
         if self._subprocess is not None and not self._subprocess.is_crashed:
@@ -74,38 +87,45 @@ class Environment(_BaseEnvironment):
             self._subprocess = CompiledSubprocess(self._start_executable)
             info = self._subprocess._send(None, _get_info)
         except Exception as exc:
+            # The executable might have been broken since it was inspected.
+            _environment_registry.remove_entry(self._start_executable)
             raise InvalidPythonEnvironment(
                 "Could not get version information for %r: %r" % (
                     self._start_executable,
                     exc))
 
+        executable, path, version_info = info
+        # py2 sends bytes via pickle apparently?!
+        if version_info[0] == 2:
+            executable = executable.decode()
+            path = path.decode()
+        self._set_info(executable, path, version_info)
+        _environment_registry.set_info(
+            self._start_executable, (executable, path, tuple(version_info)))
+
+        # Adjust pickle protocol according to host and client version.
+        self._subprocess._pickle_protocol = highest_pickle_protocol([
+            sys.version_info, self.version_info])
+
+        return self._subprocess
+
+    def _set_info(self, executable, path, version_info):
         # Since it could change and might not be the same(?) as the one given,
         # set it here.
-        self.executable = info[0]
+        self.executable = executable
         """
         The Python executable, matches ``sys.executable``.
         """
-        self.path = info[1]
+        self.path = path
         """
         The path to an environment, matches ``sys.prefix``.
         """
-        self.version_info = _VersionInfo(*info[2])
+        self.version_info = _VersionInfo(*version_info)
         """
         Like ``sys.version_info``. A tuple to show the current Environment's
         Python version.
         """
 
-        # py2 sends bytes via pickle apparently?!
-        if self.version_info.major == 2:
-            self.executable = self.executable.decode()
-            self.path = self.path.decode()
-
-        # Adjust pickle protocol according to host and client version.
-        self._subprocess._pickle_protocol = highest_pickle_protocol([
-            sys.version_info, self.version_info])
-
-        return self._subprocess
-
     def __repr__(self):
         version = '.'.join(str(i) for i in self.version_info)
         return '<%s: %s in %s>' % (self.__class__.__name__, version, self.path)
@@ -126,7 +146,11 @@ class Environment(_BaseEnvironment):
         # on how the Python version was compiled (ENV variables).
         # If you omit -S when starting Python (normal case), additionally
         # site.py gets executed.
-        return self._get_subprocess().get_sys_path()
+        sys_path = _environment_registry.get_sys_path(self._start_executable)
+        if sys_path is None:
+            sys_path = self._get_subprocess().get_sys_path()
+            _environment_registry.set_sys_path(self._start_executable, sys_path)
+        return sys_path
 
 
 class _SameEnvironmentMixin(object):
@@ -169,6 +193,165 @@ def _get_virtual_env_from_var(env_var='VIRTUAL_ENV'):
             pass
 
 
+def _get_file_stamp(path):
+    """
+    Returns something that changes if the given file is modified or replaced.
+    Symlinks are followed, but the link itself is checked as well, because
+    venvs are typically just symlinks to the actual binary.
+    """
+    try:
+        stat = os.stat(path)
+        link_stat = os.lstat(path)
+    except OSError:
+        return None
+    return [stat.st_ino, stat.st_mtime, stat.st_ctime, stat.st_size,
+            link_stat.st_mtime]
+
+
+class _EnvironmentRegistry(object):
+    """
+    An on-disk registry of the environments that were already inspected. It
+    contains the information we usually get by starting the Python
+    interpreter (version, prefix and sys path) and the hash of the executable.
+
+    Entries are keyed by the path of the executable and are only valid as long
+    as the executable and the interpreter it resolved to have not been changed
+    (see ``_get_file_stamp``). The sys path is additionally invalidated if one
+    of the sys path folders changes, which happens when packages are installed
+    or removed.
+
+    The registry only saves work, it's never used to decide whether an
+    executable is safe to run (see ``_is_safe``).
+
+    The file might be written concurrently by different processes. In the
+    worst case an entry is lost, which just means that the interpreter has to
+    be started again.
+    """
+    def __init__(self):
+        self._entries = {}
+        self._loaded_stamp = None
+
+    def _get_path(self):
+        return os.path.join(settings.cache_directory, _REGISTRY_FILE_NAME)
+
+    def _load(self):
+        path = self._get_path()
+        stamp = path, _get_file_stamp(path)
+        if stamp != self._loaded_stamp:
+            self._loaded_stamp = stamp
+            self._entries = {}
+            if stamp[1] is not None:
+                try:
+                    with open(path) as f:
+                        version, entries = json.load(f)
+                except (IOError, OSError, ValueError) as e:
+                    debug.warning('Could not load environment registry: %s', e)
+                else:
+                    if version == _REGISTRY_VERSION:
+                        self._entries = entries
+        return self._entries
+
+    def _get_entry(self, executable):
+        if not settings.use_filesystem_cache:
+            return None
+
+        entry = self._load().get(os.path.abspath(executable))
+        if entry is None or entry['stamp'] != _get_file_stamp(executable):
+            return None
+        return entry
+
+    def _update_entry(self, executable, **kwargs):
+        if not settings.use_filesystem_cache:
+            return
+
+        stamp = _get_file_stamp(executable)
+        if stamp is None:
+            return
+
+        key = os.path.abspath(executable)
+        # Reload first, other processes might have added entries meanwhile.
+        entries = dict(self._load())
+        entry = entries.get(key)
+        if entry is None or entry['stamp'] != stamp:
+            entry = dict(stamp=stamp)
+        else:
+            entry = dict(entry)
+        entry.update(kwargs)
+        entries[key] = entry
+        self._write(entries)
+
+    def _write(self, entries):
+        path = self._get_path()
+        try:
+            write_file_atomically(
+                path,
+                json.dumps((_REGISTRY_VERSION, entries)).encode('utf-8')
+            )
+        except (IOError, OSError) as e:
+            debug.warning('Could not write environment registry: %s', e)
+            return
+        self._entries = entries
+        self._loaded_stamp = path, _get_file_stamp(path)
+
+    def get_info(self, executable):
+        """
+        Returns the same information as ``_get_info`` or None if the
+        executable is not known (anymore).
+        """
+        entry = self._get_entry(executable)
+        if entry is None or 'info' not in entry \
+                or not os.access(executable, os.X_OK):
+            return None
+        real_executable, path, version_info = entry['info']
+        if entry['info_stamp'] != _get_file_stamp(real_executable) \
+                or not os.path.isdir(path):
+            return None
+        return real_executable, path, tuple(version_info)
+
+    def set_info(self, executable, info):
+        self._update_entry(
+            executable,
+            info=list(info),
+            info_stamp=_get_file_stamp(info[0]),
+        )
+
+    def remove_entry(self, executable):
+        if not settings.use_filesystem_cache:
+            return
+
+        entries = dict(self._load())
+        if entries.pop(os.path.abspath(executable), None) is not None:
+            self._write(entries)
+
+    def get_sys_path(self, executable):
+        entry = self._get_entry(executable)
+        if entry is None or 'sys_path' not in entry:
+            return None
+        sys_path = entry['sys_path']
+        if entry['sys_path_stamps'] != get_mtimes(sys_path):
+            return None
+        return sys_path
+
+    def set_sys_path(self, executable, sys_path):
+        self._update_entry(
+            executable,
+            sys_path=list(sys_path),
+            sys_path_stamps=get_mtimes(sys_path),
+        )
+
+    def get_sha256(self, path):
+        entry = self._get_entry(path)
+        if entry is not None and 'sha256' in entry:
+            return entry['sha256']
+
+        sha256 = _calculate_sha256_for_file(path)
+        self._update_entry(path, sha256=sha256)
+        return sha256
+
+
+_environment_registry = _EnvironmentRegistry()
+
+
 def _calculate_sha256_for_file(path):
     sha256 = hashlib.sha256()
     with open(path, 'rb') as f:
@@ -430,6 +613,7 @@ def _is_safe(executable_path):
     # Just check the list of known Python versions. If it's not in there,
     # it's likely an attacker or some Python that was not properly
     # installed in the system.
+    sha256 = None
     for environment in find_system_environments():
         if environment.executable == real_path:
             return True
@@ -442,7 +626,11 @@ def _is_safe(executable_path):
         # virtualenv's Python is not (which is probably never going to get
         # upgraded), it will not work with Jedi. IMO that's fine, because
         # people should just be using venv. ~ dave
-        if environment._sha256 == _calculate_sha256_for_file(real_path):
+        # The hashes are always calculated, the environment registry could be
+        # outdated or tampered with.
+        if sha256 is None:
+            sha256 = _calculate_sha256_for_file(real_path)
+        if _calculate_sha256_for_file(environment.executable) == sha256:
             return True
     return False
 
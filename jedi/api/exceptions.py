@@ -8,3 +8,9 @@ class InternalError(_JediError):
 
 class WrongVersion(_JediError):
     pass
+
+
+class InvalidCacheBundle(_JediError):
+    """
+    The cache bundle is broken or was created for another environment.
+    """
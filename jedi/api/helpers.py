@@ -416,6 +416,7 @@ def validate_line_column(func):
     @wraps(func)
     def wrapper(self, line=None, column=None, *args, **kwargs):
         line = max(len(self._code_lines), 1) if line is None else line
+        self._parse_function_of_line(line)
         if not (0 < line <= len(self._code_lines)):
             raise ValueError('`line` parameter is not in a valid range.')
 
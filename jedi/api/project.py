@@ -6,15 +6,24 @@ from jedi.api.environment import SameEnvironment, \
     get_cached_default_environment
 from jedi.api.exceptions import WrongVersion
 from jedi._compatibility import force_unicode
-from jedi.inference.sys_path import discover_buildout_paths
+from jedi.inference.sys_path import discover_buildout_paths, \
+    get_buildout_script_dependencies
 from jedi.inference.cache import inference_state_as_method_param_cache
-from jedi.common.utils import traverse_parents
+from jedi.common.utils import traverse_parents, get_mtimes
 
 _CONFIG_FOLDER = '.jedi'
 _CONTAINS_POTENTIAL_PROJECT = 'setup.py', '.git', '.hg', 'requirements.txt', 'MANIFEST.in'
 
 _SERIALIZER_VERSION = 1
 
+# Both caches are process-wide and only valid as long as the modification
+# times of the directories involved do not change. This is way cheaper than
+# probing all the files in all the parent directories again. They are cleared
+# once they get too big, because long running processes see a lot of paths.
+_default_project_cache = {}
+_sys_path_cache = {}
+_MAX_CACHED_PATHS = 256
+
 
 def _remove_duplicates_from_path(path):
     used = set()
@@ -100,10 +109,38 @@ class Project(object):
         Keep this method private for all users of jedi. However internally this
         one is used like a public method.
         """
+        sys_path = self._get_base_sys_path(inference_state, environment)
+        script_path = inference_state.script_path
+        if not self._smart_sys_path or script_path is None:
+            return self._calculate_sys_path(
+                inference_state, sys_path, add_parent_paths, add_init_paths)
+
+        key = (self._path, self._django, tuple(sys_path),
+               os.path.dirname(script_path), add_parent_paths, add_init_paths)
+        dependencies = list(traverse_parents(script_path))
+        dependencies += get_buildout_script_dependencies(script_path)
+        mtimes = get_mtimes(dependencies)
+        try:
+            cached_mtimes, result = _sys_path_cache[key]
+        except KeyError:
+            pass
+        else:
+            if cached_mtimes == mtimes:
+                return list(result)
+
+        result = self._calculate_sys_path(
+            inference_state, sys_path, add_parent_paths, add_init_paths)
+        if len(_sys_path_cache) >= _MAX_CACHED_PATHS:
+            _sys_path_cache.clear()
+        _sys_path_cache[key] = mtimes, result
+        return list(result)
+
+    def _calculate_sys_path(self, inference_state, sys_path,
+                            add_parent_paths, add_init_paths):
         suffixed = []
         prefixed = []
 
-        sys_path = list(self._get_base_sys_path(inference_state, environment))
+        sys_path = list(sys_path)
         if self._smart_sys_path:
             prefixed.append(self._path)
 
@@ -170,11 +207,44 @@ def _is_django_path(directory):
     return False
 
 
+def _get_project_dependencies(check):
+    """
+    Returns the paths that influence which project is found for a directory.
+    Files that are edited in place don't change the modification time of
+    their directory, so they are checked as well.
+    """
+    for dir in traverse_parents(check, include_current=True):
+        yield dir
+        yield Project._get_json_path(dir)
+        yield os.path.join(dir, 'manage.py')
+
+
 def get_default_project(path=None):
+    """
+    Finds a project for the given directory. The result is cached and only
+    recalculated if one of the parent directories or project files changes.
+    """
     if path is None:
         path = os.getcwd()
 
     check = os.path.realpath(path)
+    mtimes = get_mtimes(_get_project_dependencies(check))
+    try:
+        cached_mtimes, project = _default_project_cache[check]
+    except KeyError:
+        pass
+    else:
+        if cached_mtimes == mtimes:
+            return project
+
+    project = _find_default_project(path, check)
+    if len(_default_project_cache) >= _MAX_CACHED_PATHS:
+        _default_project_cache.clear()
+    _default_project_cache[check] = mtimes, project
+    return project
+
+
+def _find_default_project(path, check):
     probable_path = None
     first_no_init_file = None
     for dir in traverse_parents(check, include_current=True):
@@ -13,11 +13,15 @@ these variables are being cleaned after every API usage.
 """
 import time
 from functools import wraps
+from collections import OrderedDict
 
 from jedi import settings
 from parso.cache import parser_cache
 
 _time_caches = {}
+# (hashed grammar, path) of library modules in the parser cache, the least
+# recently used first.
+_library_module_trees = OrderedDict()
 
 
 def underscore_memoization(func):
@@ -65,6 +69,7 @@ def clear_time_caches(delete_all=False):
         for cache in _time_caches.values():
             cache.clear()
         parser_cache.clear()
+        _library_module_trees.clear()
     else:
         # normally just kill the expired entries, not all
         for tc in _time_caches.values():
@@ -75,6 +80,25 @@ def clear_time_caches(delete_all=False):
                     del tc[key]
 
 
+def use_library_module_tree(hashed_grammar, path):
+    """
+    Marks the syntax tree of a library module in the parser cache as used. If
+    there are more than :data:`jedi.settings.max_library_module_trees` library
+    trees in the parser cache, the least recently used ones are removed from
+    it. They are loaded from the filesystem cache again once they are needed.
+    """
+    max_trees = settings.max_library_module_trees
+    if max_trees is None:
+        return
+
+    key = hashed_grammar, path
+    _library_module_trees.pop(key, None)
+    _library_module_trees[key] = None
+    while len(_library_module_trees) > max_trees:
+        (old_grammar, old_path), _ = _library_module_trees.popitem(last=False)
+        parser_cache.get(old_grammar, {}).pop(old_path, None)
+
+
 def signature_time_cache(time_add_setting):
     """
     This decorator works as follows: Call it with a setting and after that
@@ -134,7 +158,14 @@ def memoize_method(method):
     """A normal memoize function."""
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        cache_dict = self.__dict__.setdefault('_memoize_method_dct', {})
+        try:
+            cache_dict = self.__dict__.setdefault('_memoize_method_dct', {})
+        except AttributeError:
+            # Classes with __slots__ need a _memoize_method_dct slot.
+            try:
+                cache_dict = self._memoize_method_dct
+            except AttributeError:
+                cache_dict = self._memoize_method_dct = {}
         dct = cache_dict.setdefault(method, {})
         key = (args, frozenset(kwargs.items()))
         try:
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from contextlib import contextmanager
 
 
@@ -13,6 +14,21 @@ def traverse_parents(path, include_current=False):
         path = os.path.dirname(path)
 
 
+def get_mtimes(paths):
+    """
+    Returns the modification times of the given paths (None if a path does not
+    exist). Comparing these is a cheap way to check if a directory or file has
+    changed.
+    """
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
+
+
 @contextmanager
 def monkeypatch(obj, attribute_name, new_value):
     """
@@ -24,3 +40,35 @@ def monkeypatch(obj, attribute_name, new_value):
         yield
     finally:
         setattr(obj, attribute_name, old_value)
+
+
+def write_file_atomically(path, content):
+    """
+    Writes bytes to a file, so that other processes either see the old or the
+    new content, but never a half written file.
+    """
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory)
+    except OSError:
+        # Probably already exists (possibly created by another process).
+        if not os.path.isdir(directory):
+            raise
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        try:
+            os.replace(tmp_path, path)
+        except AttributeError:
+            # Python 2 doesn't have os.replace, rename is atomic on POSIX.
+            if os.name == 'nt' and os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -1,3 +1,14 @@
+from itertools import chain
+
+# Value sets with up to this many values are stored as a tuple, bigger ones as
+# a frozenset. Most value sets contain only zero or one value, a frozenset
+# would be a waste of memory for them.
+_MAX_TUPLE_SIZE = 8
+
+# Value set class -> its empty instance
+_empty_value_sets = {}
+
+
 class BaseValue(object):
     def __init__(self, inference_state, parent_context=None):
         self.inference_state = inference_state
@@ -11,16 +22,68 @@ class BaseValue(object):
             value = value.parent_context
 
 
+def _unique_values(iterable):
+    """
+    Returns the unique values of an iterable as a tuple or frozenset.
+    """
+    iterator = iter(iterable)
+    values = []
+    for value in iterator:
+        if value not in values:
+            values.append(value)
+            if len(values) > _MAX_TUPLE_SIZE:
+                return frozenset(chain(values, iterator))
+    return tuple(values)
+
+
+def _add_values(values, new_values):
+    """
+    Adds values to a list of unique values. Returns a set instead once there
+    are too many values for a list.
+    """
+    if not isinstance(values, set) \
+            and len(values) + len(new_values) > _MAX_TUPLE_SIZE:
+        values = set(values)
+    if isinstance(values, set):
+        values.update(new_values)
+    else:
+        for value in new_values:
+            if value not in values:
+                values.append(value)
+    return values
+
+
+def _freeze_values(values):
+    if len(values) > _MAX_TUPLE_SIZE:
+        return frozenset(values)
+    return tuple(values)
+
+
 class BaseValueSet(object):
+    __slots__ = ('_values', '_hash')
+
     def __init__(self, iterable):
-        self._set = frozenset(iterable)
-        for value in iterable:
+        self._values = _unique_values(iterable)
+        self._hash = None
+        for value in self._values:
             assert not isinstance(value, BaseValueSet)
 
     @classmethod
-    def _from_frozen_set(cls, frozenset_):
+    def _from_values(cls, values):
+        """
+        Creates a value set from a tuple or frozenset of unique values. Empty
+        value sets are shared.
+        """
+        if not values:
+            try:
+                return _empty_value_sets[cls]
+            except KeyError:
+                pass
         self = cls.__new__(cls)
-        self._set = frozenset_
+        self._values = values
+        self._hash = None
+        if not values:
+            _empty_value_sets[cls] = self
         return self
 
     @classmethod
@@ -28,49 +91,79 @@ class BaseValueSet(object):
         """
         Used to work with an iterable of set.
         """
-        aggregated = set()
+        first = None
+        values = None
         for set_ in sets:
-            if isinstance(set_, BaseValueSet):
-                aggregated |= set_._set
+            if not isinstance(set_, BaseValueSet):
+                set_ = cls._from_values(_unique_values(set_))
+            if not set_._values:
+                continue
+            if first is None:
+                first = set_
+            elif values is None:
+                values = _add_values(list(first._values), set_._values)
             else:
-                aggregated |= frozenset(set_)
-        return cls._from_frozen_set(frozenset(aggregated))
+                values = _add_values(values, set_._values)
+
+        if values is not None:
+            return cls._from_values(_freeze_values(values))
+        if first is not None and type(first) is cls:
+            # Value sets are immutable, so a single non-empty set doesn't
+            # need to be copied.
+            return first
+        return cls._from_values(() if first is None else first._values)
 
     def __or__(self, other):
-        return self._from_frozen_set(self._set | other._set)
+        return self.from_sets((self, other))
 
     def __and__(self, other):
-        return self._from_frozen_set(self._set & other._set)
+        other_values = other._values
+        return self._from_values(_freeze_values(
+            [value for value in self._values if value in other_values]
+        ))
 
     def __iter__(self):
-        for element in self._set:
-            yield element
+        return iter(self._values)
+
+    def __contains__(self, value):
+        return value in self._values
 
     def __bool__(self):
-        return bool(self._set)
+        return bool(self._values)
 
     def __len__(self):
-        return len(self._set)
+        return len(self._values)
 
     def __repr__(self):
-        return 'S{%s}' % (', '.join(str(s) for s in self._set))
+        return 'S{%s}' % (', '.join(str(s) for s in self._values))
 
     def filter(self, filter_func):
-        return self.__class__(filter(filter_func, self._set))
+        return self._from_values(_freeze_values(
+            [value for value in self._values if filter_func(value)]
+        ))
 
     def __getattr__(self, name):
         def mapper(*args, **kwargs):
             return self.from_sets(
                 getattr(value, name)(*args, **kwargs)
-                for value in self._set
+                for value in self._values
             )
         return mapper
 
     def __eq__(self, other):
-        return self._set == other._set
+        values = self._values
+        other_values = other._values
+        if len(values) != len(other_values):
+            return False
+        if isinstance(values, frozenset):
+            return values == other_values
+        # Both contain unique values, so this is enough.
+        return all(value in other_values for value in values)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self._set)
+        if self._hash is None:
+            self._hash = hash(frozenset(self._values))
+        return self._hash
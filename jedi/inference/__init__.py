@@ -64,7 +64,7 @@ that are not used are just being ignored.
 """
 import parso
 from parso import python_bytes_to_unicode
-from jedi.file_io import FileIO
+from jedi.file_io import FileIO, KnownContentFileIO
 
 from jedi import debug
 from jedi import settings
@@ -79,6 +79,8 @@ from jedi.inference.value import ClassValue, FunctionValue
 from jedi.inference.syntax_tree import infer_expr_stmt, \
     check_tuple_assignments, tree_name_to_values
 from jedi.inference.imports import follow_error_node_imports_if_possible
+from jedi.inference.outline import get_outline
+from jedi.inference import parse_store
 from jedi.plugins import plugin_manager
 
 
@@ -179,7 +181,8 @@ class InferenceState(object):
         return helpers.infer_call_of_leaf(context, name)
 
     def parse_and_get_code(self, code=None, path=None, encoding='utf-8',
-                           use_latest_grammar=False, file_io=None, **kwargs):
+                           use_latest_grammar=False, file_io=None,
+                           outline=True, **kwargs):
         if code is None:
             if file_io is None:
                 file_io = FileIO(path)
@@ -187,10 +190,14 @@ class InferenceState(object):
         # We cannot just use parso, because it doesn't use errors='replace'.
         code = python_bytes_to_unicode(code, encoding=encoding, errors='replace')
 
-        if len(code) > settings._cropped_file_size:
-            code = code[:settings._cropped_file_size]
+        if outline and len(code) > settings._outline_file_size:
+            code, _ = get_outline(code)
 
         grammar = self.latest_grammar if use_latest_grammar else self.grammar
+        if kwargs.pop('cache', False):
+            if file_io is None:
+                file_io = KnownContentFileIO(path, code)
+            return parse_store.parse_module(grammar, code, file_io, **kwargs), code
         return grammar.parse(code=code, path=path, file_io=file_io, **kwargs), code
 
     def parse(self, *args, **kwargs):
@@ -325,6 +325,8 @@ class TreeValue(Value):
 
 
 class ContextualizedNode(object):
+    __slots__ = ('context', 'node')
+
     def __init__(self, context, node):
         self.context = context
         self.node = node
@@ -367,35 +369,37 @@ def _getitem(value, index_values, contextualized_node):
 
 
 class ValueSet(BaseValueSet):
+    __slots__ = ()
+
     def py__class__(self):
-        return ValueSet(c.py__class__() for c in self._set)
+        return ValueSet(c.py__class__() for c in self._values)
 
     def iterate(self, contextualized_node=None, is_async=False):
         from jedi.inference.lazy_value import get_merged_lazy_value
-        type_iters = [c.iterate(contextualized_node, is_async=is_async) for c in self._set]
+        type_iters = [c.iterate(contextualized_node, is_async=is_async) for c in self._values]
         for lazy_values in zip_longest(*type_iters):
             yield get_merged_lazy_value(
                 [l for l in lazy_values if l is not None]
             )
 
     def execute(self, arguments):
-        return ValueSet.from_sets(c.inference_state.execute(c, arguments) for c in self._set)
+        return ValueSet.from_sets(c.inference_state.execute(c, arguments) for c in self._values)
 
     def execute_with_values(self, *args, **kwargs):
-        return ValueSet.from_sets(c.execute_with_values(*args, **kwargs) for c in self._set)
+        return ValueSet.from_sets(c.execute_with_values(*args, **kwargs) for c in self._values)
 
     def goto(self, *args, **kwargs):
-        return reduce(add, [c.goto(*args, **kwargs) for c in self._set], [])
+        return reduce(add, [c.goto(*args, **kwargs) for c in self._values], [])
 
     def py__getattribute__(self, *args, **kwargs):
-        return ValueSet.from_sets(c.py__getattribute__(*args, **kwargs) for c in self._set)
+        return ValueSet.from_sets(c.py__getattribute__(*args, **kwargs) for c in self._values)
 
     def get_item(self, *args, **kwargs):
-        return ValueSet.from_sets(_getitem(c, *args, **kwargs) for c in self._set)
+        return ValueSet.from_sets(_getitem(c, *args, **kwargs) for c in self._values)
 
     def try_merge(self, function_name):
         value_set = self.__class__([])
-        for c in self._set:
+        for c in self._values:
             try:
                 method = getattr(c, function_name)
             except AttributeError:
@@ -405,13 +409,13 @@ class ValueSet(BaseValueSet):
         return value_set
 
     def gather_annotation_classes(self):
-        return ValueSet.from_sets([c.gather_annotation_classes() for c in self._set])
+        return ValueSet.from_sets([c.gather_annotation_classes() for c in self._values])
 
     def get_signatures(self):
-        return [sig for c in self._set for sig in c.get_signatures()]
+        return [sig for c in self._values for sig in c.get_signatures()]
 
 
-NO_VALUES = ValueSet([])
+NO_VALUES = ValueSet.from_sets([])
 
 
 def iterator_to_value_set(func):
@@ -4,12 +4,22 @@
 - ``CachedMetaClass`` uses ``_memoize_default`` to do the same with classes.
 """
 
+from operator import attrgetter
+
 from jedi import debug
 
 _NO_DEFAULT = object()
 _RECURSION_SENTINEL = object()
 
 
+def _takes_only_first_arg(function):
+    code = getattr(function, '__code__', None)
+    # 0x04 and 0x08 are the flags for *args and **kwargs.
+    return code is not None and code.co_argcount == 1 \
+        and not code.co_flags & (0x04 | 0x08) \
+        and not getattr(code, 'co_kwonlyargcount', 0)
+
+
 def _memoize_default(default=_NO_DEFAULT, inference_state_is_first_arg=False,
                      second_arg_is_inference_state=False):
     """ This is a typical memoization decorator, BUT there is one difference:
@@ -18,30 +28,56 @@ def _memoize_default(default=_NO_DEFAULT, inference_state_is_first_arg=False,
     Preventing recursion is in this case the much bigger use than speed. I
     don't think, that there is a big speed difference, but there are many cases
     where recursion could happen (think about a = b; b = a).
+
+    Memoized functions are called very often, so the wrapper is chosen when
+    decorating: Functions that only take one argument use it as the key and
+    keyword arguments are only part of the key if there are any.
     """
     def func(function):
-        def wrapper(obj, *args, **kwargs):
-            # TODO These checks are kind of ugly and slow.
-            if inference_state_is_first_arg:
-                cache = obj.memoize_cache
-            elif second_arg_is_inference_state:
-                cache = args[0].memoize_cache  # needed for meta classes
-            else:
-                cache = obj.inference_state.memoize_cache
-
-            try:
-                memo = cache[function]
-            except KeyError:
-                cache[function] = memo = {}
+        def call(memo, key, obj, args, kwargs):
+            if default is not _NO_DEFAULT:
+                memo[key] = default
+            rv = function(obj, *args, **kwargs)
+            memo[key] = rv
+            return rv
+
+        if second_arg_is_inference_state:
+            get_cache = None
+        elif inference_state_is_first_arg:
+            get_cache = attrgetter('memoize_cache')
+        else:
+            get_cache = attrgetter('inference_state.memoize_cache')
+
+        if get_cache is not None and _takes_only_first_arg(function):
+            def wrapper(obj):
+                cache = get_cache(obj)
+                try:
+                    memo = cache[function]
+                except KeyError:
+                    memo = cache[function] = {}
 
-            key = (obj, args, frozenset(kwargs.items()))
-            if key in memo:
-                return memo[key]
-            else:
-                if default is not _NO_DEFAULT:
-                    memo[key] = default
-                rv = function(obj, *args, **kwargs)
-                memo[key] = rv
+                rv = memo.get(obj, _NO_DEFAULT)
+                if rv is _NO_DEFAULT:
+                    return call(memo, obj, obj, (), {})
+                return rv
+        else:
+            def wrapper(obj, *args, **kwargs):
+                if get_cache is None:
+                    cache = args[0].memoize_cache  # needed for meta classes
+                else:
+                    cache = get_cache(obj)
+                try:
+                    memo = cache[function]
+                except KeyError:
+                    memo = cache[function] = {}
+
+                if kwargs:
+                    key = (obj, args, frozenset(kwargs.items()))
+                else:
+                    key = (obj, args)
+                rv = memo.get(key, _NO_DEFAULT)
+                if rv is _NO_DEFAULT:
+                    return call(memo, key, obj, args, kwargs)
                 return rv
         return wrapper
 
@@ -93,7 +129,10 @@ def inference_state_method_generator_cache():
             except KeyError:
                 cache[function] = memo = {}
 
-            key = (obj, args, frozenset(kwargs.items()))
+            if kwargs:
+                key = (obj, args, frozenset(kwargs.items()))
+            else:
+                key = (obj, args)
 
             if key in memo:
                 actual_generator, cached_lst = memo[key]
@@ -0,0 +1,165 @@
+"""
+An index of the names that are called in the Python files of a folder, e.g.
+``foo`` for ``foo(1)`` or ``bar.foo(1)``. Dynamic params search the modules
+around a function for calls of it. With this index only the modules that
+actually contain such a call need to be read and parsed.
+
+The index is kept per folder and stored in the cache directory, so it's
+shared between sessions. Files are only scanned again if their modification
+time or size changed.
+"""
+import os
+import re
+import json
+import hashlib
+
+from parso import python_bytes_to_unicode
+
+from jedi._compatibility import FileNotFoundError, force_unicode
+from jedi.common.utils import write_file_atomically
+from jedi import settings
+from jedi import debug
+
+_INDEX_VERSION = 1
+_INDEX_FOLDER = 'call_sites'
+# Finds names that are followed by an opening bracket. This finds more than
+# calls (e.g. definitions or names in strings), which is fine, because the
+# index is only used to skip modules.
+_CALL_PATTERN = re.compile(r'(\w+)(?:\s|\\)*\(', re.UNICODE)
+
+# Index path -> (stamp of the index file, file name -> (stamp, called names))
+_folder_indexes = {}
+
+
+def _get_file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime, stat.st_size]
+
+
+def _get_index_path(folder_path):
+    key = hashlib.sha256(force_unicode(folder_path).encode('utf-8')).hexdigest()[:32]
+    return os.path.join(
+        settings.cache_directory,
+        _INDEX_FOLDER,
+        '%s-%s.json' % (key, _INDEX_VERSION)
+    )
+
+
+def _load_entries(index_path):
+    try:
+        with open(index_path) as f:
+            entries = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    return dict(
+        (file_name, (stamp, frozenset(names)))
+        for file_name, (stamp, names) in entries.items()
+    )
+
+
+def _save_entries(index_path, entries):
+    data = dict(
+        (file_name, [stamp, sorted(names)])
+        for file_name, (stamp, names) in entries.items()
+    )
+    write_file_atomically(index_path, json.dumps(data).encode('utf-8'))
+
+
+def _get_entries(index_path):
+    stamp = _get_file_stamp(index_path)
+    try:
+        cached_stamp, entries = _folder_indexes[index_path]
+        # Other processes might have updated the index.
+        if cached_stamp == stamp or not settings.use_filesystem_cache:
+            return entries
+    except KeyError:
+        pass
+
+    entries = {}
+    if stamp is not None and settings.use_filesystem_cache:
+        entries = _load_entries(index_path)
+    _folder_indexes[index_path] = stamp, entries
+    return entries
+
+
+def _scan_file(file_io):
+    try:
+        code = file_io.read()
+    except FileNotFoundError:
+        return None
+    code = python_bytes_to_unicode(code, errors='replace')
+    return frozenset(_CALL_PATTERN.findall(code))
+
+
+def filter_calling_files(folder_path, file_ios, name):
+    """
+    Returns the file ios of a folder that (probably) call ``name``. The index
+    of the folder is updated for files that changed.
+    """
+    index_path = _get_index_path(folder_path)
+    entries = _get_entries(index_path)
+
+    changed = False
+    new_entries = {}
+    for file_io in file_ios:
+        file_name = os.path.basename(file_io.path)
+        stamp = _get_file_stamp(file_io.path)
+        entry = entries.get(file_name)
+        if entry is None or entry[0] != stamp:
+            names = _scan_file(file_io)
+            if names is None:
+                continue
+            entry = stamp, names
+            changed = True
+        new_entries[file_name] = entry
+    changed |= len(new_entries) != len(entries)
+
+    if changed:
+        stamp = None
+        if settings.use_filesystem_cache:
+            try:
+                _save_entries(index_path, new_entries)
+            except (IOError, OSError) as e:
+                debug.warning('Could not write call site index: %s', e)
+            else:
+                stamp = _get_file_stamp(index_path)
+        _folder_indexes[index_path] = stamp, new_entries
+
+    return [
+        file_io for file_io in file_ios
+        if name in new_entries.get(os.path.basename(file_io.path), (None, ()))[1]
+    ]
+
+
+def get_folder_index(folder_path):
+    """
+    Returns the called names of the files in a folder that didn't change since
+    they were indexed, as a dict of file name -> names.
+    """
+    entries = _get_entries(_get_index_path(folder_path))
+    return dict(
+        (file_name, names)
+        for file_name, (stamp, names) in entries.items()
+        if stamp == _get_file_stamp(os.path.join(folder_path, file_name))
+    )
+
+
+def update_folder_index(folder_path, names_by_file):
+    """
+    Adds the called names of files (a dict of file name -> names) to the index
+    of a folder, e.g. names that were found on another machine.
+    """
+    index_path = _get_index_path(folder_path)
+    entries = dict(_get_entries(index_path))
+    for file_name, names in names_by_file.items():
+        stamp = _get_file_stamp(os.path.join(folder_path, file_name))
+        if stamp is not None:
+            entries[file_name] = stamp, frozenset(names)
+    try:
+        _save_entries(index_path, entries)
+    except (IOError, OSError) as e:
+        debug.warning('Could not write call site index: %s', e)
+    _folder_indexes.pop(index_path, None)
@@ -2,6 +2,7 @@ from jedi._compatibility import unicode
 from jedi.inference.compiled.value import CompiledObject, CompiledName, \
     CompiledObjectFilter, CompiledValueName, create_from_access_path
 from jedi.inference.base_value import LazyValueWrapper
+from jedi.inference.compiled import snapshot
 
 
 def builtin_from_name(inference_state, string):
@@ -58,6 +59,9 @@ def load_module(inference_state, dotted_name, **kwargs):
     # and again and it's really slow.
     if dotted_name.startswith('tensorflow.'):
         return None
+    module = snapshot.load_or_create_snapshot(inference_state, dotted_name, **kwargs)
+    if module is not None:
+        return module
     access_path = inference_state.compiled_subprocess.load_module(dotted_name=dotted_name, **kwargs)
     if access_path is None:
         return None
@@ -6,7 +6,9 @@ import inspect
 import os
 import sys
 
-from jedi.parser_utils import get_cached_code_lines
+from parso.cache import parser_cache
+
+from jedi.parser_utils import get_cached_code_lines, UsedNamesCache
 
 from jedi._compatibility import unwrap
 from jedi import settings
@@ -188,10 +190,103 @@ def _get_object_to_check(python_object):
         raise TypeError  # Prevents computation of `repr` within inspect.
 
 
+def _get_cache_key(python_object):
+    """
+    Returns a key for the place where an object is defined. The object itself
+    is not part of it, so that the cache doesn't keep objects alive.
+    """
+    if inspect.ismodule(python_object):
+        key = 'module', python_object.__name__, getattr(python_object, '__file__', None)
+    elif inspect.isclass(python_object):
+        module = sys.modules.get(python_object.__module__)
+        key = (
+            'class',
+            python_object.__module__,
+            getattr(module, '__file__', None),
+            getattr(python_object, '__qualname__', python_object.__name__),
+        )
+    elif inspect.isfunction(python_object) or inspect.ismethod(python_object):
+        code = python_object.__code__
+        key = (
+            'code',
+            code.co_filename,
+            code.co_firstlineno,
+            getattr(python_object, '__qualname__', python_object.__name__),
+        )
+    else:
+        return None
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_file_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+# Interpreter creates a new inference state for every completion. The source
+# nodes of objects are therefore cached for the whole process. The place where
+# an object is defined is mapped to the path of its source and the nodes are
+# stored with the tree of that file, so they are freed together with it. An
+# entry is valid as long as the file is not modified and parso still uses the
+# same tree for it.
+_syntax_node_paths = {}
+_syntax_node_cache = UsedNamesCache()
+_MAX_CACHED_SYNTAX_NODES = 1000
+
+
 def _find_syntax_node_name(inference_state, python_object):
     original_object = python_object
     try:
         python_object = _get_object_to_check(python_object)
+    except TypeError:
+        return None
+
+    key = _get_cache_key(python_object)
+    path = _syntax_node_paths.get(key)
+    item = parser_cache.get(inference_state.grammar._hashed, {}).get(path)
+    if item is not None:
+        try:
+            mtime, result = _syntax_node_cache[item.node.get_used_names()][key]
+        except KeyError:
+            pass
+        else:
+            if mtime == _get_file_mtime(path):
+                return _check_node_of_instance(original_object, result)
+
+    result = _search_syntax_node_name(inference_state, python_object)
+    if result is not None and key is not None:
+        path = result[2].path
+        if len(_syntax_node_paths) >= _MAX_CACHED_SYNTAX_NODES:
+            _syntax_node_paths.clear()
+        _syntax_node_paths[key] = path
+        used_names = result[0].get_used_names()
+        try:
+            for_module = _syntax_node_cache[used_names]
+        except KeyError:
+            for_module = _syntax_node_cache[used_names] = {}
+        for_module[key] = _get_file_mtime(path), result
+    return _check_node_of_instance(original_object, result)
+
+
+def _check_node_of_instance(original_object, result):
+    if result is not None and result[1].type == 'funcdef' \
+            and get_api_type(original_object) == 'instance':
+        # If an instance is given and we're landing on a function (e.g.
+        # partial in 3.5), something is completely wrong and we should not
+        # return that.
+        return None
+    return result
+
+
+def _search_syntax_node_name(inference_state, python_object):
+    try:
         path = inspect.getsourcefile(python_object)
     except TypeError:
         # The type might not be known (e.g. class_with_dict.__weakref__)
@@ -254,11 +349,6 @@ def _find_syntax_node_name(inference_state, python_object):
     # inference, because people tend to define a public name in a module only
     # once.
     tree_node = names[-1].parent
-    if tree_node.type == 'funcdef' and get_api_type(original_object) == 'instance':
-        # If an instance is given and we're landing on a function (e.g.
-        # partial in 3.5), something is completely wrong and we should not
-        # return that.
-        return None
     return module_node, tree_node, file_io, code_lines
 
 
@@ -0,0 +1,601 @@
+"""
+Snapshots of compiled modules (C extensions like ``_socket`` or builtin
+modules). Inferring on compiled modules normally means a lot of calls to the
+subprocess (``dir``, ``getattr`` paths, signatures, docstrings). A snapshot
+introspects the module once in the environment and writes a stub-like Python
+file to the cache directory. This file is afterwards loaded like a normal
+Python module, without talking to the subprocess.
+
+The snapshot contains the names of a module, what kind of objects they are,
+signatures, docstrings and the bases of classes (and therefore their MRO).
+
+Snapshots of extension modules are keyed by the hash of the module file.
+Builtin modules don't have a file, so they are keyed by the hash of the
+Python executable.
+"""
+from __future__ import print_function
+import os
+import re
+import sys
+import json
+import inspect
+import hashlib
+import keyword
+import warnings
+
+from jedi._compatibility import builtins, is_py3, unicode, force_unicode
+from jedi.common.utils import write_file_atomically, get_mtimes
+from jedi.file_io import FileIO
+from jedi import settings
+from jedi import debug
+
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_FOLDER = 'snapshots'
+# These are the base of everything in Jedi and always need the actual objects.
+_NEVER_SNAPSHOT = ('builtins', '__builtin__')
+_MAX_CLASS_DEPTH = 5
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_]\w*$')
+_SKIPPED_CLASS_MEMBERS = (
+    '__dict__', '__doc__', '__module__', '__qualname__', '__weakref__',
+    '__slots__',
+)
+_SKIPPED_MODULE_MEMBERS = (
+    '__builtins__', '__cached__', '__doc__', '__loader__', '__spec__',
+)
+_LITERAL_TYPES = (bool, int, float, complex, str, bytes, unicode, type(None))
+# Python 2 doesn't know about ... outside of subscripts.
+_UNKNOWN_DEFAULT = '...' if is_py3 else 'None'
+
+
+def _is_identifier(name):
+    return bool(_IDENTIFIER.match(name)) and not keyword.iskeyword(name)
+
+
+def _safe_getattr(obj, name):
+    # Snapshots are only created for compiled modules, where getattr is
+    # usually not executing code.
+    with warnings.catch_warnings(record=True):
+        warnings.simplefilter("always")
+        try:
+            return True, getattr(obj, name)
+        except Exception:
+            return False, None
+
+
+def _format_doc(doc, indent):
+    if not doc:
+        return []
+    doc = force_unicode(doc).replace('\\', '\\\\').replace('"""', '\\"""')
+    if doc.endswith('"'):
+        doc = doc[:-1] + '\\"'
+    return [indent + '"""' + doc + '"""']
+
+
+def _format_literal(value):
+    if type(value) in _LITERAL_TYPES:
+        r = repr(value)
+        if type(value) is float and r in ('inf', '-inf', 'nan'):
+            return None
+        return r
+    return None
+
+
+class _SnapshotWriter(object):
+    """
+    Generates the code of a snapshot from a live module. This runs in the
+    environment (usually the subprocess) of the module.
+    """
+    def __init__(self, module):
+        self._module = module
+        self._module_name = module.__name__
+        self._imports = set()
+        self._lines = []
+        # id(obj) -> name of classes and functions defined in the snapshot.
+        self._local_names = {}
+        # ids of classes that are already written (or being written).
+        self._written = set()
+
+    def _is_local(self, obj):
+        return getattr(obj, '__module__', None) not in ('builtins', '__builtin__')
+
+    def _reference(self, obj):
+        """
+        Returns a Python expression that refers to a class or None.
+        """
+        try:
+            return self._local_names[id(obj)]
+        except KeyError:
+            pass
+
+        name = getattr(obj, '__name__', None)
+        module_name = getattr(obj, '__module__', None)
+        if not isinstance(name, str) or not isinstance(module_name, str):
+            return None
+        if module_name in ('builtins', '__builtin__'):
+            if getattr(builtins, name, None) is obj:
+                return name
+            return None
+        if module_name == self._module_name:
+            if getattr(self._module, name, None) is obj and _is_identifier(name):
+                # Will be defined later on.
+                return name
+            return None
+        if not all(_is_identifier(n) for n in module_name.split('.')) \
+                or not _is_identifier(name):
+            return None
+        self._imports.add(module_name)
+        return module_name + '.' + name
+
+    def _format_annotation(self, annotation):
+        if not is_py3 or not inspect.isclass(annotation):
+            return None
+        return self._reference(annotation)
+
+    def _format_params(self, func, first_param=None, is_bound=False):
+        """
+        ``first_param`` is the name of the self/cls param, signatures of
+        unbound methods already contain it.
+        """
+        try:
+            signature = inspect.signature(func)
+        except (AttributeError, ValueError, TypeError, RuntimeError):
+            # AttributeError: inspect.signature doesn't exist in Python 2.
+            return self._format_params_from_doc(func, first_param)
+
+        params = []
+        added_star = False
+        added_slash = False
+        parameters = list(signature.parameters.values())
+        if first_param is not None and (is_bound or not parameters):
+            params.append(first_param)
+        for i, p in enumerate(parameters):
+            kind = p.kind
+            if kind == p.POSITIONAL_ONLY:
+                pass
+            elif not added_slash and i and parameters[i - 1].kind == p.POSITIONAL_ONLY:
+                added_slash = True
+                if sys.version_info >= (3, 8):
+                    params.append('/')
+            if kind == p.KEYWORD_ONLY and not added_star:
+                added_star = True
+                params.append('*')
+            elif kind == p.VAR_POSITIONAL:
+                added_star = True
+
+            s = {p.VAR_POSITIONAL: '*', p.VAR_KEYWORD: '**'}.get(kind, '') + p.name
+            if p.annotation is not p.empty:
+                annotation = self._format_annotation(p.annotation)
+                if annotation is not None:
+                    s += ': ' + annotation
+            if p.default is not p.empty:
+                s += '=' + (_format_literal(p.default) or _UNKNOWN_DEFAULT)
+            params.append(s)
+        if parameters and parameters[-1].kind == p.POSITIONAL_ONLY \
+                and sys.version_info >= (3, 8):
+            params.append('/')
+
+        return_annotation = None
+        if signature.return_annotation is not signature.empty:
+            return_annotation = self._format_annotation(signature.return_annotation)
+        return params, return_annotation
+
+    def _format_params_from_doc(self, func, first_param):
+        from jedi.inference.compiled.value import _parse_function_doc
+
+        params = [] if first_param is None else [first_param]
+        doc = inspect.getdoc(func)
+        if not doc:
+            return params + ['*args', '**kwargs'], None
+
+        params_str, ret = _parse_function_doc(doc)
+        names = []
+        has_default = False
+        for p in params_str.split(',') if params_str.strip() else []:
+            name, _, default = p.strip().partition('=')
+            name = name.strip()
+            if not _is_identifier(name) or name in names \
+                    or has_default and not default:
+                # Something we don't understand, just allow everything.
+                return params + ['*args', '**kwargs'], self._doc_return(ret)
+            has_default = has_default or bool(default)
+            names.append(name + ('=' + _UNKNOWN_DEFAULT if default else ''))
+        if first_param is not None and names and names[0] in ('self', 'cls'):
+            names.pop(0)
+        return params + names, self._doc_return(ret)
+
+    def _doc_return(self, ret):
+        # The same heuristic as the docstring parsing of compiled objects.
+        if not is_py3:
+            return None
+        for name in ret.split():
+            if _is_identifier(name) and inspect.isclass(getattr(builtins, name, None)):
+                return name
+        return None
+
+    def _write_function(self, name, func, indent, first_param=None,
+                        is_bound=False, decorator=None):
+        params, return_annotation = self._format_params(func, first_param, is_bound)
+        if return_annotation is None and is_py3:
+            doc = inspect.getdoc(func)
+            if doc:
+                from jedi.inference.compiled.value import _parse_function_doc
+                return_annotation = self._doc_return(_parse_function_doc(doc)[1])
+
+        if decorator is not None:
+            self._lines.append(indent + '@' + decorator)
+        line = indent + 'def %s(%s)' % (name, ', '.join(params))
+        if return_annotation is not None:
+            line += ' -> ' + return_annotation
+        doc = _format_doc(inspect.getdoc(func), indent + '    ')
+        self._lines.append(line + ':')
+        self._lines += doc or [indent + '    ...']
+
+    def _write_class(self, name, cls, indent, depth=0):
+        self._written.add(id(cls))
+        self._local_names.setdefault(id(cls), name)
+        bases = []
+        for base in cls.__bases__:
+            if depth == 0 and self._is_local(base) and id(base) not in self._written:
+                base_name = self._local_names.get(id(base), base.__name__)
+                if _is_identifier(base_name):
+                    # Bases need to be defined before the class itself.
+                    self._write_class(base_name, base, indent, depth)
+            reference = self._reference(base)
+            if reference is not None:
+                bases.append(reference)
+
+        self._lines.append('')
+        self._lines.append(indent + 'class %s(%s):' % (name, ', '.join(bases)))
+        body_indent = indent + '    '
+        length = len(self._lines)
+        self._lines += _format_doc(inspect.getdoc(cls), body_indent)
+
+        try:
+            members = sorted(vars(cls).items())
+        except TypeError:
+            members = []
+        for member_name, member in members:
+            if not _is_identifier(member_name) or member_name in _SKIPPED_CLASS_MEMBERS:
+                continue
+            self._write_class_member(cls, member_name, member, body_indent, depth)
+
+        if len(self._lines) == length:
+            self._lines.append(body_indent + 'pass')
+
+    def _write_class_member(self, cls, name, member, indent, depth):
+        if isinstance(member, staticmethod):
+            self._write_function(name, member.__func__, indent, decorator='staticmethod')
+        elif isinstance(member, classmethod) or type(member).__name__ == 'classmethod_descriptor':
+            found, bound = _safe_getattr(cls, name)
+            if found:
+                self._write_function(name, bound, indent, first_param='cls',
+                                     is_bound=True, decorator='classmethod')
+        elif name == '__new__' and inspect.isbuiltin(member):
+            self._write_function(name, member, indent, decorator='staticmethod')
+        elif inspect.isroutine(member):
+            self._write_function(name, member, indent, first_param='self')
+        elif inspect.isdatadescriptor(member):
+            self._lines.append(indent + '@property')
+            self._lines.append(indent + 'def %s(self):' % name)
+            self._lines += _format_doc(getattr(member, '__doc__', None), indent + '    ') \
+                or [indent + '    ...']
+        elif inspect.isclass(member):
+            if id(member) in self._written or id(member) in self._local_names \
+                    or depth >= _MAX_CLASS_DEPTH or not self._is_local(member):
+                self._write_value(name, member, indent)
+            else:
+                self._write_class(name, member, indent, depth + 1)
+        else:
+            self._write_value(name, member, indent)
+
+    def _write_value(self, name, value, indent):
+        if inspect.isclass(value):
+            reference = self._reference(value)
+            if reference is not None and reference != name:
+                self._lines.append(indent + '%s = %s' % (name, reference))
+            return
+
+        literal = _format_literal(value)
+        if literal is not None:
+            self._lines.append(indent + '%s = %s' % (name, literal))
+            return
+
+        reference = self._reference(type(value))
+        if reference is not None and is_py3:
+            self._lines.append(indent + '%s: %s' % (name, reference))
+
+    def write(self):
+        module = self._module
+        classes = []
+        others = []
+        for name in sorted(dir(module)):
+            if not _is_identifier(name) or name in _SKIPPED_MODULE_MEMBERS:
+                continue
+            found, obj = _safe_getattr(module, name)
+            if not found:
+                continue
+            if inspect.ismodule(obj):
+                module_name = obj.__name__
+                if all(_is_identifier(n) for n in module_name.split('.')):
+                    self._lines.append('import %s as %s' % (module_name, name))
+            elif inspect.isclass(obj) and self._is_local(obj):
+                # Classes are written first and all at once, so that they
+                # can refer to each other. Aliases are defined with the
+                # actual name of the class if possible.
+                if obj.__name__ == name:
+                    self._local_names[id(obj)] = name
+                else:
+                    self._local_names.setdefault(id(obj), name)
+                classes.append((name, obj))
+            else:
+                others.append((name, obj))
+
+        aliases = []
+        for name, cls in classes:
+            if self._local_names[id(cls)] != name:
+                # The class is defined under another name.
+                aliases.append('%s = %s' % (name, self._local_names[id(cls)]))
+            elif id(cls) not in self._written:
+                self._write_class(name, cls, '')
+        self._lines += aliases
+
+        for name, obj in others:
+            if inspect.isroutine(obj):
+                self._lines.append('')
+                self._write_function(name, obj, '')
+            else:
+                self._write_value(name, obj, '')
+
+        header = ['# Snapshot of the compiled module %s, generated by Jedi.'
+                  % self._module_name]
+        header += _format_doc(inspect.getdoc(module), '')
+        header += ['import %s' % m for m in sorted(self._imports)
+                   if m != self._module_name]
+        return u'\n'.join(force_unicode(line) for line in header + self._lines) + u'\n'
+
+
+def create_snapshot_code(dotted_name, sys_path):
+    """
+    Imports a module and returns ``(file_path, code)`` of its snapshot. The
+    code is None if the module is not a compiled module. Returns None if the
+    module cannot be imported.
+
+    This is executed in the environment of the module.
+    """
+    temp, sys.path = sys.path, sys_path
+    try:
+        __import__(dotted_name)
+    except Exception:
+        print('Cannot snapshot %s in path %s.' % (dotted_name, sys_path), file=sys.stderr)
+        return None
+    finally:
+        sys.path = temp
+
+    module = sys.modules[dotted_name]
+    path = getattr(module, '__file__', None)
+    if path is not None and path.endswith(('.py', '.pyc', '.pyo', '.pyw')) \
+            or getattr(module, '__path__', None) is not None:
+        # Only compiled modules that are not packages can be snapshotted.
+        return path, None
+    return path, _SnapshotWriter(module).write()
+
+
+def _get_snapshot_directory():
+    return os.path.join(settings.cache_directory, _SNAPSHOT_FOLDER)
+
+
+def _get_index_path(environment):
+    return os.path.join(
+        _get_snapshot_directory(),
+        'index-%s-%s.json' % (environment._sha256[:16], _SNAPSHOT_VERSION)
+    )
+
+
+def _load_index(index_path):
+    try:
+        with open(index_path) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def _get_file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime, stat.st_size]
+
+
+def _hash_file(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def _is_in_sys_path(path, sys_path):
+    return any(path.startswith(os.path.join(p, '')) for p in sys_path)
+
+
+def create_snapshot(inference_state, dotted_name, sys_path):
+    """
+    Introspects a compiled module in the environment of the inference state
+    and stores its snapshot in the cache directory. Returns True if a snapshot
+    was created.
+    """
+    if dotted_name in _NEVER_SNAPSHOT:
+        return False
+    result = inference_state.compiled_subprocess.create_snapshot_code(
+        dotted_name=dotted_name,
+        sys_path=sys_path,
+    )
+    file_path, code = (None, None) if result is None else result
+    if code is None:
+        _save_failure(inference_state.environment, dotted_name, file_path, sys_path)
+        return False
+    return save_snapshot(inference_state.environment, dotted_name, file_path, code)
+
+
+def _get_failure_stamp(path, sys_path):
+    if path is None:
+        # The module could not be imported, which might change if something
+        # is installed in the sys path.
+        return get_mtimes(sys_path)
+    return _get_file_stamp(path)
+
+
+def _save_failure(environment, dotted_name, file_path, sys_path):
+    """
+    Remembers that a module cannot be snapshotted (e.g. because it's a package
+    or cannot be imported), so the subprocess doesn't have to import it again
+    until the module or the sys path changes.
+    """
+    entry = dict(
+        path=file_path,
+        stamp=_get_failure_stamp(file_path, sys_path),
+        artifact=None,
+    )
+    try:
+        _update_index(environment, dotted_name, entry)
+    except (IOError, OSError) as e:
+        debug.warning('Could not write snapshot index for %s: %s', dotted_name, e)
+
+
+def _update_index(environment, dotted_name, entry):
+    index_path = _get_index_path(environment)
+    # Other processes might have written the index in the meantime.
+    index = _load_index(index_path)
+    index[dotted_name] = entry
+    write_file_atomically(index_path, json.dumps(index).encode('utf-8'))
+
+
+def save_snapshot(environment, dotted_name, file_path, code):
+    """
+    Stores the snapshot code of a compiled module in the cache directory.
+    ``file_path`` is the path of the module or None for builtin modules.
+    Returns True if the snapshot was stored.
+    """
+    if file_path is None:
+        stamp = None
+        key = '%s-%s' % (environment._sha256, dotted_name)
+    else:
+        stamp = _get_file_stamp(file_path)
+        if stamp is None:
+            return False
+        key = _hash_file(file_path)
+    key = hashlib.sha256(
+        ('%s-%s' % (_SNAPSHOT_VERSION, key)).encode('utf-8')
+    ).hexdigest()
+    artifact = key + '.py'
+
+    try:
+        write_file_atomically(
+            os.path.join(_get_snapshot_directory(), artifact),
+            code.encode('utf-8')
+        )
+        _update_index(
+            environment, dotted_name,
+            dict(path=file_path, stamp=stamp, artifact=artifact)
+        )
+    except (IOError, OSError) as e:
+        debug.warning('Could not write snapshot of %s: %s', dotted_name, e)
+        return False
+    return True
+
+
+def get_snapshots(environment):
+    """
+    Returns the snapshots of an environment that are still valid as a list of
+    ``(dotted_name, module_path, snapshot_path)``. The module path is None for
+    builtin modules.
+    """
+    snapshots = []
+    for dotted_name, entry in sorted(_load_index(_get_index_path(environment)).items()):
+        path = entry['path']
+        if entry['artifact'] is None \
+                or path is not None and entry['stamp'] != _get_file_stamp(path):
+            continue
+        snapshot_path = os.path.join(_get_snapshot_directory(), entry['artifact'])
+        if os.path.isfile(snapshot_path):
+            snapshots.append((dotted_name, path, snapshot_path))
+    return snapshots
+
+
+def _get_index(inference_state):
+    index_path = _get_index_path(inference_state.environment)
+    stamp = _get_file_stamp(index_path)
+    try:
+        cached_stamp, index = _index_cache[index_path]
+        if cached_stamp == stamp:
+            return index
+    except KeyError:
+        pass
+    index = _load_index(index_path) if stamp is not None else {}
+    _index_cache[index_path] = stamp, index
+    return index
+
+
+_index_cache = {}
+
+
+def load_snapshot(inference_state, dotted_name, sys_path):
+    """
+    Returns a module value for a snapshot of a compiled module or None if
+    there is no valid snapshot.
+    """
+    entry = _get_index(inference_state).get(dotted_name)
+    if entry is None or entry['artifact'] is None:
+        return None
+
+    path = entry['path']
+    if path is not None:
+        # The module file must not have changed and still be importable.
+        if entry['stamp'] != _get_file_stamp(path) \
+                or not _is_in_sys_path(path, sys_path):
+            return None
+
+    file_io = FileIO(os.path.join(_get_snapshot_directory(), entry['artifact']))
+    try:
+        module_node = inference_state.parse(
+            file_io=file_io,
+            cache=True,
+            cache_path=settings.cache_directory
+        )
+    except (IOError, OSError):
+        return None
+
+    from jedi.inference.value import ModuleValue
+    from jedi.parser_utils import get_cached_code_lines
+    debug.dbg('Loaded snapshot of %s from %s', dotted_name, file_io.path)
+    return ModuleValue(
+        inference_state, module_node,
+        file_io=file_io,
+        string_names=tuple(dotted_name.split('.')),
+        code_lines=get_cached_code_lines(inference_state.grammar, file_io.path),
+    )
+
+
+def _is_known_failure(inference_state, dotted_name, sys_path):
+    entry = _get_index(inference_state).get(dotted_name)
+    if entry is None or entry['artifact'] is not None:
+        return False
+    path = entry['path']
+    if path is not None and not _is_in_sys_path(path, sys_path):
+        return False
+    return entry['stamp'] == _get_failure_stamp(path, sys_path)
+
+
+def load_or_create_snapshot(inference_state, dotted_name, sys_path):
+    if not settings.compiled_module_snapshots \
+            or dotted_name in _NEVER_SNAPSHOT \
+            or dotted_name.split('.')[0] in settings.auto_import_modules:
+        return None
+
+    module = load_snapshot(inference_state, dotted_name, sys_path)
+    if module is None and not _is_known_failure(inference_state, dotted_name, sys_path) \
+            and create_snapshot(inference_state, dotted_name, sys_path):
+        module = load_snapshot(inference_state, dotted_name, sys_path)
+    return module
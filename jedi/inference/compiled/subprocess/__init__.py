@@ -9,12 +9,13 @@ goals:
 
 import os
 import sys
+import time
 import subprocess
 import socket
 import errno
 import traceback
 from functools import partial
-from threading import Thread
+from threading import Thread, RLock
 try:
     from queue import Queue, Empty
 except ImportError:
@@ -23,6 +24,7 @@ except ImportError:
 from jedi._compatibility import queue, is_py3, force_unicode, \
     pickle_dump, pickle_load, GeneralizedPopen, weakref
 from jedi import debug
+from jedi import settings
 from jedi.cache import memoize_method
 from jedi.inference.compiled.subprocess import functions
 from jedi.inference.compiled.access import DirectObjectAccess, AccessPath, \
@@ -31,6 +33,9 @@ from jedi.api.exceptions import InternalError
 
 
 _MAIN_PATH = os.path.join(os.path.dirname(__file__), '__main__.py')
+# How often (in seconds) deleted inference states are flushed to the
+# subprocess and an idle subprocess is stopped.
+_BACKGROUND_INTERVAL = 2.0
 
 
 def _enqueue_output(out, queue):
@@ -54,6 +59,17 @@ def _get_function(name):
     return getattr(functions, name)
 
 
+def _run_background_tasks(subprocess_ref):
+    while True:
+        time.sleep(_BACKGROUND_INTERVAL)
+        compiled_subprocess = subprocess_ref()
+        if compiled_subprocess is None or compiled_subprocess.is_crashed:
+            return
+        compiled_subprocess._run_background_tasks()
+        # Don't keep the subprocess alive while sleeping.
+        del compiled_subprocess
+
+
 def _cleanup_process(process, thread):
     try:
         process.kill()
@@ -160,6 +176,15 @@ class CompiledSubprocess(object):
         self._executable = executable
         self._inference_state_deletion_queue = queue.deque()
         self._cleanup_callable = lambda: None
+        self._process = None
+        self._background_thread = None
+        # Requests can come from different threads (e.g. the background
+        # thread), but the communication with the subprocess is sequential.
+        self._lock = RLock()
+        # The ids of the inference states that the subprocess knows about.
+        self._inference_state_ids = set()
+        self._request_count = 0
+        self._last_used = time.time()
 
     def __repr__(self):
         pid = os.getpid()
@@ -171,8 +196,19 @@ class CompiledSubprocess(object):
             pid,
         )
 
-    @memoize_method
     def _get_process(self):
+        if self._process is None:
+            self._process = self._start_process()
+            if self._background_thread is None:
+                self._background_thread = t = Thread(
+                    target=_run_background_tasks,
+                    args=(weakref.ref(self),)
+                )
+                t.daemon = True
+                t.start()
+        return self._process
+
+    def _start_process(self):
         debug.dbg('Start environment subprocess %s', self._executable)
         parso_path = sys.modules['parso'].__file__
         args = (
@@ -206,17 +242,78 @@ class CompiledSubprocess(object):
         return process
 
     def run(self, inference_state, function, args=(), kwargs={}):
-        # Delete old inference_states.
+        assert callable(function)
+        inference_state_id = id(inference_state)
+        with self._lock:
+            # Delete old inference_states. This needs to happen before the
+            # request, because ids of deleted inference states can be reused.
+            self._delete_inference_states()
+
+            if inference_state_id not in self._inference_state_ids:
+                # No inference state is using the subprocess right now, so it
+                # can be restarted without losing any access handles.
+                if not self._inference_state_ids and self._should_recycle():
+                    debug.dbg('Recycle environment subprocess %s', self._executable)
+                    self._stop_process()
+                self._inference_state_ids.add(inference_state_id)
+            return self._send(inference_state_id, function, args, kwargs)
+
+    def _delete_inference_states(self):
         while True:
             try:
                 inference_state_id = self._inference_state_deletion_queue.pop()
             except IndexError:
                 break
             else:
-                self._send(inference_state_id, None)
-
-        assert callable(function)
-        return self._send(id(inference_state), function, args, kwargs)
+                self._inference_state_ids.discard(inference_state_id)
+                if self._process is not None:
+                    self._send(inference_state_id, None)
+
+    def _should_recycle(self):
+        if self._process is None:
+            return False
+
+        max_requests = settings.subprocess_max_requests
+        if max_requests is not None and self._request_count >= max_requests:
+            return True
+
+        max_memory = settings.subprocess_max_memory
+        if max_memory is not None:
+            memory_usage = self._send(None, functions.get_memory_usage)
+            if memory_usage is not None and memory_usage >= max_memory * 1024 * 1024:
+                return True
+        return False
+
+    def _is_idle(self):
+        idle_timeout = settings.subprocess_idle_timeout
+        return idle_timeout is not None and not self._inference_state_ids \
+            and time.time() - self._last_used >= idle_timeout
+
+    def _run_background_tasks(self):
+        # If the lock is not available, a request is running and that one is
+        # going to delete the inference states anyway.
+        if not self._lock.acquire(False):
+            return
+        try:
+            if self.is_crashed:
+                return
+            self._delete_inference_states()
+            if self._process is not None and self._is_idle():
+                debug.dbg('Stop idle environment subprocess %s', self._executable)
+                self._stop_process()
+        except InternalError as e:
+            debug.warning('Error in the background of the subprocess: %s', e)
+        finally:
+            self._lock.release()
+
+    def _stop_process(self):
+        """
+        Stops the subprocess. It gets started again on the next request.
+        """
+        self._cleanup_callable()
+        self._cleanup_callable = lambda: None
+        self._process = None
+        self._request_count = 0
 
     def get_sys_path(self):
         return self._send(None, functions.get_sys_path, (), {})
@@ -233,7 +330,12 @@ class CompiledSubprocess(object):
             # Python 2 compatibility
             kwargs = {force_unicode(key): value for key, value in kwargs.items()}
 
-        data = inference_state_id, function, args, kwargs
+        with self._lock:
+            self._request_count += 1
+            self._last_used = time.time()
+            return self._communicate((inference_state_id, function, args, kwargs))
+
+    def _communicate(self, data):
         try:
             pickle_dump(data, self._get_process().stdin, self._pickle_protocol)
         except (socket.error, IOError) as e:
@@ -274,10 +376,9 @@ class CompiledSubprocess(object):
 
     def delete_inference_state(self, inference_state_id):
         """
-        Currently we are not deleting inference_state instantly. They only get
-        deleted once the subprocess is used again. It would probably a better
-        solution to move all of this into a thread. However, the memory usage
-        of a single inference_state shouldn't be that high.
+        Inference states are not deleted instantly, because this is called
+        from ``__del__``. They get deleted by the background thread or before
+        the next request, whatever comes first.
         """
         # With an argument - the inference_state gets deleted.
         self._inference_state_deletion_queue.append(inference_state_id)
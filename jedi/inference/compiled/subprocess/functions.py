@@ -5,6 +5,7 @@ import os
 from jedi._compatibility import find_module, cast_path, force_unicode, \
     iter_modules, all_suffixes
 from jedi.inference.compiled import access
+from jedi.inference.compiled import snapshot
 from jedi import parser_utils
 
 
@@ -12,10 +13,38 @@ def get_sys_path():
     return list(map(cast_path, sys.path))
 
 
+def get_memory_usage():
+    """
+    Returns the resident set size of the subprocess in bytes or None if it's
+    not known.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return None
+    # This is the peak memory usage, which is good enough. It's in kilobytes
+    # on Linux and in bytes on macOS.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return max_rss
+    return max_rss * 1024
+
+
 def load_module(inference_state, **kwargs):
     return access.load_module(inference_state, **kwargs)
 
 
+def create_snapshot_code(inference_state, dotted_name, sys_path):
+    return snapshot.create_snapshot_code(dotted_name, sys_path)
+
+
 def get_compiled_method_return(inference_state, id, attribute, *args, **kwargs):
     handle = inference_state.compiled_subprocess.get_access_handle(id)
     return getattr(handle.access, attribute)(*args, **kwargs)
@@ -15,6 +15,7 @@ from jedi import parser_utils
 
 class AbstractContext(object):
     # Must be defined: inference_state and tree_node and parent_context as an attribute/property
+    __slots__ = ('inference_state', 'predefined_names')
 
     def __init__(self, inference_state):
         self.inference_state = inference_state
@@ -160,6 +161,8 @@ class ValueContext(AbstractContext):
     """
     Should be defined, otherwise the API returns empty types.
     """
+    __slots__ = ('_value',)
+
     def __init__(self, value):
         super(ValueContext, self).__init__(value.inference_state)
         self._value = value
@@ -211,6 +214,8 @@ class ValueContext(AbstractContext):
 
 
 class TreeContextMixin(object):
+    __slots__ = ()
+
     def infer_node(self, node):
         from jedi.inference.syntax_tree import infer_node
         return infer_node(self, node)
@@ -292,6 +297,8 @@ class TreeContextMixin(object):
 
 
 class FunctionContext(TreeContextMixin, ValueContext):
+    __slots__ = ()
+
     def get_filters(self, until_position=None, origin_scope=None):
         yield ParserTreeFilter(
             self.inference_state,
@@ -302,6 +309,8 @@ class FunctionContext(TreeContextMixin, ValueContext):
 
 
 class ModuleContext(TreeContextMixin, ValueContext):
+    __slots__ = ()
+
     def py__file__(self):
         return self._value.py__file__()
 
@@ -341,6 +350,8 @@ class ModuleContext(TreeContextMixin, ValueContext):
 
 
 class NamespaceContext(TreeContextMixin, ValueContext):
+    __slots__ = ()
+
     def get_filters(self, until_position=None, origin_scope=None):
         return self._value.get_filters()
 
@@ -352,6 +363,8 @@ class NamespaceContext(TreeContextMixin, ValueContext):
 
 
 class ClassContext(TreeContextMixin, ValueContext):
+    __slots__ = ()
+
     def get_filters(self, until_position=None, origin_scope=None):
         yield self.get_global_filter(until_position, origin_scope)
 
@@ -364,6 +377,8 @@ class ClassContext(TreeContextMixin, ValueContext):
 
 
 class CompForContext(TreeContextMixin, AbstractContext):
+    __slots__ = ('tree_node', 'parent_context')
+
     def __init__(self, parent_context, comp_for):
         super(CompForContext, self).__init__(parent_context.inference_state)
         self.tree_node = comp_for
@@ -383,11 +398,15 @@ class CompForContext(TreeContextMixin, AbstractContext):
 
 
 class CompiledContext(ValueContext):
+    __slots__ = ()
+
     def get_filters(self, until_position=None, origin_scope=None):
         return self._value.get_filters()
 
 
 class CompiledModuleContext(CompiledContext):
+    __slots__ = ()
+
     code_lines = None
 
     def get_value(self):
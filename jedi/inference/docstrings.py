@@ -46,6 +46,13 @@ REST_ROLE_PATTERN = re.compile(r':[^`]+:`([^`]+)`')
 
 _numpy_doc_string_cache = None
 
+# The results of parsing docstrings and docstring type strings are shared by
+# all inference states, they only depend on the text.
+_param_docstring_cache = {}
+_numpy_docstring_cache = {}
+_statement_string_cache = {}
+_MAX_CACHED_DOCSTRINGS = 1000
+
 
 def _get_numpy_doc_string_cls():
     global _numpy_doc_string_cache
@@ -56,16 +63,41 @@ def _get_numpy_doc_string_cls():
     return _numpy_doc_string_cache
 
 
+def _get_cached(cache, key, func, *args):
+    try:
+        return cache[key]
+    except KeyError:
+        if len(cache) >= _MAX_CACHED_DOCSTRINGS:
+            cache.clear()
+        result = cache[key] = func(*args)
+        return result
+
+
+def _parse_numpydocstr(docstr):
+    """
+    Returns the parsed sections of a numpydoc docstring or None. This is
+    cached, because it's needed for every param of a function.
+    """
+    def parse():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                # This is a non-public API. If it ever changes we should be
+                # prepared and return gracefully.
+                return _get_numpy_doc_string_cls()(docstr)._parsed_data
+            except Exception:
+                return None
+
+    return _get_cached(_numpy_docstring_cache, docstr, parse)
+
+
 def _search_param_in_numpydocstr(docstr, param_str):
     """Search `docstr` (in numpydoc format) for type(-s) of `param_str`."""
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        try:
-            # This is a non-public API. If it ever changes we should be
-            # prepared and return gracefully.
-            params = _get_numpy_doc_string_cls()(docstr)._parsed_data['Parameters']
-        except Exception:
-            return []
+    parsed_data = _parse_numpydocstr(docstr)
+    try:
+        params = parsed_data['Parameters']
+    except Exception:
+        return []
     for p_name, p_type, p_descr in params:
         if p_name == param_str:
             m = re.match(r'([^,]+(,[^,]+)*?)(,[ ]*optional)?$', p_type)
@@ -79,17 +111,12 @@ def _search_return_in_numpydocstr(docstr):
     """
     Search `docstr` (in numpydoc format) for type(-s) of function returns.
     """
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        try:
-            doc = _get_numpy_doc_string_cls()(docstr)
-        except Exception:
-            return
+    parsed_data = _parse_numpydocstr(docstr)
     try:
         # This is a non-public API. If it ever changes we should be
         # prepared and return gracefully.
-        returns = doc._parsed_data['Returns']
-        returns += doc._parsed_data['Yields']
+        returns = list(parsed_data['Returns'])
+        returns += parsed_data['Yields']
     except Exception:
         return
     for r_name, r_type, r_descr in returns:
@@ -183,7 +210,11 @@ def _strip_rst_role(type_str):
         return type_str
 
 
-def _infer_for_statement_string(module_context, string):
+def _parse_statement_string(grammar, string):
+    """
+    Returns the function definition and the statement of the pseudo function
+    for a docstring type string or None.
+    """
     code = dedent(u("""
     def pseudo_docstring_stuff():
         '''
@@ -193,34 +224,48 @@ def _infer_for_statement_string(module_context, string):
         '''
     {}
     """))
-    if string is None:
-        return []
-
     for element in re.findall(r'((?:\w+\.)*\w+)\.', string):
         # Try to import module part in dotted name.
         # (e.g., 'threading' in 'threading.Thread').
         string = 'import %s\n' % element + string
 
-    # Take the default grammar here, if we load the Python 2.7 grammar here, it
-    # will be impossible to use `...` (Ellipsis) as a token. Docstring types
-    # don't need to conform with the current grammar.
     debug.dbg('Parse docstring code %s', string, color='BLUE')
-    grammar = module_context.inference_state.latest_grammar
     try:
         module = grammar.parse(code.format(indent_block(string)), error_recovery=False)
     except ParserSyntaxError:
-        return []
+        return None
     try:
         funcdef = next(module.iter_funcdefs())
         # First pick suite, then simple_stmt and then the node,
         # which is also not the last item, because there's a newline.
         stmt = funcdef.children[-1].children[-1].children[-2]
     except (AttributeError, IndexError):
-        return []
+        return None
 
     if stmt.type not in ('name', 'atom', 'atom_expr'):
+        return None
+    return funcdef, stmt
+
+
+def _infer_for_statement_string(module_context, string):
+    if string is None:
         return []
 
+    # Take the default grammar here, if we load the Python 2.7 grammar here, it
+    # will be impossible to use `...` (Ellipsis) as a token. Docstring types
+    # don't need to conform with the current grammar.
+    grammar = module_context.inference_state.latest_grammar
+    # The same type strings are used all over a code base, the pseudo modules
+    # are therefore shared.
+    result = _get_cached(
+        _statement_string_cache,
+        (tuple(grammar.version_info), string),
+        _parse_statement_string, grammar, string
+    )
+    if result is None:
+        return []
+    funcdef, stmt = result
+
     from jedi.inference.value import FunctionValue
     function_value = FunctionValue(
         module_context.inference_state,
@@ -271,9 +316,14 @@ def _execute_array_values(inference_state, array):
 @inference_state_method_cache()
 def infer_param(function_value, param):
     def infer_docstring(docstring):
+        param_strs = _get_cached(
+            _param_docstring_cache,
+            (docstring, param.name.value),
+            _search_param_in_docstr, docstring, param.name.value
+        )
         return ValueSet(
             p
-            for param_str in _search_param_in_docstr(docstring, param.name.value)
+            for param_str in param_strs
             for p in _infer_for_statement_string(module_context, param_str)
         )
     module_context = function_value.get_root_context()
@@ -117,7 +117,7 @@ def _search_function_arguments(module_context, funcdef, string_name):
     i = 0
     inference_state = module_context.inference_state
     for for_mod_context in imports.get_module_contexts_containing_name(
-            inference_state, [module_context], string_name):
+            inference_state, [module_context], string_name, only_calls=True):
         for name, trailer in _get_potential_nodes(for_mod_context, string_name):
             i += 1
 
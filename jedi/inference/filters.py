@@ -3,7 +3,7 @@ Filters are objects that you can use to filter names in different scopes. They
 are needed for name resolution.
 """
 from abc import abstractmethod
-import weakref
+from bisect import bisect_left
 
 from parso.tree import search_ancestor
 
@@ -11,12 +11,17 @@ from jedi._compatibility import use_metaclass
 from jedi.inference import flow_analysis
 from jedi.inference.base_value import ValueSet, ValueWrapper, \
     LazyValueWrapper
-from jedi.parser_utils import get_cached_parent_scope
+from jedi.inference.helpers import is_big_annoying_library
+from jedi.parser_utils import get_cached_parent_scope, get_parent_scope, \
+    UsedNamesCache
 from jedi.inference.utils import to_list
 from jedi.inference.names import TreeNameDefinition, ParamName, \
     AnonymousParamName, AbstractNameDefinition
 
-_definition_name_cache = weakref.WeakKeyDictionary()
+_definition_name_cache = UsedNamesCache()
+_binding_table_cache = UsedNamesCache()
+_scope_name_keys_cache = UsedNamesCache()
+_attribute_name_keys_cache = UsedNamesCache()
 
 
 class AbstractFilter(object):
@@ -68,6 +73,118 @@ def _get_definition_names(used_names, name_key):
         return result
 
 
+class _Bindings(object):
+    """
+    The definitions of a name within one scope, sorted by position.
+    """
+    def __init__(self):
+        self.positions = []
+        self.names = []
+        # Definitions that are not within a flow (if/for/try/...) of the scope
+        # are always reachable and don't need a flow analysis.
+        self.without_flows = set()
+
+    def add(self, name, has_flows):
+        self.positions.append(name.start_pos)
+        self.names.append(name)
+        if not has_flows:
+            self.without_flows.add(name)
+
+    def get_names_before(self, position):
+        if position is None:
+            return self.names
+        return self.names[:bisect_left(self.positions, position)]
+
+
+def _get_binding_table(used_names, name_key, definition_names):
+    """
+    Returns a dict of scope node -> :class:`_Bindings` for all definitions of
+    a name in a module. The table is calculated once per module and name.
+    """
+    try:
+        for_module = _binding_table_cache[used_names]
+    except KeyError:
+        for_module = _binding_table_cache[used_names] = {}
+
+    try:
+        return for_module[name_key]
+    except KeyError:
+        pass
+
+    table = {}
+    for name in sorted(definition_names, key=lambda name: name.start_pos):
+        parent = name.parent
+        if parent.type == 'trailer':
+            continue
+        base_node = parent if parent.type in ('classdef', 'funcdef') else name
+        scope = get_cached_parent_scope(used_names, base_node)
+        try:
+            bindings = table[scope]
+        except KeyError:
+            bindings = table[scope] = _Bindings()
+        bindings.add(name, get_parent_scope(name, include_flows=True) != scope)
+    for_module[name_key] = table
+    return table
+
+
+def _get_scope_name_keys(used_names):
+    """
+    Returns a dict of scope node -> names that are defined in the scope. This
+    way the names of a class or function can be listed without going through
+    all the names of a module. The dict is calculated once per module and
+    shared, like the module, between inference states.
+    """
+    try:
+        return _scope_name_keys_cache[used_names]
+    except KeyError:
+        pass
+
+    scopes = {}
+    for name_key in used_names:
+        for name in _get_definition_names(used_names, name_key):
+            parent = name.parent
+            if parent.type == 'trailer':
+                continue
+            base_node = parent if parent.type in ('classdef', 'funcdef') else name
+            scope = get_cached_parent_scope(used_names, base_node)
+            try:
+                name_keys = scopes[scope]
+            except KeyError:
+                name_keys = scopes[scope] = []
+            if not name_keys or name_keys[-1] != name_key:
+                name_keys.append(name_key)
+    _scope_name_keys_cache[used_names] = scopes
+    return scopes
+
+
+def get_attribute_name_keys(used_names):
+    """
+    Returns a dict of class node -> names that are defined as attributes like
+    ``self.foo = 1`` somewhere within the class. Calculated once per module.
+    """
+    try:
+        return _attribute_name_keys_cache[used_names]
+    except KeyError:
+        pass
+
+    classes = {}
+    for name_key in used_names:
+        for name in _get_definition_names(used_names, name_key):
+            if name.parent.type != 'trailer':
+                continue
+            classdef = search_ancestor(name, 'classdef')
+            while classdef is not None:
+                try:
+                    name_keys = classes[classdef]
+                except KeyError:
+                    name_keys = classes[classdef] = []
+                if not name_keys or name_keys[-1] != name_key:
+                    name_keys.append(name_key)
+                classdef = search_ancestor(classdef, 'classdef')
+    _attribute_name_keys_cache[used_names] = classes
+    return classes
+
+
 class AbstractUsedNamesFilter(AbstractFilter):
     name_class = TreeNameDefinition
 
@@ -86,10 +203,17 @@ class AbstractUsedNamesFilter(AbstractFilter):
     def _convert_names(self, names):
         return [self.name_class(self.parent_context, name) for name in names]
 
+    def _get_name_keys(self):
+        """
+        The names that ``values`` looks at, by default all the names of the
+        module.
+        """
+        return self._used_names
+
     def values(self, **filter_kwargs):
         return self._convert_names(
             name
-            for name_key in self._used_names
+            for name_key in self._get_name_keys()
             for name in self._filter(
                 _get_definition_names(self._used_names, name_key),
                 **filter_kwargs
@@ -117,10 +241,44 @@ class ParserTreeFilter(AbstractUsedNamesFilter):
         self._until_position = until_position
 
     def _filter(self, names):
+        if names:
+            name_key = names[0].value
+            if _get_definition_names(self._used_names, name_key) is names:
+                # This is the usual case, all the definitions of a name are
+                # looked up, so use the binding table of the module.
+                return self._filter_bindings(name_key, names)
+
         names = super(ParserTreeFilter, self)._filter(names)
         names = [n for n in names if self._is_name_reachable(n)]
         return list(self._check_flows(names))
 
+    def _get_name_keys(self):
+        return _get_scope_name_keys(self._used_names).get(self._parser_scope, ())
+
+    def _filter_bindings(self, name_key, definition_names):
+        table = _get_binding_table(self._used_names, name_key, definition_names)
+        bindings = table.get(self._parser_scope)
+        if bindings is None:
+            return []
+
+        result = []
+        is_library = None
+        for name in reversed(bindings.get_names_before(self._until_position)):
+            if not self._is_name_reachable(name):
+                continue
+            if name in bindings.without_flows:
+                if is_library is None:
+                    is_library = is_big_annoying_library(self._node_context)
+                check = flow_analysis.UNSURE if is_library else flow_analysis.REACHABLE
+            else:
+                check = self._check_reachability(name)
+            if check is not flow_analysis.UNREACHABLE:
+                result.append(name)
+
+            if check is flow_analysis.REACHABLE:
+                break
+        return result
+
     def _is_name_reachable(self, name):
         parent = name.parent
         if parent.type == 'trailer':
@@ -128,14 +286,17 @@ class ParserTreeFilter(AbstractUsedNamesFilter):
         base_node = parent if parent.type in ('classdef', 'funcdef') else name
         return get_cached_parent_scope(self._used_names, base_node) == self._parser_scope
 
+    def _check_reachability(self, name):
+        return flow_analysis.reachability_check(
+            context=self._node_context,
+            value_scope=self._parser_scope,
+            node=name,
+            origin_scope=self._origin_scope
+        )
+
     def _check_flows(self, names):
         for name in sorted(names, key=lambda name: name.start_pos, reverse=True):
-            check = flow_analysis.reachability_check(
-                context=self._node_context,
-                value_scope=self._parser_scope,
-                node=name,
-                origin_scope=self._origin_scope
-            )
+            check = self._check_reachability(name)
             if check is not flow_analysis.UNREACHABLE:
                 yield name
 
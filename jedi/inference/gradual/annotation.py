@@ -60,21 +60,44 @@ def _infer_annotation_string(context, string, index=None):
     return value_set
 
 
+# Parsed string annotations are stored per module, because their nodes are
+# inserted into the tree. The parsed type comments only depend on the text and
+# are shared by all inference states.
+_annotation_node_cache = parser_utils.UsedNamesCache()
+_comment_declaration_cache = {}
+_MAX_CACHED_ANNOTATIONS = 2000
+
+
 def _get_forward_reference_node(context, string):
+    string = force_unicode(string)
+    grammar = context.inference_state.grammar
+    module = context.tree_node.get_root_node()
+    used_names = module.get_used_names()
     try:
-        new_node = context.inference_state.grammar.parse(
-            force_unicode(string),
+        for_module = _annotation_node_cache[used_names]
+    except KeyError:
+        for_module = _annotation_node_cache[used_names] = {}
+    key = tuple(grammar.version_info), string, context.tree_node, module.end_pos[0]
+    try:
+        return for_module[key]
+    except KeyError:
+        pass
+
+    try:
+        new_node = grammar.parse(
+            string,
             start_symbol='eval_input',
             error_recovery=False
         )
     except ParserSyntaxError:
         debug.warning('Annotation not parsed: %s' % string)
-        return None
+        new_node = None
     else:
-        module = context.tree_node.get_root_node()
         parser_utils.move(new_node, module.end_pos[0])
         new_node.parent = context.tree_node
-        return new_node
+
+    for_module[key] = new_node
+    return new_node
 
 
 def _split_comment_param_declaration(decl_text):
@@ -86,6 +109,19 @@ def _split_comment_param_declaration(decl_text):
     ['foo', 'Bar[baz, biz]'].
 
     """
+    try:
+        return list(_comment_declaration_cache[decl_text])
+    except KeyError:
+        pass
+
+    params = _parse_comment_param_declaration(decl_text)
+    if len(_comment_declaration_cache) >= _MAX_CACHED_ANNOTATIONS:
+        _comment_declaration_cache.clear()
+    _comment_declaration_cache[decl_text] = tuple(params)
+    return params
+
+
+def _parse_comment_param_declaration(decl_text):
     try:
         node = parse(decl_text, error_recovery=False).children[0]
     except ParserSyntaxError:
@@ -116,7 +152,8 @@ def infer_param(function_value, param, ignore_stars=False):
     inference_state = function_value.inference_state
     if param.star_count == 1:
         tuple_ = builtin_from_name(inference_state, 'tuple')
-        return ValueSet([GenericClass(
+        return ValueSet([GenericClass.create_cached(
+            inference_state,
             tuple_,
             TupleGenericManager((values,)),
         ) for c in values])
@@ -126,7 +163,8 @@ def infer_param(function_value, param, ignore_stars=False):
             ValueSet([builtin_from_name(inference_state, 'str')]),
             values
         )
-        return ValueSet([GenericClass(
+        return ValueSet([GenericClass.create_cached(
+            inference_state,
             dct,
             TupleGenericManager(generics),
         ) for c in values])
@@ -1,6 +1,7 @@
 from jedi import debug
 from jedi.inference.base_value import ValueSet, \
     NO_VALUES
+from jedi.inference.cache import inference_state_function_cache
 from jedi.inference.utils import to_list
 from jedi.inference.gradual.stub_value import StubModuleValue
 
@@ -46,9 +47,22 @@ def _infer_from_stub(stub_module_context, qualified_names, ignore_compiled):
     non_stubs = stub_module.non_stub_value_set
     if ignore_compiled:
         non_stubs = non_stubs.filter(lambda c: not c.is_compiled())
-    for name in qualified_names:
-        non_stubs = non_stubs.py__getattribute__(name)
-    return non_stubs
+    return _infer_qualified_names(
+        stub_module.inference_state, non_stubs, tuple(qualified_names))
+
+
+@inference_state_function_cache()
+def _infer_qualified_names(inference_state, module_values, qualified_names):
+    """
+    Infers qualified names like ``('Foo', 'bar')`` in modules. This is what
+    conversions between stubs and Python modules do all the time, so it's
+    cached per module and qualified names. Parents are looked up only once as
+    well, e.g. ``('Foo',)`` is reused for all attributes of ``Foo``.
+    """
+    if not qualified_names:
+        return module_values
+    values = _infer_qualified_names(inference_state, module_values, qualified_names[:-1])
+    return values.py__getattribute__(qualified_names[-1])
 
 
 @to_list
@@ -168,9 +182,8 @@ def to_stub(value):
         qualified_names = qualified_names[:-1]
         was_instance = True
 
-    stub_values = ValueSet([stub_module])
-    for name in qualified_names:
-        stub_values = stub_values.py__getattribute__(name)
+    stub_values = _infer_qualified_names(
+        stub_module.inference_state, ValueSet([stub_module]), tuple(qualified_names))
 
     if was_instance:
         stub_values = ValueSet.from_sets(
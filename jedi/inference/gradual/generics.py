@@ -79,8 +79,14 @@ class LazyGenericManager(_AbstractGenericManager):
 
 
 class TupleGenericManager(_AbstractGenericManager):
+    """
+    Generics that are already known. Two managers with the same generics are
+    equal, so that classes created with ``create_cached`` are shared for the
+    same parametrization, e.g. all the ``List[int]`` of an inference state
+    are the same object.
+    """
     def __init__(self, tup):
-        self._tuple = tup
+        self._tuple = tuple(tup)
 
     def __getitem__(self, index):
         return self._tuple[index]
@@ -94,5 +100,15 @@ class TupleGenericManager(_AbstractGenericManager):
     def is_homogenous_tuple(self):
         return False
 
+    def __eq__(self, other):
+        return isinstance(other, TupleGenericManager) \
+            and self._tuple == other._tuple
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._tuple)
+
     def __repr__(self):
         return '<TupG>[%s]' % (', '.join(repr(x) for x in self.to_tuple()))
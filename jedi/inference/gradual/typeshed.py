@@ -1,5 +1,6 @@
 import os
 import re
+from collections import OrderedDict
 from functools import wraps
 
 from jedi.file_io import FileIO
@@ -69,6 +70,14 @@ def _get_typeshed_directories(version_info):
 
 
 _version_cache = {}
+# Typeshed is shipped with Jedi and never changes. Its parsed stub modules
+# (e.g. builtins and typing) are therefore shared by all inference states of
+# a process and are never garbage collected by parso's cache, which would
+# otherwise lead to reparsing them and to multiple copies of the same trees in
+# long running processes. The least recently used modules are dropped once
+# there are too many of them, builtins and typing are used all the time.
+_typeshed_module_cache = OrderedDict()  # Dict[Tuple[str, str], Tuple[Module, List[str]]]
+_MAX_CACHED_TYPESHED_MODULES = 100
 
 
 def _cache_stub_file_map(version_info):
@@ -253,24 +262,54 @@ def _load_from_typeshed(inference_state, python_value_set, parent_module_value,
             )
 
 
+def _parse_stub_module(inference_state, file_io):
+    """
+    Returns the module node and the code lines of a stub file.
+    """
+    path = file_io.path
+    is_typeshed = path.startswith(TYPESHED_PATH)
+    key = inference_state.latest_grammar._hashed, path
+    if is_typeshed:
+        try:
+            result = _typeshed_module_cache.pop(key)
+        except KeyError:
+            pass
+        else:
+            _typeshed_module_cache[key] = result
+            return result
+
+    stub_module_node = inference_state.parse(
+        file_io=file_io,
+        cache=True,
+        use_latest_grammar=True
+    )
+    result = stub_module_node, \
+        get_cached_code_lines(inference_state.latest_grammar, path)
+    if is_typeshed:
+        if len(_typeshed_module_cache) >= _MAX_CACHED_TYPESHED_MODULES:
+            _typeshed_module_cache.popitem(last=False)
+        _typeshed_module_cache[key] = result
+    return result
+
+
 def _try_to_load_stub_from_file(inference_state, python_value_set, file_io, import_names):
     try:
-        stub_module_node = inference_state.parse(
-            file_io=file_io,
-            cache=True,
-            use_latest_grammar=True
-        )
+        stub_module_node, code_lines = _parse_stub_module(inference_state, file_io)
     except (OSError, IOError):  # IOError is Python 2 only
         # The file that you're looking for doesn't exist (anymore).
         return None
     else:
         return create_stub_module(
             inference_state, python_value_set, stub_module_node, file_io,
-            import_names
+            import_names, code_lines=code_lines
         )
 
 
-def create_stub_module(inference_state, python_value_set, stub_module_node, file_io, import_names):
+def create_stub_module(inference_state, python_value_set, stub_module_node, file_io,
+                       import_names, code_lines=None):
+    if code_lines is None:
+        # The code was loaded with latest_grammar, so use that.
+        code_lines = get_cached_code_lines(inference_state.latest_grammar, file_io.path)
     if import_names == ('typing',):
         module_cls = TypingModuleWrapper
     else:
@@ -280,9 +319,7 @@ def create_stub_module(inference_state, python_value_set, stub_module_node, file
         python_value_set, inference_state, stub_module_node,
         file_io=file_io,
         string_names=import_names,
-        # The code was loaded with latest_grammar, so use
-        # that.
-        code_lines=get_cached_code_lines(inference_state.latest_grammar, file_io.path),
+        code_lines=code_lines,
         is_package=file_name == '__init__.pyi',
     )
     return stub_module_value
@@ -21,12 +21,14 @@ from jedi._compatibility import (FileNotFoundError, ImplicitNSInfo,
                                  force_unicode, unicode)
 from jedi import debug
 from jedi import settings
+from jedi.cache import use_library_module_tree
 from jedi.file_io import KnownContentFileIO, FileIO
 from jedi.parser_utils import get_cached_code_lines
 from jedi.inference import sys_path
 from jedi.inference import helpers
 from jedi.inference import compiled
 from jedi.inference import analysis
+from jedi.inference import call_sites
 from jedi.inference.utils import unite
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.names import ImportName, SubModuleName
@@ -481,13 +483,23 @@ def _load_python_module(inference_state, file_io,
     )
 
     from jedi.inference.value import ModuleValue
-    return ModuleValue(
+    module = ModuleValue(
         inference_state, module_node,
         file_io=file_io,
         string_names=import_names,
         code_lines=get_cached_code_lines(inference_state.grammar, file_io.path),
         is_package=is_package,
     )
+    if _is_library_path(inference_state, file_io.path):
+        use_library_module_tree(inference_state.grammar._hashed, file_io.path)
+    return module
+
+
+def _is_library_path(inference_state, path):
+    if 'site-packages' in path or 'dist-packages' in path:
+        return True
+    project_path = inference_state.project._path
+    return not path.startswith(os.path.join(project_path, ''))
 
 
 def _load_builtin_module(inference_state, import_names=None, sys_path=None):
@@ -532,9 +544,11 @@ def load_module_from_path(inference_state, file_io, base_names=None):
     return module
 
 
-def get_module_contexts_containing_name(inference_state, module_contexts, name):
+def get_module_contexts_containing_name(inference_state, module_contexts, name,
+                                        only_calls=False):
     """
-    Search a name in the directories of modules.
+    Search a name in the directories of modules. If ``only_calls`` is True,
+    only modules that call the name are searched.
     """
     def check_directory(folder_io):
         for file_name in folder_io.list():
@@ -575,7 +589,11 @@ def get_module_contexts_containing_name(inference_state, module_contexts, name):
 
     def get_file_ios_to_check():
         for folder_io, base_names in folders_with_names_to_be_checked:
-            for file_io in check_directory(folder_io):
+            file_ios = check_directory(folder_io)
+            if only_calls:
+                file_ios = call_sites.filter_calling_files(
+                    folder_io.path, list(file_ios), name)
+            for file_io in file_ios:
                 if file_io.path not in used_mod_paths:
                     yield file_io, base_names
 
@@ -3,6 +3,8 @@ from jedi.common.utils import monkeypatch
 
 
 class AbstractLazyValue(object):
+    __slots__ = ('data',)
+
     def __init__(self, data):
         self.data = data
 
@@ -15,17 +17,23 @@ class AbstractLazyValue(object):
 
 class LazyKnownValue(AbstractLazyValue):
     """data is a Value."""
+    __slots__ = ()
+
     def infer(self):
         return ValueSet([self.data])
 
 
 class LazyKnownValues(AbstractLazyValue):
     """data is a ValueSet."""
+    __slots__ = ()
+
     def infer(self):
         return self.data
 
 
 class LazyUnknownValue(AbstractLazyValue):
+    __slots__ = ()
+
     def __init__(self):
         super(LazyUnknownValue, self).__init__(None)
 
@@ -34,6 +42,8 @@ class LazyUnknownValue(AbstractLazyValue):
 
 
 class LazyTreeValue(AbstractLazyValue):
+    __slots__ = ('context', '_predefined_names')
+
     def __init__(self, context, node):
         super(LazyTreeValue, self).__init__(node)
         self.context = context
@@ -55,5 +65,7 @@ def get_merged_lazy_value(lazy_values):
 
 class MergedLazyValues(AbstractLazyValue):
     """data is a list of lazy values."""
+    __slots__ = ()
+
     def infer(self):
         return ValueSet.from_sets(l.infer() for l in self.data)
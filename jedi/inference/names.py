@@ -24,6 +24,8 @@ def _merge_name_docs(names):
 
 
 class AbstractNameDefinition(object):
+    __slots__ = ()
+
     start_pos = None
     string_name = None
     parent_context = None
@@ -105,6 +107,8 @@ class AbstractArbitraryName(AbstractNameDefinition):
 
 
 class AbstractTreeName(AbstractNameDefinition):
+    __slots__ = ('parent_context', 'tree_name')
+
     def __init__(self, parent_context, tree_name):
         self.parent_context = parent_context
         self.tree_name = tree_name
@@ -224,6 +228,8 @@ class AbstractTreeName(AbstractNameDefinition):
 
 
 class ValueNameMixin(object):
+    __slots__ = ()
+
     def infer(self):
         return ValueSet([self._value])
 
@@ -250,6 +256,8 @@ class ValueNameMixin(object):
 
 
 class ValueName(ValueNameMixin, AbstractTreeName):
+    __slots__ = ('_value',)
+
     def __init__(self, value, tree_name):
         super(ValueName, self).__init__(value.parent_context, tree_name)
         self._value = value
@@ -259,6 +267,8 @@ class ValueName(ValueNameMixin, AbstractTreeName):
 
 
 class TreeNameDefinition(AbstractTreeName):
+    __slots__ = ()
+
     _API_TYPES = dict(
         import_name='module',
         import_from='module',
@@ -341,6 +351,8 @@ class TreeNameDefinition(AbstractTreeName):
 
 
 class _ParamMixin(object):
+    __slots__ = ()
+
     def maybe_positional_argument(self, include_star=True):
         options = [Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD]
         if include_star:
@@ -366,6 +378,8 @@ class _ParamMixin(object):
 
 
 class ParamNameInterface(_ParamMixin):
+    __slots__ = ()
+
     api_type = u'param'
 
     def get_kind(self):
@@ -396,6 +410,8 @@ class ParamNameInterface(_ParamMixin):
 
 
 class BaseTreeParamName(ParamNameInterface, AbstractTreeName):
+    __slots__ = ()
+
     annotation_node = None
     default_node = None
 
@@ -422,6 +438,8 @@ class BaseTreeParamName(ParamNameInterface, AbstractTreeName):
 
 
 class _ActualTreeParamName(BaseTreeParamName):
+    __slots__ = ('function_value',)
+
     def __init__(self, function_value, tree_name):
         super(_ActualTreeParamName, self).__init__(
             function_value.get_default_param_context(), tree_name)
@@ -491,6 +509,8 @@ class _ActualTreeParamName(BaseTreeParamName):
 
 
 class AnonymousParamName(_ActualTreeParamName):
+    __slots__ = ()
+
     @plugin_manager.decorate(name='goto_anonymous_param')
     def goto(self):
         return super(AnonymousParamName, self).goto()
@@ -520,6 +540,8 @@ class AnonymousParamName(_ActualTreeParamName):
 
 
 class ParamName(_ActualTreeParamName):
+    __slots__ = ('arguments',)
+
     def __init__(self, function_value, tree_name, arguments):
         super(ParamName, self).__init__(function_value, tree_name)
         self.arguments = arguments
@@ -610,6 +632,8 @@ class NameWrapper(object):
 
 
 class StubNameMixin(object):
+    __slots__ = ()
+
     def py__doc__(self):
         from jedi.inference.gradual.conversion import convert_names
         # Stubs are not complicated and we can just follow simple statements
@@ -630,6 +654,8 @@ class StubNameMixin(object):
 
 # From here on down we make looking up the sys.version_info fast.
 class StubName(StubNameMixin, TreeNameDefinition):
+    __slots__ = ()
+
     def infer(self):
         inferred = super(StubName, self).infer()
         if self.string_name == 'version_info' and self.get_root_context().py__name__() == 'sys':
@@ -0,0 +1,135 @@
+"""
+Huge files (usually generated code like SWIG wrappers) are too slow to be
+parsed completely. Instead of parsing only the beginning of such a file, Jedi
+parses an outline of it: The bodies of all functions are replaced by empty
+lines. Classes, function signatures, docstrings and all the other statements
+are kept at the same positions, so the definitions of the whole file are
+still known.
+
+This is done with a fast scan of the lines that only keeps track of strings,
+brackets and indentation, because tokenizing the file would already be too
+slow.
+
+The function around the position that is being worked on is kept completely,
+so completions and the like work within its body.
+"""
+import re
+
+from parso import split_lines
+
+_DEF_PATTERN = re.compile(r'(?:async[ \t]+)?def[ \t]')
+_STRING_START_PATTERN = re.compile(r'[rRbBuUfF]{0,2}["\']')
+_LINE_TOKEN_PATTERN = re.compile(r'"""|\'\'\'|["\'#()\[\]{}]|\\\r?\n')
+_STRING_END_PATTERNS = dict(
+    (quote, re.compile(r'\\.|' + quote, re.DOTALL))
+    for quote in ('"', "'", '"""', "'''")
+)
+
+
+def _scan_line(line, quote, depth):
+    """
+    Returns the string that is still open after the line, the bracket depth
+    and if the logical line continues on the next line.
+    """
+    pos = 0
+    while True:
+        if quote is not None:
+            end_pattern = _STRING_END_PATTERNS[quote]
+            while True:
+                match = end_pattern.search(line, pos)
+                if match is None:
+                    if len(quote) == 1 and not line.endswith(('\\\n', '\\\r\n')):
+                        # An unterminated string, it ends with the line.
+                        quote = None
+                    return quote, depth, quote is not None or depth > 0
+                pos = match.end()
+                if match.group() == quote:
+                    quote = None
+                    break
+
+        match = _LINE_TOKEN_PATTERN.search(line, pos)
+        if match is None or match.group() == '#':
+            return None, depth, depth > 0
+        token = match.group()
+        pos = match.end()
+        if token in ('(', '[', '{'):
+            depth += 1
+        elif token in (')', ']', '}'):
+            depth = max(depth - 1, 0)
+        elif token.startswith('\\'):
+            return None, depth, True
+        else:
+            quote = token
+
+
+def _get_line_ending(line):
+    return line[len(line.rstrip('\r\n')):]
+
+
+def get_outline(code, keep_line=None):
+    """
+    Returns the code with the bodies of all functions replaced by empty lines.
+    A docstring is kept, otherwise the first line of a body becomes ``pass``.
+    The function that contains the line ``keep_line`` is kept as it is.
+
+    Also returns the removed bodies as a list of ``(first_line, last_line)``.
+    """
+    lines = split_lines(code, keepends=True)
+    new_lines = []
+    removed_ranges = []
+    quote = None
+    depth = 0
+    continued = False
+    header_indent = None  # The indentation of an unfinished def statement.
+    def_indent = None  # The indentation of a def that waits for its body.
+    removed_indent = None  # The indentation of the def that is removed.
+    kept_indent = None  # The indentation of the def around ``keep_line``.
+    removed_start = None
+    keep_logical_line = False
+
+    for line_nr, line in enumerate(lines, 1):
+        new_line = line
+        if not continued:
+            keep_logical_line = False
+            stripped = line.lstrip(' \t\f')
+            indent = len(line) - len(stripped)
+            is_code = bool(stripped) and stripped[0] not in '#\r\n'
+            if is_code:
+                if removed_indent is not None and indent <= removed_indent:
+                    removed_ranges.append((removed_start, line_nr - 1))
+                    removed_indent = None
+                if kept_indent is not None and indent <= kept_indent:
+                    kept_indent = None
+                if def_indent is not None:
+                    if indent > def_indent:
+                        removed_indent = def_indent
+                        removed_start = line_nr
+                        if _STRING_START_PATTERN.match(stripped):
+                            keep_logical_line = True
+                        else:
+                            new_line = line[:indent] + 'pass' + _get_line_ending(line)
+                    def_indent = None
+                if removed_indent is None and kept_indent is None \
+                        and _DEF_PATTERN.match(stripped):
+                    header_indent = indent
+
+        if removed_indent is not None and line_nr == keep_line:
+            # Restore the body of this function and keep the rest of it.
+            new_lines[removed_start - 1:] = lines[removed_start - 1:line_nr - 1]
+            new_line = line
+            kept_indent = removed_indent
+            removed_indent = None
+
+        if removed_indent is not None and not keep_logical_line \
+                and new_line is line:
+            new_line = _get_line_ending(line)
+        new_lines.append(new_line)
+
+        quote, depth, continued = _scan_line(line, quote, depth)
+        if not continued and header_indent is not None:
+            def_indent = header_indent
+            header_indent = None
+
+    if removed_indent is not None:
+        removed_ranges.append((removed_start, len(lines)))
+    return ''.join(new_lines), removed_ranges
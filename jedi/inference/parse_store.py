@@ -0,0 +1,272 @@
+"""
+The store of pickled syntax trees on the filesystem. Parsing library modules
+is slow, so their trees are pickled and loaded again in later sessions.
+
+The pickles use parso's format and location (one file per module within the
+cache directory), so parso loads them. Jedi writes them instead of parso for
+a few reasons:
+
+- The pickles are written atomically. Several editors often use Jedi at the
+  same time and a process should never load a half written pickle.
+- The access time of a pickle is updated when it is used.
+- The store is limited to :data:`jedi.settings.max_parse_cache_size` bytes.
+  If it gets bigger, the least recently used pickles are deleted.
+
+The store can also be inspected and pruned with ``python -m jedi cache``.
+"""
+import os
+import time
+
+from parso import split_lines
+from parso.cache import parser_cache, load_module
+try:
+    from parso.cache import try_to_save_module
+except ImportError:
+    # parso < 0.7.1
+    from parso.cache import save_module as try_to_save_module
+try:
+    # These are private in parso. If they change, parso caches the trees on
+    # its own again.
+    from parso.cache import _get_hashed_path, _VERSION_TAG
+except ImportError:
+    _get_hashed_path = _VERSION_TAG = None
+
+from jedi._compatibility import pickle
+from jedi import settings
+from jedi import debug
+from jedi.common.utils import write_file_atomically
+from jedi.parser_utils import used_names_caches_removed
+
+# Pickles are deleted until the store is this much of the maximum size, so
+# that the garbage collection doesn't run again right away.
+_PRUNE_RATIO = 0.8
+# The garbage collection only runs once in a while, even with many processes.
+_GC_INTERVAL = 60 * 10
+_GC_STAMP_NAME = 'parse-cache-gc'
+# The access times are only updated from time to time, it's just for the
+# garbage collection.
+_ACCESS_TIME_RESOLUTION = 60 * 60
+
+
+def get_store_directories(cache_path):
+    """
+    Returns the store directories within a cache directory. There's one for
+    every Python implementation and version that Jedi ran with.
+    """
+    try:
+        names = sorted(os.listdir(cache_path))
+    except OSError:
+        return []
+    directories = [os.path.join(cache_path, name) for name in names]
+    return [
+        d for d in directories
+        if os.path.isdir(d) and any(True for _ in _iter_pickles(d))
+    ]
+
+
+def parse_module(grammar, code, file_io, cache_path=None, **kwargs):
+    """
+    Like parsing with ``cache=True`` in parso, but the pickle is written by
+    the store.
+    """
+    if _VERSION_TAG is None:
+        return grammar.parse(
+            code, file_io=file_io, cache=True, cache_path=cache_path, **kwargs)
+    module = load_module(grammar._hashed, file_io, cache_path=cache_path)
+    if module is None:
+        module = grammar.parse(code, file_io=file_io, **kwargs)
+        if file_io.path not in parser_cache.get(grammar._hashed, {}):
+            try_to_save_module(
+                grammar._hashed, file_io, module,
+                split_lines(code, keepends=True),
+                pickling=False,
+            )
+    if settings.use_filesystem_cache and file_io.path is not None:
+        save_module(grammar, file_io.path, cache_path=cache_path)
+    return module
+
+
+def save_module(grammar, path, cache_path=None):
+    """
+    Pickles the tree of a module in parso's parser cache, unless there's
+    already a pickle of it. If there is one, it's marked as used.
+    """
+    try:
+        item = parser_cache[grammar._hashed][path]
+    except KeyError:
+        return
+
+    pickle_path = _get_pickle_path(grammar, path, cache_path)
+    if pickle_path is None:
+        return
+    try:
+        stat = os.stat(pickle_path)
+    except OSError:
+        stat = None
+
+    now = time.time()
+    if stat is not None and item.change_time is not None \
+            and stat.st_mtime >= item.change_time:
+        if stat.st_atime + _ACCESS_TIME_RESOLUTION < now:
+            try:
+                os.utime(pickle_path, (now, stat.st_mtime))
+            except OSError:
+                pass
+        return
+
+    try:
+        write_file_atomically(
+            pickle_path,
+            _dumps(item)
+        )
+    except (IOError, OSError) as e:
+        debug.warning('Could not save the parser cache of %s: %s', path, e)
+        return
+    _collect_garbage_if_needed(os.path.dirname(pickle_path))
+
+
+def _get_pickle_path(grammar, path, cache_path):
+    if _get_hashed_path is None:
+        return None
+    return _get_hashed_path(grammar._hashed, path, cache_path=cache_path)
+
+
+def get_store_tag():
+    """
+    Returns a string that identifies the pickle format, pickles of other
+    formats cannot be loaded.
+    """
+    return _VERSION_TAG
+
+
+def get_valid_pickle(grammar, path, cache_path=None):
+    """
+    Returns the path of the pickle of a module if it's up to date, else None.
+    """
+    pickle_path = _get_pickle_path(grammar, path, cache_path)
+    if pickle_path is None:
+        return None
+    try:
+        if os.path.getmtime(pickle_path) >= os.path.getmtime(path):
+            return pickle_path
+    except OSError:
+        pass
+    return None
+
+
+def import_pickle(grammar, path, data, cache_path=None):
+    """
+    Stores a pickle of a module that was created elsewhere (e.g. on another
+    machine) for the module at ``path``. The caller has to make sure that the
+    code of the module is the same. Returns True if the pickle was stored.
+    """
+    pickle_path = _get_pickle_path(grammar, path, cache_path)
+    if pickle_path is None:
+        return False
+    try:
+        item = pickle.loads(data)
+    except Exception as e:
+        debug.warning('Could not load the pickle of %s: %s', path, e)
+        return False
+    # The pickle is used for the file as it is now.
+    item.change_time = item.last_used = time.time()
+    try:
+        write_file_atomically(
+            pickle_path,
+            _dumps(item)
+        )
+    except (IOError, OSError) as e:
+        debug.warning('Could not save the parser cache of %s: %s', path, e)
+        return False
+    return True
+
+
+def _dumps(item):
+    with used_names_caches_removed(item.node):
+        return pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+
+
+def _iter_pickles(directory):
+    try:
+        file_names = os.listdir(directory)
+    except OSError:
+        return
+    for file_name in file_names:
+        if not file_name.endswith('.pkl'):
+            continue
+        path = os.path.join(directory, file_name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Probably removed by another process.
+            continue
+        yield path, stat
+
+
+def _collect_garbage_if_needed(directory):
+    max_size = settings.max_parse_cache_size
+    if max_size is None:
+        return
+
+    stamp_path = os.path.join(directory, _GC_STAMP_NAME)
+    try:
+        if os.path.getmtime(stamp_path) + _GC_INTERVAL > time.time():
+            return
+    except OSError:
+        pass
+    # Touch the stamp first, so that other processes don't start collecting
+    # at the same time.
+    try:
+        write_file_atomically(stamp_path, b'')
+    except (IOError, OSError):
+        return
+    prune(directory, max_size)
+
+
+def prune(directory, max_size):
+    """
+    Deletes the least recently used pickles of a store directory until it's
+    smaller than ``max_size`` bytes. Returns the number of deleted pickles.
+    """
+    pickles = sorted(_iter_pickles(directory), key=lambda item: item[1].st_atime)
+    size = sum(stat.st_size for path, stat in pickles)
+    if size <= max_size:
+        return 0
+
+    removed = 0
+    for path, stat in pickles:
+        if size <= max_size * _PRUNE_RATIO:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        size -= stat.st_size
+        removed += 1
+    return removed
+
+
+def get_store_info(directory):
+    """
+    Returns the number of pickles and their size in bytes.
+    """
+    count = 0
+    size = 0
+    for path, stat in _iter_pickles(directory):
+        count += 1
+        size += stat.st_size
+    return count, size
+
+
+def clear_store(directory):
+    """
+    Deletes all pickles of a store directory. Returns their number.
+    """
+    removed = 0
+    for path, stat in _iter_pickles(directory):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        removed += 1
+    return removed
@@ -2,12 +2,14 @@
 Functions inferring the syntax tree.
 """
 import copy
+import itertools
 
 from parso.python import tree
 
 from jedi._compatibility import force_unicode, unicode
 from jedi import debug
 from jedi import parser_utils
+from jedi import settings
 from jedi.inference.base_value import ValueSet, NO_VALUES, ContextualizedNode, \
     iterator_to_value_set, iterate_values
 from jedi.inference.lazy_value import LazyTreeValue
@@ -23,7 +25,8 @@ from jedi.inference.value import TreeInstance
 from jedi.inference.helpers import is_string, is_literal, is_number, \
     get_names_of_node, is_big_annoying_library
 from jedi.inference.compiled.access import COMPARISON_OPERATORS
-from jedi.inference.cache import inference_state_method_cache
+from jedi.inference.cache import inference_state_method_cache, \
+    inference_state_function_cache
 from jedi.inference.gradual.stub_value import VersionInfo
 from jedi.inference.gradual import annotation
 from jedi.inference.names import TreeNameDefinition
@@ -483,36 +486,97 @@ def infer_factor(value_set, operator):
 def _literals_to_types(inference_state, result):
     # Changes literals ('a', 1, 1.0, etc) to its type instances (str(),
     # int(), float(), etc).
-    new_result = NO_VALUES
-    for typ in result:
-        if is_literal(typ):
-            # Literals are only valid as long as the operations are
-            # correct. Otherwise add a value-free instance.
-            cls = compiled.builtin_from_name(inference_state, typ.name.string_name)
-            new_result |= cls.execute_with_values()
-        else:
-            new_result |= ValueSet([typ])
+    classes, new_result = _split_literal_classes(inference_state, result)
+    for cls in classes:
+        # Literals are only valid as long as the operations are
+        # correct. Otherwise add a value-free instance.
+        new_result |= cls.execute_with_values()
     return new_result
 
 
+def _split_literal_classes(inference_state, values):
+    """
+    Returns the classes of all the literals and the values that are not
+    literals.
+    """
+    classes = []
+    other_values = []
+    for value in values:
+        if is_literal(value):
+            cls = compiled.builtin_from_name(inference_state, value.name.string_name)
+            if cls not in classes:
+                classes.append(cls)
+        else:
+            other_values.append(value)
+    return classes, ValueSet(other_values)
+
+
 def _infer_comparison(context, left_values, operator, right_values):
     state = context.inference_state
     if not left_values or not right_values:
         # illegal slices e.g. cause left/right_result to be None
         result = (left_values or NO_VALUES) | (right_values or NO_VALUES)
         return _literals_to_types(state, result)
-    else:
+
+    max_pairs = settings.max_operation_value_pairs
+    if len(left_values) * len(right_values) <= max_pairs:
+        return ValueSet.from_sets(
+            _infer_comparison_part(state, context, left, operator, right)
+            for left in left_values
+            for right in right_values
+        )
+
+    # Widen the value sets: Unions of literals like `1 if x else 2` are
+    # collapsed to instances of their class, so chained operations don't grow
+    # multiplicatively.
+    left_classes, left_others = _split_literal_classes(state, left_values)
+    right_classes, right_others = _split_literal_classes(state, right_values)
+    if (len(left_classes) + len(left_others)) \
+            * (len(right_classes) + len(right_others)) > max_pairs:
         # I don't think there's a reasonable chance that a string
         # operation is still correct, once we pass something like six
         # objects.
-        if len(left_values) * len(right_values) > 6:
-            return _literals_to_types(state, left_values | right_values)
-        else:
-            return ValueSet.from_sets(
-                _infer_comparison_part(state, context, left, operator, right)
-                for left in left_values
-                for right in right_values
-            )
+        return _literals_to_types(state, left_values | right_values)
+
+    if isinstance(operator, unicode):
+        str_operator = operator
+    else:
+        str_operator = force_unicode(str(operator.value))
+    result = ValueSet.from_sets(
+        _infer_class_operation(state, left_cls, str_operator, right_cls)
+        for left_cls in left_classes
+        for right_cls in right_classes
+    )
+    left_instances = ValueSet.from_sets(c.execute_with_values() for c in left_classes)
+    right_instances = ValueSet.from_sets(c.execute_with_values() for c in right_classes)
+    return result | ValueSet.from_sets(
+        _infer_comparison_part(state, context, left, operator, right)
+        for left, right in itertools.chain(
+            itertools.product(left_others, right_instances | right_others),
+            itertools.product(left_instances, right_others),
+        )
+    )
+
+
+@inference_state_function_cache()
+def _infer_class_operation(inference_state, left_cls, str_operator, right_cls):
+    """
+    The result of an operation between two value-free instances only depends
+    on their classes, which makes it cacheable.
+    """
+    if str_operator in COMPARISON_OPERATORS:
+        # Two arbitrary instances can compare either way.
+        return ValueSet([
+            _bool_to_value(inference_state, True),
+            _bool_to_value(inference_state, False)
+        ])
+    # The context is only used for reporting operations between numbers and
+    # other objects, but value-free instances are never numbers.
+    return ValueSet.from_sets(
+        _infer_comparison_part(inference_state, None, left, str_operator, right)
+        for left in left_cls.execute_with_values()
+        for right in right_cls.execute_with_values()
+    )
 
 
 def _is_annotation_name(name):
@@ -811,6 +875,8 @@ def check_tuple_assignments(name, value_set):
 
 
 class ContextualizedSubscriptListNode(ContextualizedNode):
+    __slots__ = ()
+
     def infer(self):
         return _infer_subscript_list(self.context, self.node)
 
@@ -202,6 +202,23 @@ def _get_buildout_script_paths(search_path):
             continue
 
 
+def get_buildout_script_dependencies(search_path):
+    """
+    Returns the paths that :func:`discover_buildout_paths` depends on apart
+    from the parent directories of ``search_path``. If one of them changes,
+    the buildout paths need to be discovered again.
+    """
+    project_root = _get_parent_dir_with_file(search_path, 'buildout.cfg')
+    if not project_root:
+        return []
+    bin_path = os.path.join(project_root, 'bin')
+    try:
+        names = os.listdir(bin_path)
+    except OSError:
+        return [bin_path]
+    return [bin_path] + [os.path.join(bin_path, name) for name in sorted(names)]
+
+
 def remove_python_path_suffix(path):
     for suffix in all_suffixes():
         if path.endswith(suffix):
@@ -221,44 +238,97 @@ def transform_path_to_dotted(sys_path, module_path):
     Returns (None, False) if the path doesn't really resolve to anything.
     The second return part is if it is a package.
     """
-    # First remove the suffix.
-    module_path = remove_python_path_suffix(module_path)
-
-    # Once the suffix was removed we are using the files as we know them. This
-    # means that if someone uses an ending like .vim for a Python file, .vim
-    # will be part of the returned dotted part.
-
-    is_package = module_path.endswith(os.path.sep + '__init__')
-    if is_package:
-        # -1 to remove the separator
-        module_path = module_path[:-len('__init__') - 1]
-
-    def iter_potential_solutions():
-        for p in sys_path:
-            if module_path.startswith(p):
-                # Strip the trailing slash/backslash
-                rest = module_path[len(p):]
-                # On Windows a path can also use a slash.
-                if rest.startswith(os.path.sep) or rest.startswith('/'):
-                    # Remove a slash in cases it's still there.
-                    rest = rest[1:]
-
-                if rest:
-                    split = rest.split(os.path.sep)
-                    if not all(split):
-                        # This means that part of the file path was empty, this
-                        # is very strange and is probably a file that is called
-                        # `.py`.
-                        return
-                    yield tuple(split)
-
-    potential_solutions = tuple(iter_potential_solutions())
-    if not potential_solutions:
-        return None, False
-    # Try to find the shortest path, this makes more sense usually, because the
-    # user usually has venvs somewhere. This means that a path like
-    # .tox/py37/lib/python3.7/os.py can be normal for a file. However in that
-    # case we definitely want to return ['os'] as a path and not a crazy
-    # ['.tox', 'py37', 'lib', 'python3.7', 'os']. Keep in mind that this is a
-    # heuristic and there's now ay to "always" do it right.
-    return sorted(potential_solutions, key=lambda p: len(p))[0], is_package
+    return get_module_path_resolver(sys_path).transform(module_path)
+
+
+_resolver_cache = {}
+_MAX_CACHED_RESOLVERS = 16
+
+
+def get_module_path_resolver(sys_path):
+    """
+    Returns a :class:`ModulePathResolver` for the given sys path. Resolvers are
+    shared, because they are usually needed for the same few sys paths.
+    """
+    key = tuple(sys_path)
+    try:
+        return _resolver_cache[key]
+    except KeyError:
+        if len(_resolver_cache) >= _MAX_CACHED_RESOLVERS:
+            _resolver_cache.clear()
+        resolver = _resolver_cache[key] = ModulePathResolver(key)
+        return resolver
+
+
+def _split_path(path):
+    if os.path.altsep:
+        # On Windows a path can also use a slash.
+        path = path.replace(os.path.altsep, os.path.sep)
+    return path.split(os.path.sep)
+
+
+# Marks a node in the trie that is a sys path entry. Path parts are always
+# strings, so this never clashes with an actual path part.
+_SYS_PATH_ENTRY = None
+
+
+class ModulePathResolver(object):
+    """
+    Maps file paths to dotted module names for a sys path. The sys path
+    entries are stored in a trie of path parts, so that finding the longest
+    sys path entry that contains a file is linear in the depth of the path and
+    not in the length of the sys path.
+    """
+    def __init__(self, sys_path):
+        self._root = {}
+        for path in sys_path:
+            parts = _split_path(path)
+            # Strip the trailing slash/backslash, but keep the root.
+            while len(parts) > 1 and not parts[-1]:
+                parts.pop()
+            node = self._root
+            for part in parts:
+                node = node.setdefault(part, {})
+            node[_SYS_PATH_ENTRY] = True
+
+    def transform(self, module_path):
+        """
+        See :func:`transform_path_to_dotted`.
+        """
+        # First remove the suffix.
+        module_path = remove_python_path_suffix(module_path)
+
+        # Once the suffix was removed we are using the files as we know them.
+        # This means that if someone uses an ending like .vim for a Python
+        # file, .vim will be part of the returned dotted part.
+
+        is_package = module_path.endswith(os.path.sep + '__init__')
+        if is_package:
+            # -1 to remove the separator
+            module_path = module_path[:-len('__init__') - 1]
+
+        parts = _split_path(module_path)
+        # Try to find the longest sys path entry, which leads to the shortest
+        # dotted path, this makes more sense usually, because the user usually
+        # has venvs somewhere. This means that a path like
+        # .tox/py37/lib/python3.7/os.py can be normal for a file. However in
+        # that case we definitely want to return ['os'] as a path and not a
+        # crazy ['.tox', 'py37', 'lib', 'python3.7', 'os']. Keep in mind that
+        # this is a heuristic and there's now ay to "always" do it right.
+        found = None
+        node = self._root
+        for i, part in enumerate(parts[:-1], 1):
+            node = node.get(part)
+            if node is None:
+                break
+            if _SYS_PATH_ENTRY in node:
+                found = i
+
+        if found is None:
+            return None, False
+        rest = parts[found:]
+        if not all(rest):
+            # This means that part of the file path was empty, this is very
+            # strange and is probably a file that is called `.py`.
+            return None, False
+        return tuple(rest), is_package
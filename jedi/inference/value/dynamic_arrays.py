@@ -19,6 +19,8 @@ It is important to note that:
 1. Array modfications work only in the current module.
 2. Jedi only checks Array additions; ``list.pop``, etc are ignored.
 """
+from bisect import bisect_left, bisect_right
+
 from jedi import debug
 from jedi import settings
 from jedi.inference import recursion
@@ -27,9 +29,100 @@ from jedi.inference.base_value import ValueSet, NO_VALUES, HelperValueMixin, \
 from jedi.inference.lazy_value import LazyKnownValues
 from jedi.inference.helpers import infer_call_of_leaf
 from jedi.inference.cache import inference_state_method_cache
+from jedi.parser_utils import UsedNamesCache
 
 _sentinel = object()
 
+_mutation_index_cache = UsedNamesCache()
+
+
+class _MutationIndex(object):
+    """
+    All the calls like ``foo.append(1)`` of a module, sorted by position. This
+    only depends on the syntax tree and is therefore calculated once per
+    module.
+    """
+    def __init__(self, module_node):
+        self._used_names = module_node.get_used_names()
+        self._sites = {}
+        self._literal_bindings = {}
+
+    def get_sites(self, add_name, scope_node):
+        """
+        Returns tuples of (name, power, execution trailer, receiver) of
+        ``add_name`` calls within ``scope_node``. The receiver is the name
+        leaf of simple calls like ``foo.append(1)``, otherwise None.
+        """
+        try:
+            positions, sites = self._sites[add_name]
+        except KeyError:
+            positions, sites = self._sites[add_name] = self._find_sites(add_name)
+
+        start = bisect_right(positions, scope_node.start_pos)
+        end = bisect_left(positions, scope_node.end_pos)
+        return sites[start:end]
+
+    def _find_sites(self, add_name):
+        sites = []
+        for name in sorted(self._used_names.get(add_name, ()),
+                           key=lambda name: name.start_pos):
+            trailer = name.parent
+            power = trailer.parent
+            if trailer.type != 'trailer' or power.type not in ('power', 'atom_expr'):
+                continue
+            trailer_pos = power.children.index(trailer)
+            try:
+                execution_trailer = power.children[trailer_pos + 1]
+            except IndexError:
+                continue
+            if execution_trailer.type != 'trailer' \
+                    or execution_trailer.children[0] != '(' \
+                    or execution_trailer.children[1] == ')':
+                continue
+
+            receiver = None
+            if trailer_pos == 1 and power.children[0].type == 'name':
+                receiver = power.children[0]
+            sites.append((name, power, execution_trailer, receiver))
+        return [site[0].start_pos for site in sites], sites
+
+    def get_literal_bindings(self, string_name):
+        """
+        Returns the list/set literals a name is assigned to, if the name is
+        only ever assigned to list/set literals in this module (``foo = []``),
+        otherwise None.
+        """
+        try:
+            return self._literal_bindings[string_name]
+        except KeyError:
+            pass
+
+        atoms = set()
+        for name in self._used_names.get(string_name, ()):
+            if not name.is_definition():
+                continue
+            stmt = name.parent
+            if stmt.type != 'expr_stmt' \
+                    or any(c != '=' and c.type != 'name' for c in stmt.children[:-1]):
+                atoms = None
+                break
+            atom = stmt.children[-1]
+            if atom.type != 'atom' or atom.children[0] not in ('[', '{'):
+                atoms = None
+                break
+            atoms.add(atom)
+        self._literal_bindings[string_name] = atoms
+        return atoms
+
+
+def _get_mutation_index(module_node):
+    used_names = module_node.get_used_names()
+    try:
+        return _mutation_index_cache[used_names]
+    except KeyError:
+        index = _mutation_index_cache[used_names] = _MutationIndex(module_node)
+        return index
+
 
 def check_array_additions(context, sequence):
     """ Just a mapper function for the internal _internal_check_array_additions """
@@ -70,34 +163,23 @@ def _internal_check_array_additions(context, sequence):
                 result |= set(lazy_value.infer().iterate())
         return result
 
-    temp_param_add, settings.dynamic_params_for_other_modules = \
-        settings.dynamic_params_for_other_modules, False
-
     is_list = sequence.name.string_name == 'list'
     search_names = (['append', 'extend', 'insert'] if is_list else ['add', 'update'])
+    mutation_index = _get_mutation_index(module_context.tree_node)
+    sequence_atom = getattr(sequence, 'atom', None)
 
+    temp_param_add, settings.dynamic_params_for_other_modules = \
+        settings.dynamic_params_for_other_modules, False
     added_types = set()
-    for add_name in search_names:
-        try:
-            possible_names = module_context.tree_node.get_used_names()[add_name]
-        except KeyError:
-            continue
-        else:
-            for name in possible_names:
-                value_node = context.tree_node
-                if not (value_node.start_pos < name.start_pos < value_node.end_pos):
-                    continue
-                trailer = name.parent
-                power = trailer.parent
-                trailer_pos = power.children.index(trailer)
-                try:
-                    execution_trailer = power.children[trailer_pos + 1]
-                except IndexError:
-                    continue
-                else:
-                    if execution_trailer.type != 'trailer' \
-                            or execution_trailer.children[0] != '(' \
-                            or execution_trailer.children[1] == ')':
+    try:
+        for add_name in search_names:
+            for name, power, execution_trailer, receiver in \
+                    mutation_index.get_sites(add_name, context.tree_node):
+                if receiver is not None:
+                    atoms = mutation_index.get_literal_bindings(receiver.value)
+                    if atoms is not None and sequence_atom not in atoms:
+                        # The name only refers to other literals, there's no
+                        # need to infer it.
                         continue
 
                 random_context = context.create_context(name)
@@ -116,9 +198,9 @@ def _internal_check_array_additions(context, sequence):
                                 execution_trailer.children[1],
                                 add_name
                             )
-
-    # reset settings
-    settings.dynamic_params_for_other_modules = temp_param_add
+    finally:
+        # reset settings
+        settings.dynamic_params_for_other_modules = temp_param_add
     debug.dbg('Dynamic array result %s', added_types, color='MAGENTA')
     return added_types
 
@@ -172,6 +172,8 @@ class MethodValue(FunctionValue):
 
 
 class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
+    __slots__ = ()
+
     def is_function_execution(self):
         return True
 
@@ -313,8 +315,9 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
                 generics = (yield_values.py__class__(), NO_VALUES)
                 return ValueSet(
                     # In Python 3.6 AsyncGenerator is still a class.
-                    GenericClass(c, TupleGenericManager(generics))
-                    for c in async_generator_classes
+                    GenericClass.create_cached(
+                        inference_state, c, TupleGenericManager(generics)
+                    ) for c in async_generator_classes
                 ).execute_annotation()
             else:
                 if inference_state.environment.version_info < (3, 5):
@@ -324,7 +327,9 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
                 # Only the first generic is relevant.
                 generics = (return_values.py__class__(), NO_VALUES, NO_VALUES)
                 return ValueSet(
-                    GenericClass(c, TupleGenericManager(generics)) for c in async_classes
+                    GenericClass.create_cached(
+                        inference_state, c, TupleGenericManager(generics)
+                    ) for c in async_classes
                 ).execute_annotation()
         else:
             if self.is_generator():
@@ -334,6 +339,8 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
 
 
 class FunctionExecutionContext(BaseFunctionExecutionContext):
+    __slots__ = ('_arguments',)
+
     def __init__(self, function_value, arguments):
         super(FunctionExecutionContext, self).__init__(function_value)
         self._arguments = arguments
@@ -358,6 +365,8 @@ class FunctionExecutionContext(BaseFunctionExecutionContext):
 
 
 class AnonymousFunctionExecution(BaseFunctionExecutionContext):
+    __slots__ = ()
+
     def _infer_annotations(self):
         # I don't think inferring anonymous executions is a big thing.
         # Anonymous contexts are mostly there for the user to work in. ~ dave
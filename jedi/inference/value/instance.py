@@ -7,7 +7,8 @@ from jedi import settings
 from jedi.inference import compiled
 from jedi.inference.compiled.value import CompiledObjectFilter
 from jedi.inference.helpers import values_from_qualified_names, is_big_annoying_library
-from jedi.inference.filters import AbstractFilter, AnonymousFunctionExecutionFilter
+from jedi.inference.filters import AbstractFilter, AnonymousFunctionExecutionFilter, \
+    get_attribute_name_keys
 from jedi.inference.names import ValueName, TreeNameDefinition, ParamName, \
     NameWrapper
 from jedi.inference.base_value import Value, NO_VALUES, ValueSet, \
@@ -59,6 +60,8 @@ class AnonymousMethodExecutionFilter(AnonymousFunctionExecutionFilter):
 
 
 class AnonymousMethodExecutionContext(BaseFunctionExecutionContext):
+    __slots__ = ('instance',)
+
     def __init__(self, instance, value):
         super(AnonymousMethodExecutionContext, self).__init__(value)
         self.instance = instance
@@ -82,6 +85,8 @@ class AnonymousMethodExecutionContext(BaseFunctionExecutionContext):
 
 
 class MethodExecutionContext(FunctionExecutionContext):
+    __slots__ = ('instance',)
+
     def __init__(self, instance, *args, **kwargs):
         super(MethodExecutionContext, self).__init__(*args, **kwargs)
         self.instance = instance
@@ -580,6 +585,9 @@ class SelfAttributeFilter(ClassFilter):
         )
         self._instance = instance
 
+    def _get_name_keys(self):
+        return get_attribute_name_keys(self._used_names).get(self._parser_scope, ())
+
     def _filter(self, names):
         start, end = self._parser_scope.start_pos, self._parser_scope.end_pos
         names = [n for n in names if start < n.start_pos < end]
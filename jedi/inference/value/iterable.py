@@ -3,8 +3,9 @@ Contains all classes and functions to deal with lists, dicts, generators and
 iterators in general.
 """
 import sys
+from ast import literal_eval
 
-from jedi._compatibility import force_unicode, is_py3
+from jedi._compatibility import force_unicode, is_py3, unicode
 from jedi.inference import compiled
 from jedi.inference import analysis
 from jedi.inference.lazy_value import LazyKnownValue, LazyKnownValues, \
@@ -17,10 +18,18 @@ from jedi.inference.filters import LazyAttributeOverwrite, publish_method
 from jedi.inference.base_value import ValueSet, Value, NO_VALUES, \
     ContextualizedNode, iterate_values, sentinel, \
     LazyValueWrapper
+from jedi.cache import memoize_method
 from jedi.parser_utils import get_sync_comp_fors
 from jedi.inference.context import CompForContext
 from jedi.inference.value.dynamic_arrays import check_array_additions
 
+# Literals with more entries than this are not inferred entry by entry anymore,
+# but summarized by the types of their entries.
+_LARGE_LITERAL_SIZE = 200
+# How many entries of a huge literal with the same kind of expression (e.g.
+# nested dicts) are inferred for the summary.
+_SUMMARY_SAMPLE_SIZE = 3
+
 
 class IterableMixin(object):
     def py__stop_iteration_returns(self):
@@ -197,7 +206,8 @@ class Sequence(LazyAttributeOverwrite, IterableMixin):
         from jedi.inference.gradual.base import GenericClass
         from jedi.inference.gradual.generics import TupleGenericManager
         klass = compiled.builtin_from_name(self.inference_state, self.array_type)
-        c, = GenericClass(
+        c, = GenericClass.create_cached(
+            self.inference_state,
             klass,
             TupleGenericManager(self._get_generics())
         ).execute_annotation()
@@ -343,6 +353,14 @@ class SequenceLiteralValue(Sequence):
         While values returns the possible values for any array field, this
         function returns the value for a certain index.
         """
+        if self.is_large():
+            # Inferring every entry would take forever, so huge literals only
+            # yield a summary of their types.
+            yield LazyKnownValues(self._get_summary(tuple(self.get_tree_entries())))
+            for addition in check_array_additions(self._defining_context, self):
+                yield addition
+            return
+
         for node in self.get_tree_entries():
             if node == ':' or node.type == 'subscript':
                 # TODO this should probably use at least part of the code
@@ -357,6 +375,44 @@ class SequenceLiteralValue(Sequence):
         # This function is not really used often. It's more of a try.
         return len(self.get_tree_entries())
 
+    def is_large(self):
+        return len(self.get_tree_entries()) > _LARGE_LITERAL_SIZE
+
+    @memoize_method
+    def _get_summary(self, nodes):
+        """
+        Returns the types of all the given nodes. Literals are not inferred,
+        their type is known from the syntax tree. Of all the other
+        expressions only a few of each kind are inferred.
+        """
+        classes = []
+        values = NO_VALUES
+        sampled = {}
+        for node in nodes:
+            if node == ':' or node.type == 'subscript':
+                continue
+            class_name = _get_literal_class_name(self.inference_state, node)
+            if class_name is not None:
+                if class_name not in classes:
+                    classes.append(class_name)
+                continue
+
+            if node.type == 'atom':
+                # Nested literals like dicts or lists
+                key = node.children[0].value
+            else:
+                key = node.get_code(include_prefix=False)
+            count = sampled.get(key, 0)
+            if count < _SUMMARY_SAMPLE_SIZE:
+                sampled[key] = count + 1
+                values |= self._defining_context.infer_node(node)
+
+        for class_name in classes:
+            cls = compiled.builtin_from_name(self.inference_state, class_name)
+            values |= cls.execute_with_values()
+        return values
+
+    @memoize_method
     def get_tree_entries(self):
         c = self.atom.children
 
@@ -407,7 +463,15 @@ class SequenceLiteralValue(Sequence):
         Returns a generator of tuples like dict.items(), where the key is
         resolved (as a string) and the values are still lazy values.
         """
-        for key_node, value in self.get_tree_entries():
+        if self.is_large():
+            key_index, other_entries = self._get_key_index()
+            for key, value in key_index.items():
+                if isinstance(key, unicode):
+                    yield key, LazyTreeValue(self._defining_context, value)
+        else:
+            other_entries = self.get_tree_entries()
+
+        for key_node, value in other_entries:
             for key in self._defining_context.infer_node(key_node):
                 if is_string(key):
                     yield key.get_safe_value(), LazyTreeValue(self._defining_context, value)
@@ -426,8 +490,18 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
 
     def py__simple_getitem__(self, index):
         """Here the index is an int/str. Raises IndexError/KeyError."""
+        entries = self.get_tree_entries()
+        if self.is_large():
+            key_index, entries = self._get_key_index()
+            try:
+                value_node = key_index[index]
+            except (KeyError, TypeError):
+                pass
+            else:
+                return self._defining_context.infer_node(value_node)
+
         compiled_obj_index = compiled.create_simple_object(self.inference_state, index)
-        for key, value in self.get_tree_entries():
+        for key, value in entries:
             for k in self._defining_context.infer_node(key):
                 try:
                     method = k.execute_operation
@@ -444,9 +518,10 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
         function returns the value for a certain index.
         """
         # Get keys.
-        types = NO_VALUES
-        for k, _ in self.get_tree_entries():
-            types |= self._defining_context.infer_node(k)
+        types = self._dict_keys()
+        if self.is_large():
+            yield LazyKnownValues(types)
+            return
         # We don't know which dict index comes first, therefore always
         # yield all the types.
         for _ in types:
@@ -459,28 +534,115 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
 
     @publish_method('items')
     def _imitate_items(self):
-        lazy_values = [
-            LazyKnownValue(FakeTuple(
+        if self.is_large():
+            lazy_values = [LazyKnownValue(FakeTuple(
                 self.inference_state,
-                (LazyTreeValue(self._defining_context, key_node),
-                 LazyTreeValue(self._defining_context, value_node))
-            )) for key_node, value_node in self.get_tree_entries()
-        ]
+                (LazyKnownValues(self._dict_keys()),
+                 LazyKnownValues(self._dict_values()))
+            ))]
+        else:
+            lazy_values = [
+                LazyKnownValue(FakeTuple(
+                    self.inference_state,
+                    (LazyTreeValue(self._defining_context, key_node),
+                     LazyTreeValue(self._defining_context, value_node))
+                )) for key_node, value_node in self.get_tree_entries()
+            ]
 
         return ValueSet([FakeList(self.inference_state, lazy_values)])
 
     def _dict_values(self):
+        if self.is_large():
+            return self._get_summary(tuple(v for k, v in self.get_tree_entries()))
         return ValueSet.from_sets(
             self._defining_context.infer_node(v)
             for k, v in self.get_tree_entries()
         )
 
     def _dict_keys(self):
+        if self.is_large():
+            return self._get_summary(tuple(k for k, v in self.get_tree_entries()))
         return ValueSet.from_sets(
             self._defining_context.infer_node(k)
             for k, v in self.get_tree_entries()
         )
 
+    @memoize_method
+    def _get_key_index(self):
+        """
+        Returns a dict of all the keys that are literals (as Python objects)
+        to their value nodes and a list of all the other entries.
+        """
+        key_index = {}
+        other_entries = []
+        for key_node, value_node in self.get_tree_entries():
+            key = _get_literal_key(self.inference_state, key_node)
+            if key is None:
+                other_entries.append((key_node, value_node))
+            else:
+                # Like in Python, the last key wins.
+                key_index[key] = value_node
+        return key_index, other_entries
+
+    def get_key_values(self):
+        if self.is_large():
+            # The keys are needed exactly for completions, but inferring all
+            # of them is not necessary.
+            key_index, other_entries = self._get_key_index()
+            return ValueSet(
+                compiled.create_simple_object(self.inference_state, key)
+                for key in key_index
+            ) | ValueSet.from_sets(
+                self._defining_context.infer_node(k)
+                for k, v in other_entries
+            )
+        return self._dict_keys()
+
+
+def _get_literal_class_name(inference_state, node):
+    """
+    Returns the name of the builtin class of a literal node like ``1`` or
+    ``'foo'`` without inferring it.
+    """
+    if node.type == 'number':
+        value = node.value.lower()
+        if value.endswith('j'):
+            return u'complex'
+        if value.startswith(('0x', '0o', '0b')):
+            return u'int'
+        if '.' in value or 'e' in value:
+            return u'float'
+        return u'int'
+    elif node.type == 'string':
+        prefix = node.string_prefix.lower()
+        if inference_state.environment.version_info.major == 2:
+            return u'unicode' if 'u' in prefix else u'str'
+        if 'b' in prefix:
+            return u'bytes'
+        return u'str'
+    elif node.type == 'keyword' and node.value in ('True', 'False'):
+        return u'bool'
+    return None
+
+
+def _get_literal_key(inference_state, node):
+    """
+    Returns the Python object of a literal dict key or None.
+    """
+    if node.type == 'number' or node.type == 'string' \
+            and 'f' not in node.string_prefix.lower():
+        if node.type == 'string' \
+                and inference_state.environment.version_info.major == 2:
+            # The string types differ between the versions, infer it.
+            return None
+        try:
+            return literal_eval(node.value)
+        except (SyntaxError, ValueError):
+            return None
+    if node.type == 'keyword' and node.value in ('True', 'False'):
+        return node.value == 'True'
+    return None
+
 
 class _FakeSequence(Sequence):
     def __init__(self, inference_state, lazy_value_list):
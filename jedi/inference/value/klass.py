@@ -288,7 +288,8 @@ class ClassValue(use_metaclass(CachedMetaClass, ClassMixin, FunctionAndClassBase
 
     def with_generics(self, generics_tuple):
         from jedi.inference.gradual.base import GenericClass
-        return GenericClass(
+        return GenericClass.create_cached(
+            self.inference_state,
             self,
             TupleGenericManager(generics_tuple)
         )
@@ -310,7 +311,8 @@ class ClassValue(use_metaclass(CachedMetaClass, ClassMixin, FunctionAndClassBase
                 yield type_var_dict.get(type_var.py__name__(), NO_VALUES)
 
         if type_var_dict:
-            return ValueSet([GenericClass(
+            return ValueSet([GenericClass.create_cached(
+                self.inference_state,
                 self,
                 TupleGenericManager(tuple(remap_type_vars()))
             )])
@@ -1,7 +1,7 @@
 import re
 import textwrap
+from contextlib import contextmanager
 from inspect import cleandoc
-from weakref import WeakKeyDictionary
 
 from parso.python import tree
 from parso.cache import parser_cache
@@ -228,8 +228,56 @@ def is_scope(node):
     return t in ('file_input', 'classdef', 'funcdef', 'lambdef', 'sync_comp_for')
 
 
+class UsedNamesCache(object):
+    """
+    A cache for things that only depend on the syntax tree of a module. It's
+    used like a ``WeakKeyDictionary`` with the used names of a module as keys,
+    but the values are stored on the used names. The cached values usually
+    contain nodes of the tree, which would keep the used names and therefore
+    the tree alive forever in a ``WeakKeyDictionary``. Like this the values
+    are garbage collected together with the tree. Trees are pickled within
+    :func:`used_names_caches_removed`.
+    """
+    def __getitem__(self, used_names):
+        try:
+            caches = used_names._jedi_caches
+        except AttributeError:
+            raise KeyError(used_names)
+        return caches[self]
+
+    def __setitem__(self, used_names, value):
+        try:
+            caches = used_names._jedi_caches
+        except AttributeError:
+            caches = used_names._jedi_caches = {}
+        caches[self] = value
+
+    def __contains__(self, used_names):
+        return self in getattr(used_names, '_jedi_caches', ())
+
+
+@contextmanager
+def used_names_caches_removed(module_node):
+    """
+    Temporarily removes the values of all :class:`UsedNamesCache` objects from
+    a module. They are Jedi's business and must not end up in pickles of the
+    tree.
+    """
+    used_names = getattr(module_node, '_used_names', None)
+    caches = getattr(used_names, '_jedi_caches', None)
+    if caches is None:
+        yield
+        return
+
+    del used_names._jedi_caches
+    try:
+        yield
+    finally:
+        used_names._jedi_caches = caches
+
+
 def _get_parent_scope_cache(func):
-    cache = WeakKeyDictionary()
+    cache = UsedNamesCache()
 
     def wrapper(used_names, node, include_flows=False):
         try:
@@ -1,9 +1,12 @@
+from weakref import WeakKeyDictionary
+
 from parso.python.tree import search_ancestor
 from jedi._compatibility import FileNotFoundError
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.imports import load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
 from jedi.inference.base_value import NO_VALUES, ValueSet
+from jedi.inference.utils import to_list
 
 _PYTEST_FIXTURE_MODULES = [
     ('_pytest', 'monkeypatch'),
@@ -13,6 +16,11 @@ _PYTEST_FIXTURE_MODULES = [
     ('_pytest', 'pytester'),
 ]
 
+# Used names of a module -> set of the names of functions that have a
+# decorator that looks like a fixture. Trees are shared between inference
+# states and replaced once a file changes.
+_fixture_candidates_cache = WeakKeyDictionary()
+
 
 def execute(callback):
     def wrapper(value, arguments):
@@ -119,6 +127,7 @@ def _is_pytest_func(func_name, decorator_nodes):
 
 
 @inference_state_method_cache()
+@to_list
 def _iter_pytest_modules(module_context, skip_own_module=False):
     if not skip_own_module:
         yield module_context
@@ -142,23 +151,89 @@ def _iter_pytest_modules(module_context, skip_own_module=False):
             yield module_value.as_context()
 
 
+def _get_fixture_candidates(module_node):
+    """
+    Returns the names of the functions in a module that might be fixtures.
+    This only looks at the code of decorators, whether they really are
+    fixtures needs inference.
+    """
+    used_names = module_node.get_used_names()
+    try:
+        return _fixture_candidates_cache[used_names]
+    except KeyError:
+        pass
+
+    candidates = _fixture_candidates_cache[used_names] = set(
+        funcdef.name.value
+        for funcdef in module_node.iter_funcdefs()
+        if any(_get_fixture_decorator_name(d) is not None
+               for d in funcdef.get_decorators())
+    )
+    return candidates
+
+
+def _get_fixture_decorator_name(decorator):
+    dotted_name = decorator.children[1]
+    # A heuristic, this makes it faster.
+    if 'fixture' in dotted_name.get_code():
+        return dotted_name
+    return None
+
+
 class FixtureFilter(ParserTreeFilter):
+    def __init__(self, parent_context):
+        super(FixtureFilter, self).__init__(parent_context)
+        self._candidates = _get_fixture_candidates(self._module_node)
+
+    def get(self, name):
+        if name not in self._candidates:
+            return []
+        return super(FixtureFilter, self).get(name)
+
+    def values(self):
+        return [
+            name
+            for string_name in self._candidates
+            for name in super(FixtureFilter, self).get(string_name)
+        ]
+
     def _filter(self, names):
         for name in super(FixtureFilter, self)._filter(names):
             funcdef = name.parent
             if funcdef.type == 'funcdef':
                 # Class fixtures are not supported
-                decorated = funcdef.parent
-                if decorated.type == 'decorated' and self._is_fixture(decorated):
+                if _is_fixture(self.parent_context, funcdef):
                     yield name
 
-    def _is_fixture(self, decorated):
-        for decorator in decorated.children:
-            dotted_name = decorator.children[1]
-            # A heuristic, this makes it faster.
-            if 'fixture' in dotted_name.get_code():
-                for value in self.parent_context.infer_node(dotted_name):
-                    if value.name.get_qualified_names(include_module_names=True) \
-                            == ('_pytest', 'fixtures', 'fixture'):
-                        return True
-        return False
+
+def _is_fixture(context, funcdef):
+    for decorator in funcdef.get_decorators():
+        dotted_name = _get_fixture_decorator_name(decorator)
+        if dotted_name is None:
+            continue
+        if dotted_name.type == 'name':
+            values = _infer_module_attribute(context, (dotted_name.value,))
+        elif dotted_name.type == 'dotted_name':
+            values = _infer_module_attribute(
+                context,
+                tuple(n.value for n in dotted_name.children if n.type == 'name')
+            )
+        else:
+            values = context.infer_node(dotted_name)
+        for value in values:
+            if value.name.get_qualified_names(include_module_names=True) \
+                    == ('_pytest', 'fixtures', 'fixture'):
+                return True
+    return False
+
+
+@inference_state_method_cache()
+def _infer_module_attribute(context, names):
+    """
+    Infers a dotted name like ``pytest.fixture`` in a module. Fixture modules
+    usually use the same decorator many times, so this is only done once.
+    """
+    values = context.py__getattribute__(names[0])
+    for name in names[1:]:
+        values = values.py__getattribute__(name)
+    return values
@@ -25,12 +25,15 @@ Filesystem cache
 
 .. autodata:: cache_directory
 .. autodata:: use_filesystem_cache
+.. autodata:: max_parse_cache_size
+.. autodata:: compiled_module_snapshots
 
 
 Parser
 ~~~~~~
 
 .. autodata:: fast_parser
+.. autodata:: max_library_module_trees
 
 
 Dynamic stuff
@@ -41,6 +44,7 @@ Dynamic stuff
 .. autodata:: dynamic_params_for_other_modules
 .. autodata:: additional_dynamic_modules
 .. autodata:: auto_import_modules
+.. autodata:: max_operation_value_pairs
 
 
 Caching
@@ -49,6 +53,14 @@ Caching
 .. autodata:: call_signatures_validity
 
 
+Environment subprocess
+~~~~~~~~~~~~~~~~~~~~~~
+
+.. autodata:: subprocess_max_requests
+.. autodata:: subprocess_max_memory
+.. autodata:: subprocess_idle_timeout
+
+
 """
 import os
 import platform
@@ -101,6 +113,22 @@ On Linux, if environment variable ``$XDG_CACHE_HOME`` is set,
 ``$XDG_CACHE_HOME/jedi`` is used instead of the default one.
 """
 
+max_parse_cache_size = 500 * 2 ** 20
+"""
+The maximum size in bytes of the pickled syntax trees in the cache directory.
+If there are more, the least recently used ones are deleted. ``None`` means
+no limit. The cache can also be inspected and pruned with
+``python -m jedi cache``.
+"""
+
+compiled_module_snapshots = False
+"""
+Introspect compiled modules (e.g. C extensions like ``_socket``) only once and
+store the result as a stub-like Python file in the cache directory. Afterwards
+the module is loaded from that file instead of being inspected in the
+subprocess again. See :mod:`jedi.inference.compiled.snapshot`.
+"""
+
 # ----------------
 # parser
 # ----------------
@@ -112,12 +140,32 @@ something has been changed e.g. to a function. If this happens, only the
 function is being reparsed.
 """
 
-_cropped_file_size = 10e6  # 1 Megabyte
+max_library_module_trees = None
+"""
+The maximum number of library modules (modules that are not part of the
+project, e.g. in site-packages) whose syntax trees are kept in memory between
+requests. ``None`` means no limit. The trees of the least recently used
+library modules are reloaded from the filesystem cache when they are needed
+again. This is slower than keeping them in memory, but a lot faster than
+parsing them again.
+
+Long running processes that use big libraries like numpy or django can lower
+this to use a lot less memory.
+"""
+
+_outline_file_size = 10e6  # 10 Megabytes
 """
 Jedi gets extremely slow if the file size exceed a few thousand lines.
-To avoid getting stuck completely Jedi crops the file this point.
+To avoid getting stuck completely Jedi only parses an outline of bigger files,
+where the bodies of functions are empty. See :mod:`jedi.inference.outline`.
 
 One megabyte of typical Python code equals about 20'000 lines of code.
+
+If a position in one of the left away function bodies is used, the outline is
+created and parsed again with that function, which costs about as much as the
+first parse and discards the caches of the :class:`.Script`. Positions in the
+function that was restored last don't cause a reparse, so working within one
+function stays fast, but jumping between functions of a huge file does not.
 """
 
 # ----------------
@@ -160,6 +208,14 @@ This improves autocompletion for libraries that use ``setattr`` or
 ``globals()`` modifications a lot.
 """
 
+max_operation_value_pairs = 6
+"""
+Binary operations like ``a + b`` are inferred for every pair of values of the
+two operands. If there are more pairs than this, literals are collapsed to
+instances of their class (e.g. ``1`` and ``2`` to ``int()``) before pairing,
+so chained operations over unions don't grow multiplicatively.
+"""
+
 # ----------------
 # caching validity (time)
 # ----------------
@@ -169,3 +225,30 @@ call_signatures_validity = 3.0
 Finding function calls might be slow (0.1-0.5s). This is not acceptible for
 normal writing. Therefore cache it for a short time.
 """
+
+# ----------------
+# environment subprocess
+# ----------------
+
+subprocess_max_requests = None
+"""
+Restart the subprocess that inspects compiled objects of an environment after
+this many requests. The subprocess imports modules and never unloads them, so
+it grows over time. ``None`` means no limit.
+
+A subprocess is only restarted once no inference state is using it anymore,
+so this never breaks a running completion.
+"""
+
+subprocess_max_memory = None
+"""
+Restart the environment subprocess once its memory usage (resident set size)
+is above this many megabytes. ``None`` means no limit.
+"""
+
+subprocess_idle_timeout = None
+"""
+Stop the environment subprocess after it has not been used for this many
+seconds. It is started again on the next request. ``None`` means it is never
+stopped.
+"""
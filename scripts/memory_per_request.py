@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Measure the memory that a request allocates. Infers every n-th line of a file
+(or completes it) and reports the memory that is still used by the script
+afterwards and the peak during the requests, both measured with
+``tracemalloc``. It also prints the classes with the most instances that are
+alive after the requests.
+
+Usage:
+  memory_per_request.py [<file>] [-n <number>] [-c] [--top <number>]
+  memory_per_request.py -h | --help
+
+Options:
+  -h --help       Show this screen.
+  -n <number>     Use every n-th line of the file [default: 7].
+  -c --complete   Complete lines instead of inferring them.
+  --top <number>  Number of classes with the most instances [default: 10].
+"""
+import gc
+import os
+import sys
+import tracemalloc
+from collections import Counter
+
+from docopt import docopt
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+import jedi  # noqa: E402
+
+
+def run(path, step, complete):
+    with open(path) as f:
+        code = f.read()
+    script = jedi.Script(code, path=path)
+    for i, line in enumerate(code.splitlines()):
+        if i % step or not line.strip():
+            continue
+        if complete:
+            script.complete(i + 1, len(line))
+        else:
+            script.infer(i + 1, len(line))
+    return script
+
+
+def count_instances(top):
+    counter = Counter(
+        type(obj).__name__ for obj in gc.get_objects()
+        if type(obj).__module__.startswith('jedi.')
+    )
+    return counter.most_common(top)
+
+
+def main(args):
+    path = args['<file>'] or jedi.api.__file__.replace('.pyc', '.py')
+    step = int(args['-n'])
+
+    # Once to load builtins and the like.
+    run(path, step, args['--complete'])
+
+    gc.collect()
+    tracemalloc.start()
+    script = run(path, step, args['--complete'])
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('Used %.1f MB after the requests, %.1f MB at the peak.'
+          % (current / 2 ** 20, peak / 2 ** 20))
+
+    for name, count in count_instances(int(args['--top'])):
+        print('%8d %s' % (count, name))
+    del script
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
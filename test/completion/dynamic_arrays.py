@@ -154,6 +154,23 @@ arr3[10]
 #? float() str() int() set()
 res[10]
 
+# -----------------
+# names that only refer to other literals
+# -----------------
+
+literal1 = [1]
+literal2 = ['']
+literal2 = [b'']
+literal1.append(1.0)
+literal2.append(set())
+alias = literal1
+alias.append(str)
+
+#? int() float() str
+literal1[10]
+#? bytes() set()
+literal2[10]
+
 # -----------------
 # returns, special because the module dicts are not correct here.
 # -----------------
@@ -193,3 +193,26 @@ cosh.real
 cosh = 3
 #? int()
 cosh
+
+# -----------------
+# many reassignments
+# -----------------
+
+reassigned = 1
+reassigned = ''
+if random_flag:
+    reassigned = 1.0
+#? float() str()
+reassigned
+reassigned = b''
+#? bytes()
+reassigned
+def reassigned_in_function():
+    #? list()
+    reassigned
+    reassigned2 = reassigned
+    reassigned2 = []
+    #? list()
+    reassigned2
+
+reassigned = []
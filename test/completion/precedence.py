@@ -141,3 +141,21 @@ a = foobarbaz + 'hello'
 
 #? int() float()
 {'hello': 1, 'bar': 1.0}[a]
+
+
+# -----------------
+# widening of big unions
+# -----------------
+
+four_ints = 1 if foobarbaz else 2 if foobarbaz else 3 if foobarbaz else 4
+two_ints = 5 if foobarbaz else 6
+#? int()
+(four_ints + two_ints)
+#? int()
+(four_ints - two_ints + four_ints * two_ints)
+#? bool()
+(four_ints == two_ints)
+#? bool()
+(four_ints < two_ints)
+#? int() str()
+(four_ints + (two_ints if foobarbaz else ''))
@@ -0,0 +1,61 @@
+import json
+import zipfile
+
+import pytest
+
+from jedi import settings
+from jedi.api import cache_bundle
+from jedi.api.exceptions import InvalidCacheBundle
+from jedi.api.project import Project
+from jedi.file_io import FileIO
+from jedi.inference import InferenceState, parse_store, call_sites
+from jedi.inference.compiled import snapshot
+
+
+def _create_machine(tmpdir, monkeypatch, lib_code):
+    project_dir = tmpdir.mkdir('project')
+    project_dir.join('main.py').write('import lib\nlib.foo(1)\n')
+    lib_dir = tmpdir.mkdir('lib')
+    lib_dir.join('lib.py').write('def foo(a):\n    return a\n')
+    lib_dir.join('other.py').write(lib_code)
+    monkeypatch.setattr(settings, 'cache_directory', str(tmpdir.mkdir('cache')))
+    return Project(str(project_dir), sys_path=[str(lib_dir)])
+
+
+def test_cache_bundle(tmpdir, monkeypatch, environment):
+    # Parsing typeshed would take a while.
+    monkeypatch.setattr(cache_bundle, '_get_typeshed_directories', lambda v: [])
+    monkeypatch.setattr(settings, 'use_filesystem_cache', True)
+    bundle_path = str(tmpdir.join('bundle.zip'))
+
+    project = _create_machine(tmpdir.mkdir('a'), monkeypatch, 'x = 1\n')
+    inference_state = InferenceState(project, environment=environment)
+    main_path = str(tmpdir.join('a', 'project', 'main.py'))
+    call_sites.filter_calling_files(
+        str(tmpdir.join('a', 'project')), [FileIO(main_path)], 'foo')
+    snapshot.save_snapshot(inference_state.environment, '_fake', None, u'x = 1\n')
+    assert cache_bundle.create_bundle(bundle_path, project, environment) == 3
+
+    # Another machine, where one file is different.
+    project = _create_machine(tmpdir.mkdir('b'), monkeypatch, 'x = 2\n')
+    inference_state = InferenceState(project, environment=environment)
+    assert cache_bundle.import_bundle(bundle_path, project, environment) == 2
+
+    grammar = inference_state.grammar
+    for name, is_cached in [('project/main.py', True), ('lib/lib.py', True),
+                            ('lib/other.py', False)]:
+        path = str(tmpdir.join('b', *name.split('/')))
+        assert bool(parse_store.get_valid_pickle(
+            grammar, path, settings.cache_directory)) == is_cached
+    folder_index = call_sites.get_folder_index(str(tmpdir.join('b', 'project')))
+    assert 'foo' in folder_index['main.py']
+    dotted_name, path, _ = snapshot.get_snapshots(inference_state.environment)[0]
+    assert (dotted_name, path) == ('_fake', None)
+
+
+def test_cache_bundle_of_other_environment(tmpdir, environment):
+    bundle_path = str(tmpdir.join('bundle.zip'))
+    with zipfile.ZipFile(bundle_path, 'w') as zip_file:
+        zip_file.writestr('manifest.json', json.dumps(dict(version=1, environment='x')))
+    with pytest.raises(InvalidCacheBundle):
+        cache_bundle.import_bundle(bundle_path, Project(str(tmpdir)), environment)
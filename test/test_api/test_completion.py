@@ -7,6 +7,7 @@ import pytest
 
 from ..helpers import root_dir
 from jedi.api.helpers import start_match, fuzzy_match
+from jedi.inference.value import iterable
 
 
 def test_in_whitespace(Script):
@@ -361,7 +362,12 @@ _dict_keys_completion_tests = [
 @pytest.mark.parametrize(
     'added_code, column, expected', _dict_keys_completion_tests
 )
-def test_dict_keys_completions(Script, added_code, column, expected, skip_pre_python36):
+@pytest.mark.parametrize('summarized', [False, True])
+def test_dict_keys_completions(Script, added_code, column, expected, summarized,
+                               skip_pre_python36, monkeypatch):
+    if summarized:
+        # Treat all the dict literals like huge ones.
+        monkeypatch.setattr(iterable, '_LARGE_LITERAL_SIZE', 0)
     code = dedent(r'''
         ints = {1: ''}
         ints[50] = 3.0
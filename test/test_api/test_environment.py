@@ -4,6 +4,7 @@ import sys
 import pytest
 
 import jedi
+from jedi import settings
 from jedi._compatibility import py_version
 from jedi.api.environment import get_default_environment, find_virtualenvs, \
     InvalidPythonEnvironment, find_system_environments, \
@@ -153,3 +154,84 @@ def test_changing_venv(venv_path, monkeypatch):
     get_cached_default_environment()
     monkeypatch.setitem(os.environ, 'VIRTUAL_ENV', sys.executable)
     assert get_cached_default_environment().executable == sys.executable
+
+
+def test_environment_registry(monkeypatch, tmpdir):
+    from jedi.api import environment as environment_module
+    monkeypatch.setattr(settings, 'cache_directory', str(tmpdir))
+    env = create_environment(sys.executable, safe=False)
+    sys_path = env.get_sys_path()
+
+    def fail(*args, **kwargs):
+        raise AssertionError('The interpreter should not be started')
+
+    monkeypatch.setattr(environment_module, 'CompiledSubprocess', fail)
+    cached_env = create_environment(sys.executable, safe=False)
+    assert cached_env.executable == env.executable
+    assert cached_env.path == env.path
+    assert cached_env.version_info == env.version_info
+    assert cached_env.get_sys_path() == sys_path
+    assert cached_env._sha256 == env._sha256
+
+    # The interpreter is started again if it was replaced.
+    registry = environment_module._environment_registry
+    entry, = registry._load().values()
+    entry['info_stamp'] = [1]
+    with pytest.raises(InvalidPythonEnvironment):
+        create_environment(sys.executable, safe=False)
+    # Executables that can't be started are forgotten.
+    assert not registry._load()
+
+    # A changed executable needs to be inspected again.
+    monkeypatch.setattr(environment_module, '_get_file_stamp', lambda path: [1])
+    with pytest.raises(InvalidPythonEnvironment):
+        create_environment(sys.executable, safe=False)
+
+
+def test_environment_registry_is_not_used_for_safety(monkeypatch, tmpdir):
+    from jedi.api import environment as environment_module
+    monkeypatch.setattr(settings, 'cache_directory', str(tmpdir))
+    env = create_environment(sys.executable, safe=False)
+    monkeypatch.setattr(environment_module, '_is_unix_safe_simple', lambda p: False)
+    monkeypatch.setattr(environment_module, 'find_system_environments', lambda: [env])
+
+    fake = tmpdir.join('python')
+    fake.write('')
+    assert not environment_module._is_safe(str(fake))
+    # Even if the registry claims it's the same binary.
+    environment_module._environment_registry._update_entry(
+        str(fake), sha256=env._sha256)
+    assert not environment_module._is_safe(str(fake))
+
+
+def test_subprocess_recycling(monkeypatch):
+    from jedi.inference.compiled.subprocess import CompiledSubprocess, functions
+
+    class InferenceState(object):
+        pass
+
+    compiled_subprocess = CompiledSubprocess(sys.executable)
+    monkeypatch.setattr(settings, 'subprocess_max_requests', 3)
+    state1 = InferenceState()
+    for i in range(5):
+        compiled_subprocess.run(state1, functions._test_print)
+    process = compiled_subprocess._get_process()
+
+    # The process is still in use by the first inference state.
+    state2 = InferenceState()
+    compiled_subprocess.run(state2, functions._test_print)
+    assert compiled_subprocess._get_process() is process
+
+    compiled_subprocess.delete_inference_state(id(state1))
+    compiled_subprocess.delete_inference_state(id(state2))
+    state3 = InferenceState()
+    compiled_subprocess.run(state3, functions._test_print)
+    assert compiled_subprocess._get_process() is not process
+    assert process.poll() is not None
+
+    # Stop the idle subprocess in the background.
+    monkeypatch.setattr(settings, 'subprocess_idle_timeout', 0)
+    compiled_subprocess.delete_inference_state(id(state3))
+    compiled_subprocess._run_background_tasks()
+    assert compiled_subprocess._process is None
+    assert not compiled_subprocess._inference_state_ids
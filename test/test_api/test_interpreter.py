@@ -1,10 +1,14 @@
 """
 Tests of ``jedi.api.Interpreter``.
 """
+import gc
+import os
 import sys
 import warnings
+import weakref
 
 import pytest
+from parso.cache import parser_cache
 
 import jedi
 from jedi._compatibility import is_py3, py_version
@@ -113,6 +117,48 @@ def test_side_effect_completion():
     assert foo.name == 'foo'
 
 
+def test_syntax_node_cache(monkeypatch, tmpdir):
+    path = str(tmpdir.join('syntax_node_module.py'))
+    with open(path, 'w') as f:
+        f.write('def foo():\n    return 1\n')
+    monkeypatch.syspath_prepend(str(tmpdir))
+    monkeypatch.delitem(sys.modules, 'syntax_node_module', raising=False)
+    namespace = {'foo': import_module('syntax_node_module').foo}
+
+    searched = []
+    search = mixed._search_syntax_node_name
+
+    def search_syntax_node_name(inference_state, python_object):
+        searched.append(python_object)
+        return search(inference_state, python_object)
+
+    monkeypatch.setattr(mixed, '_search_syntax_node_name', search_syntax_node_name)
+    monkeypatch.setattr(mixed, '_syntax_node_paths', {})
+
+    for i in range(2):
+        c = get_completion('foo', namespace)
+        assert c.line == 1
+    # The nodes are reused by new interpreter sessions.
+    module = sys.modules['syntax_node_module']
+    assert searched == [module, namespace['foo']]
+
+    with open(path, 'w') as f:
+        f.write('\ndef foo():\n    return 1\n')
+    mtime = os.path.getmtime(path) + 10
+    os.utime(path, (mtime, mtime))
+    c = get_completion('foo', namespace)
+    assert c.line == 2
+    assert searched[2:] == [module, namespace['foo']]
+
+    # The cached nodes don't keep the tree alive.
+    grammar = jedi.Interpreter('', [namespace])._inference_state.grammar
+    module_node = parser_cache[grammar._hashed].pop(path).node
+    used_names = weakref.ref(module_node.get_used_names())
+    del module_node, c
+    gc.collect()
+    assert used_names() is None
+
+
 def _assert_interpreter_complete(source, namespace, completions,
                                  **kwds):
     script = jedi.Interpreter(source, [namespace], **kwds)
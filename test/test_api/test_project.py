@@ -2,6 +2,7 @@ import os
 
 from ..helpers import get_example_dir, set_cwd, root_dir
 from jedi import Interpreter
+from jedi.api.project import get_default_project
 
 
 def test_django_default_project(Script):
@@ -22,3 +23,43 @@ def test_interpreter_project_path():
     with set_cwd(dir):
         project = Interpreter('', [locals()])._inference_state.project
         assert project._path == dir
+
+
+def test_default_project_cache(tmpdir):
+    path = str(tmpdir.mkdir('pkg'))
+    project = get_default_project(path)
+    assert project._path == path
+    assert get_default_project(path) is project
+
+    # Creating a marker file invalidates the cached project.
+    tmpdir.join('setup.py').write('')
+    new_project = get_default_project(path)
+    assert new_project is not project
+    assert new_project._path == str(tmpdir)
+
+
+def test_default_project_cache_file_edited_in_place(tmpdir, monkeypatch):
+    from jedi.api import project as project_module
+
+    path = str(tmpdir.mkdir('pkg'))
+    manage = tmpdir.join('pkg', 'manage.py')
+    manage.write('')
+    dir_mtime = os.path.getmtime(path)
+    assert get_default_project(path)._django is False
+
+    # Editing a file in place doesn't change the mtime of its directory.
+    manage.write('import os\nos.environ["DJANGO_SETTINGS_MODULE"]\n')
+    os.utime(str(manage), (dir_mtime + 10, dir_mtime + 10))
+    os.utime(path, (dir_mtime, dir_mtime))
+    assert get_default_project(path)._django is True
+
+    monkeypatch.setattr(project_module, '_MAX_CACHED_PATHS', 2)
+    for name in 'abc':
+        get_default_project(str(tmpdir.mkdir(name)))
+    assert len(project_module._default_project_cache) <= 2
+
+
+def test_sys_path_argument_does_not_change_default_project(Script):
+    path = os.path.join(root_dir, 'test', 'foo.py')
+    Script('', path=path, sys_path=['/foo'])
+    assert get_default_project(os.path.dirname(path))._sys_path is None
@@ -27,3 +27,180 @@ def test_cache_find_signatures(Script):
 def test_cache_line_split_issues(Script):
     """Should still work even if there's a newline."""
     assert Script('int(\n').find_signatures()[0].name == 'int'
+
+
+def test_inference_state_method_cache():
+    from jedi.inference.cache import inference_state_method_cache
+
+    class InferenceState(object):
+        memoize_cache = {}
+
+    class Value(object):
+        inference_state = InferenceState()
+        calls = []
+
+        @inference_state_method_cache(default=None)
+        def recursive(self):
+            self.calls.append('recursive')
+            # A recursion returns the default.
+            return self.recursive(), 1
+
+        @inference_state_method_cache()
+        def with_args(self, a, b=None):
+            self.calls.append((a, b))
+            return a
+
+    value = Value()
+    assert value.recursive() == (None, 1)
+    assert value.recursive() == (None, 1)
+    assert value.with_args(1) == 1
+    assert value.with_args(1) == 1
+    assert value.with_args(1, b=2) == 1
+    assert value.with_args(1, b=2) == 1
+    assert Value.calls == ['recursive', (1, None), (1, 2)]
+
+
+def test_max_library_module_trees(Script, tmpdir, monkeypatch):
+    from parso.cache import parser_cache
+    from jedi import settings
+
+    monkeypatch.setattr(settings, 'max_library_module_trees', 1)
+    tmpdir.join('lib_a.py').write('def foo(): pass\n')
+    tmpdir.join('lib_b.py').write('def bar(): pass\n')
+    path_a = str(tmpdir.join('lib_a.py'))
+    path_b = str(tmpdir.join('lib_b.py'))
+
+    def complete(code):
+        script = Script(code, sys_path=[str(tmpdir)])
+        trees = parser_cache[script._inference_state.grammar._hashed]
+        return [c.name for c in script.complete()], trees
+
+    names, trees = complete('import lib_a; lib_a.f')
+    assert names == ['foo']
+    assert path_a in trees
+
+    names, trees = complete('import lib_b; lib_b.b')
+    assert names == ['bar']
+    assert path_a not in trees
+    assert path_b in trees
+
+    # The tree is loaded again from the filesystem cache.
+    names, trees = complete('import lib_a; lib_a.f')
+    assert names == ['foo']
+    assert path_a in trees
+    assert path_b not in trees
+
+
+def test_used_names_cache_does_not_keep_trees_alive():
+    import gc
+    import weakref
+    import parso
+    from jedi.parser_utils import get_cached_parent_scope
+
+    module = parso.parse('def foo():\n    x = 1\n')
+    used_names = module.get_used_names()
+    name, = used_names['x']
+    assert get_cached_parent_scope(used_names, name).type == 'funcdef'
+
+    ref = weakref.ref(used_names)
+    del module, used_names, name
+    gc.collect()
+    assert ref() is None
+
+
+def test_parse_store(tmpdir, monkeypatch):
+    import os
+    from parso.cache import parser_cache, _get_hashed_path
+    from jedi import settings
+    from jedi.file_io import FileIO
+    from jedi.inference import InferenceState, parse_store
+    from jedi.api.project import Project
+
+    monkeypatch.setattr(settings, 'use_filesystem_cache', True)
+    cache_path = str(tmpdir.mkdir('cache'))
+    inference_state = InferenceState(Project(str(tmpdir)))
+    grammar = inference_state.grammar
+
+    def parse(name):
+        path = str(tmpdir.join(name))
+        return inference_state.parse(
+            file_io=FileIO(path), cache=True, cache_path=cache_path
+        )
+
+    tmpdir.join('a.py').write('def foo(): pass\n')
+    tmpdir.join('b.py').write('def bar(): pass\n')
+    parse('a.py')
+    pickle_a = _get_hashed_path(grammar._hashed, str(tmpdir.join('a.py')), cache_path)
+    store, = parse_store.get_store_directories(cache_path)
+    # Written atomically, no temporary files are left behind.
+    assert sorted(os.listdir(store)) \
+        == sorted([os.path.basename(pickle_a), parse_store._GC_STAMP_NAME])
+
+    # The pickle is loaded without parsing again.
+    del parser_cache[grammar._hashed][str(tmpdir.join('a.py'))]
+    module = parse('a.py')
+    assert module.children[0].name.value == 'foo'
+
+    parse('b.py')
+    count, size = parse_store.get_store_info(store)
+    assert count == 2
+    # The least recently used pickle is deleted first.
+    os.utime(pickle_a, (0, os.path.getmtime(pickle_a)))
+    assert parse_store.prune(store, size - 1) == 1
+    assert not os.path.exists(pickle_a)
+    assert parse_store.get_store_info(store)[0] == 1
+
+    assert parse_store.clear_store(store) == 1
+    assert parse_store.get_store_directories(cache_path) == []
+
+
+def test_parse_store_without_parso_internals(tmpdir, monkeypatch):
+    from jedi.file_io import FileIO
+    from jedi.inference import InferenceState, parse_store
+    from jedi.api.project import Project
+
+    # The store relies on private parso functions, parso's cache is used if
+    # they are gone.
+    monkeypatch.setattr(parse_store, '_get_hashed_path', None)
+    monkeypatch.setattr(parse_store, '_VERSION_TAG', None)
+    tmpdir.join('a.py').write('def foo(): pass\n')
+    inference_state = InferenceState(Project(str(tmpdir)))
+    module = inference_state.parse(
+        file_io=FileIO(str(tmpdir.join('a.py'))),
+        cache=True,
+        cache_path=str(tmpdir.join('cache')),
+    )
+    assert module.children[0].name.value == 'foo'
+    assert parse_store.get_valid_pickle(
+        inference_state.grammar, str(tmpdir.join('a.py'))) is None
+
+
+def test_parse_store_does_not_pickle_jedi_caches(tmpdir):
+    import os
+    from parso.cache import parser_cache
+    from jedi.file_io import FileIO
+    from jedi.inference import InferenceState, parse_store
+    from jedi.api.project import Project
+    from jedi._compatibility import pickle
+    from jedi.parser_utils import get_cached_parent_scope
+
+    path = str(tmpdir.join('a.py'))
+    cache_path = str(tmpdir.join('cache'))
+    tmpdir.join('a.py').write('def foo():\n    x = 1\n')
+    inference_state = InferenceState(Project(str(tmpdir)))
+    grammar = inference_state.grammar
+    module = inference_state.parse(file_io=FileIO(path), cache=True, cache_path=cache_path)
+    used_names = module.get_used_names()
+    name, = used_names['x']
+    get_cached_parent_scope(used_names, name)
+    assert used_names._jedi_caches
+
+    # The pickle is written again, e.g. after it was pruned.
+    pickle_path = parse_store.get_valid_pickle(grammar, path, cache_path)
+    os.remove(pickle_path)
+    parse_store.save_module(grammar, path, cache_path)
+    with open(pickle_path, 'rb') as f:
+        item = pickle.load(f)
+    assert not hasattr(item.node.get_used_names(), '_jedi_caches')
+    assert used_names._jedi_caches
+    assert parser_cache[grammar._hashed][path].node is module
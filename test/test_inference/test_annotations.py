@@ -1,3 +1,5 @@
+import gc
+import weakref
 from textwrap import dedent
 
 import pytest
@@ -62,3 +64,39 @@ def test_lambda_forward_references(Script, environment):
     # For now just receiving the 3 is ok. I'm doubting that this is what we
     # want. We also execute functions. Should we only execute classes?
     assert Script(source).infer()
+
+
+def test_forward_reference_cache(Script, environment):
+    if environment.version_info.major == 2:
+        pytest.skip()
+
+    from parso.cache import parser_cache
+    from jedi.inference.gradual import annotation
+
+    source = dedent("""\
+    def foo(a: "int", b: "int"):
+        a
+        b
+
+    def bar(c, d):
+        # type: (str, int) -> None
+        c""")
+    script = Script(source)
+    for line in (2, 3, 2):
+        assert [d.name for d in script.infer(line, 5)] == ['int']
+        assert [d.name for d in script.infer(7, 5)] == ['str']
+    # The annotations of foo have the same text and the same place.
+    used_names = script._module_node.get_used_names()
+    assert len(annotation._annotation_node_cache[used_names]) == 2
+
+    # The parsed annotations don't keep the tree alive once it's removed from
+    # parso's cache (e.g. like a library tree that is evicted).
+    ref = weakref.ref(used_names)
+    del script, used_names
+    for trees in parser_cache.values():
+        trees.pop(None, None)
+    gc.collect()
+    assert ref() is None
+
+    assert annotation._split_comment_param_declaration('str, List[int]') \
+        == ['str', 'List[int]']
@@ -0,0 +1,51 @@
+import os
+
+from jedi import settings
+from jedi.file_io import FolderIO
+from jedi.inference import call_sites
+
+
+def _write(path, code):
+    with open(path, 'w') as f:
+        f.write(code)
+
+
+def _get_calling_files(folder, name):
+    folder_io = FolderIO(str(folder))
+    file_ios = [folder_io.get_file_io(n) for n in sorted(folder_io.list())]
+    return [
+        os.path.basename(file_io.path)
+        for file_io in call_sites.filter_calling_files(folder_io.path, file_ios, name)
+    ]
+
+
+def test_filter_calling_files(tmpdir):
+    _write(str(tmpdir.join('a.py')), 'def foo(x):\n    x\n')
+    _write(str(tmpdir.join('b.py')), 'from a import foo\nfoo (1)\nbar.baz(\n)')
+    _write(str(tmpdir.join('c.py')), 'from a import foo\nfoo\n')
+
+    assert _get_calling_files(tmpdir, 'foo') == ['a.py', 'b.py']
+    assert _get_calling_files(tmpdir, 'baz') == ['b.py']
+    assert _get_calling_files(tmpdir, 'x') == []
+
+    # Changed files are scanned again.
+    _write(str(tmpdir.join('c.py')), 'from a import foo\nfoo(2, 3)\n')
+    os.utime(str(tmpdir.join('c.py')), (1, 1))
+    assert _get_calling_files(tmpdir, 'foo') == ['a.py', 'b.py', 'c.py']
+
+    # The index is loaded from the cache directory in a new session.
+    call_sites._folder_indexes.clear()
+    assert _get_calling_files(tmpdir, 'baz') == ['b.py']
+
+
+def test_dynamic_params_in_other_modules(Script, tmpdir, monkeypatch):
+    monkeypatch.setattr(settings, 'dynamic_params_for_other_modules', True)
+    _write(str(tmpdir.join('dynamic_target.py')), 'def foo(x):\n    x\n')
+    _write(str(tmpdir.join('b.py')), 'from dynamic_target import foo\nfoo(1)\n')
+    _write(str(tmpdir.join('c.py')), 'from dynamic_target import foo\nfoo\n')
+
+    path = str(tmpdir.join('dynamic_target.py'))
+    with open(path) as f:
+        code = f.read()
+    def_, = Script(code, path=path).infer(2, 5)
+    assert def_.name == 'int'
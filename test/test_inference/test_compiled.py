@@ -181,3 +181,52 @@ def test_operation(Script, inference_state, create_compiled_object):
         right=b,
     )
     assert true.py__name__() == 'bool'
+
+
+def test_compiled_module_snapshot(inference_state, monkeypatch):
+    from jedi import settings
+    from jedi.inference.compiled import snapshot
+
+    monkeypatch.setattr(settings, 'compiled_module_snapshots', True)
+    sys_path = inference_state.get_sys_path()
+    module = snapshot.load_or_create_snapshot(inference_state, u'_socket', sys_path)
+    assert module.tree_node is not None
+    assert module.string_names == ('_socket',)
+    assert module.py__file__().endswith('.py')
+
+    cls, = module.py__getattribute__(u'socket')
+    assert cls.tree_node.type == 'classdef'
+    assert cls.py__getattribute__(u'connect')
+    error, = module.py__getattribute__(u'gaierror')
+    assert [c.name.string_name for c in error.py__mro__()][:2] \
+        == ['gaierror', 'OSError']
+
+    # Now the snapshot is loaded without asking the subprocess again.
+    def fail(*args, **kwargs):
+        raise AssertionError('Should not be called')
+
+    monkeypatch.setattr(snapshot, 'create_snapshot', fail)
+    assert snapshot.load_or_create_snapshot(inference_state, u'_socket', sys_path)
+    assert snapshot.load_or_create_snapshot(inference_state, u'builtins', sys_path) is None
+
+
+def test_compiled_module_snapshot_failures(inference_state, monkeypatch):
+    from jedi import settings
+    from jedi.inference.compiled import snapshot
+
+    monkeypatch.setattr(settings, 'compiled_module_snapshots', True)
+    sys_path = inference_state.get_sys_path()
+    calls = []
+    create_snapshot_code = inference_state.compiled_subprocess.create_snapshot_code
+
+    def create(**kwargs):
+        calls.append(kwargs['dotted_name'])
+        return create_snapshot_code(**kwargs)
+
+    monkeypatch.setattr(inference_state.compiled_subprocess, 'create_snapshot_code', create)
+    for i in range(2):
+        # A Python package and a module that doesn't exist.
+        assert snapshot.load_or_create_snapshot(inference_state, u'json', sys_path) is None
+        assert snapshot.load_or_create_snapshot(
+            inference_state, u'jedi_does_not_exist', sys_path) is None
+    assert calls == ['json', 'jedi_does_not_exist']
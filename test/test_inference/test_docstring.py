@@ -120,6 +120,24 @@ def test_docstrings_type_str(Script):
     assert 'join' in names
 
 
+def test_docstrings_type_cache(Script):
+    from jedi.inference import docstrings
+    docstrings._statement_string_cache.clear()
+    s = dedent("""
+        def func(arg, other):
+            '''
+            :type arg: str
+            :type other: str
+            '''
+            other.lower().""")
+
+    for i in range(2):
+        names = [c.name for c in Script(s).complete()]
+        assert 'join' in names
+    # The pseudo module of the type string is shared.
+    assert len(docstrings._statement_string_cache) == 1
+
+
 def test_docstring_instance(Script):
     # The types hint that it's a certain kind
     s = dedent("""
@@ -2,7 +2,8 @@ import os
 
 from test.helpers import root_dir
 from jedi.api.project import Project
-from jedi.inference.gradual.conversion import convert_names
+from jedi.inference.base_value import ValueSet
+from jedi.inference.gradual.conversion import convert_names, convert_values
 
 
 def test_sqlite3_conversion(Script):
@@ -62,3 +63,30 @@ def test_goto_import(Script, skip_pre_python35):
     assert d.is_stub()
     d, = Script(code).goto()
     assert not d.is_stub()
+
+
+def test_conversions_are_cached(Script, monkeypatch):
+    d, = Script('import json; json.JSONDecoder').infer(only_stubs=True)
+    stub_cls, = d._name.infer()
+    assert stub_cls.is_stub()
+
+    lookups = []
+    py__getattribute__ = ValueSet.py__getattribute__
+
+    def lookup(self, *args, **kwargs):
+        lookups.append(args[0])
+        return py__getattribute__(self, *args, **kwargs)
+
+    monkeypatch.setattr(ValueSet, 'py__getattribute__', lookup)
+
+    python_cls, = convert_values([stub_cls])
+    assert not python_cls.is_stub()
+    assert lookups == ['JSONDecoder']
+    assert convert_values([stub_cls]) == ValueSet([python_cls])
+
+    converted, = convert_values([python_cls], only_stubs=True)
+    assert converted is stub_cls
+    converted, = convert_values([python_cls], only_stubs=True)
+    assert converted is stub_cls
+    # The qualified names are only looked up once per module.
+    assert lookups == ['JSONDecoder', 'JSONDecoder']
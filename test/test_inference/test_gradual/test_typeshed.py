@@ -2,11 +2,13 @@ import os
 
 import pytest
 from parso.utils import PythonVersionInfo
+from parso.cache import parser_cache
 
 from jedi.inference.gradual import typeshed
 from jedi.inference.value import TreeInstance, BoundMethod, FunctionValue, \
     MethodValue, ClassValue
 from jedi.inference.names import StubName
+from jedi.inference.base_value import ValueSet
 
 TYPESHED_PYTHON3 = os.path.join(typeshed.TYPESHED_PATH, 'stdlib', '3')
 
@@ -45,6 +47,31 @@ def test_get_stub_files():
     assert map_['functools'] == os.path.join(TYPESHED_PYTHON3, 'functools.pyi')
 
 
+def test_shared_stub_modules(Script):
+    def get_builtins_node():
+        script = Script('')
+        return script._inference_state.builtins_module.tree_node
+
+    node = get_builtins_node()
+    # Even if parso's cache is garbage collected, typeshed is not parsed again.
+    saved = dict(parser_cache)
+    parser_cache.clear()
+    try:
+        assert get_builtins_node() is node
+    finally:
+        parser_cache.update(saved)
+
+
+def test_shared_stub_modules_are_bounded(Script, monkeypatch):
+    monkeypatch.setattr(typeshed, '_typeshed_module_cache', typeshed.OrderedDict())
+    monkeypatch.setattr(typeshed, '_MAX_CACHED_TYPESHED_MODULES', 2)
+    Script('import os\nos.path').infer()
+    keys = list(typeshed._typeshed_module_cache)
+    assert len(keys) == 2
+    grammar = Script('')._inference_state.latest_grammar
+    assert all(hashed == grammar._hashed for hashed, path in keys)
+
+
 def test_function(Script, environment):
     code = 'import threading; threading.current_thread'
     def_, = Script(code).infer()
@@ -139,6 +166,19 @@ def test_math(Script):
     assert value
 
 
+def test_generic_classes_are_shared(Script):
+    builtins = Script('')._inference_state.builtins_module
+    list_, = builtins.py__getattribute__('list')
+    int_, = builtins.py__getattribute__('int')
+    str_, = builtins.py__getattribute__('str')
+
+    list_int = list_.with_generics((ValueSet([int_]),))
+    assert list_.with_generics([ValueSet([int_])]) is list_int
+    assert list_.with_generics((ValueSet([str_]),)) is not list_int
+    assert list_.with_generics((ValueSet([int_, str_]),)) \
+        is list_.with_generics((ValueSet([str_, int_]),))
+
+
 def test_type_var(Script):
     def_, = Script('import typing; T = typing.TypeVar("T1")').infer()
     assert def_.name == 'TypeVar'
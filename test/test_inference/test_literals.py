@@ -40,3 +40,43 @@ def test_thousand_separators(Script, environment):
     assert _infer_literal(Script, '0x3_4') == 52
     assert _infer_literal(Script, '0b1_0') == 2
     assert _infer_literal(Script, '0o1_0') == 8
+
+
+def test_large_literals(Script, monkeypatch):
+    from jedi.inference.value import iterable
+    monkeypatch.setattr(iterable, '_LARGE_LITERAL_SIZE', 3)
+
+    def infer(code):
+        return sorted(d.name for d in Script(code).infer())
+
+    lst = 'lst = [1, 2.0, "a", 3, b"b", True, {1: 2}, {"a": ""}]\n'
+    assert infer(lst + 'for x in lst: x') == ['bool', 'bytes', 'dict', 'float', 'int', 'str']
+    assert infer(lst + 'lst[1]') == ['float']
+
+    dct = 'dct = {"a": 1, "b": "", 1: 1.0, 1.0: 2, x: b""}\n'
+    assert infer(dct + 'dct["b"]') == ['str']
+    # Like in Python the key 1 is the same as 1.0
+    assert infer(dct + 'dct[1]') == ['int']
+    assert infer(dct + 'list(dct.values())[0]') == ['bytes', 'float', 'int', 'str']
+    assert infer(dct + 'for k in dct: k') == ['float', 'int', 'str']
+
+
+def test_large_literals_with_nested_literals(Script, monkeypatch):
+    from jedi.inference import syntax_tree
+    from jedi.inference.value import iterable
+    monkeypatch.setattr(iterable, '_LARGE_LITERAL_SIZE', 3)
+
+    inferred_dicts = []
+    infer_atom = syntax_tree.infer_atom
+
+    def count_dicts(context, atom):
+        if atom.type == 'atom' and atom.children[0] == '{':
+            inferred_dicts.append(atom)
+        return infer_atom(context, atom)
+
+    monkeypatch.setattr(syntax_tree, 'infer_atom', count_dicts)
+    count = iterable._SUMMARY_SAMPLE_SIZE * 10
+    code = 'lst = [%s]\nfor x in lst: x' % ', '.join(['{"a": 1}'] * count)
+    def_, = Script(code).infer()
+    assert def_.name == 'dict'
+    assert len(inferred_dicts) == iterable._SUMMARY_SAMPLE_SIZE
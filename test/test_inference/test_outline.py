@@ -0,0 +1,67 @@
+from textwrap import dedent
+
+from jedi.inference.outline import get_outline
+
+
+def test_get_outline():
+    code = dedent('''\
+        import os
+
+        @decorator
+        def foo(a,
+                b=")"):
+            """
+            def not_a_function():
+            """
+            x = [
+        1]
+            def inner():
+                return 1
+            return x
+
+        class Foo:
+            def bar(self): return 1
+
+            async def baz(self):
+                s = \'\'\'
+        x = 3
+        \'\'\'
+                return s
+            y = 2
+        ''')
+    expected = dedent('''\
+        import os
+
+        @decorator
+        def foo(a,
+                b=")"):
+            """
+            def not_a_function():
+            """
+
+
+
+
+
+
+        class Foo:
+            def bar(self): return 1
+
+            async def baz(self):
+                pass
+
+
+
+            y = 2
+        ''')
+    assert get_outline(code) == (expected, [(6, 14), (19, 22)])
+
+    # The function around the line is kept.
+    outline, removed_ranges = get_outline(code, keep_line=21)
+    assert outline.splitlines()[:15] == expected.splitlines()[:15]
+    assert outline.splitlines()[15:] == code.splitlines()[15:]
+    assert removed_ranges == [(6, 14)]
+    assert get_outline(code, keep_line=7) == (
+        ''.join(code.splitlines(True)[:18]) + ''.join(expected.splitlines(True)[18:]),
+        [(19, 22)]
+    )
@@ -0,0 +1,62 @@
+import sys
+from textwrap import dedent
+
+import parso
+
+from jedi.plugins import pytest as pytest_plugin
+
+
+def _write(path, code):
+    with open(path, 'w') as f:
+        f.write(dedent(code))
+
+
+def test_conftest_fixtures(Script, tmpdir):
+    _write(str(tmpdir.join('conftest.py')), '''\
+        import pytest
+
+        @pytest.fixture
+        def my_fixture():
+            return 1
+
+        def helper():
+            return ''
+        ''')
+    path = str(tmpdir.join('test_a.py'))
+    code = dedent('''\
+        def test_a(my_fixture, helper):
+            my_fixture
+
+        def test_b(my_fixture):
+            my_fixture
+        ''')
+    script = Script(code, path=path, sys_path=[str(tmpdir)] + sys.path)
+    # Fixtures are found for more than one lookup of the same script.
+    for line in (2, 5):
+        def_, = script.infer(line, 5)
+        assert def_.name == 'int'
+    def_, = script.goto(4, 12)
+    assert def_.module_path == str(tmpdir.join('conftest.py'))
+
+    assert [n.name for n in script.complete(1, 14)
+            if n.name.startswith('my')] == ['my_fixture']
+    assert not [n for n in script.complete(1, 28) if n.name == 'helper']
+
+
+def test_fixture_candidates():
+    module_node = parso.parse(dedent('''\
+        import pytest
+
+        @pytest.fixture(scope='module')
+        def a(): pass
+
+        @decorator
+        @fixture
+        def b(): pass
+
+        @decorator
+        def c(): pass
+
+        def d(): pass
+        '''))
+    assert pytest_plugin._get_fixture_candidates(module_node) == {'a', 'b'}
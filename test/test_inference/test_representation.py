@@ -32,3 +32,26 @@ def test_class_mro(Script):
     cls, inference_state = get_definition_and_inference_state(Script, s)
     mro = cls.py__mro__()
     assert [c.name.string_name for c in mro] == ['X', 'object']
+
+
+def test_class_attribute_names(Script):
+    code = dedent("""
+    unrelated = 1
+    class A(object):
+        a = 1
+        def foo(self):
+            self.x = 1
+            local = 1
+        class Inner:
+            def bar(self):
+                self.y = 1
+    class B(A):
+        b = 1
+    """)
+    names = set(c.name for c in Script(code + 'B().').complete())
+    assert {'a', 'b', 'foo', 'x', 'Inner'} <= names
+    assert not {'unrelated', 'local', 'bar', 'y'} & names
+
+    names = set(c.name for c in Script(code + 'B.').complete())
+    assert {'a', 'b', 'foo', 'Inner'} <= names
+    assert not {'unrelated', 'local', 'x'} & names
@@ -74,6 +74,7 @@ _s = ['/a', '/b', '/c/d/']
         (_s, '/a/b.py', ('b',), False),
         (_s, '/a/b/c.py', ('b', 'c'), False),
         (_s, '/x/b.py', None, False),
+        (_s, '/ab/c.py', None, False),
         (_s, '/c/d/x.py', ('x',), False),
         (_s, '/c/d/x.py', ('x',), False),
         (_s, '/c/d/x/y.py', ('x', 'y'), False),
@@ -108,3 +109,10 @@ def test_transform_path_to_dotted(sys_path_, module_path, expected, is_package):
     module_path = os.path.abspath(module_path)
     assert sys_path.transform_path_to_dotted(sys_path_, module_path) \
         == (expected, is_package)
+
+
+def test_module_path_resolver_is_shared():
+    sys_path_ = [os.path.abspath(p) for p in _s]
+    resolver = sys_path.get_module_path_resolver(sys_path_)
+    assert sys_path.get_module_path_resolver(list(sys_path_)) is resolver
+    assert resolver.transform(os.path.abspath('/c/d/x/__init__.py')) == (('x',), True)
@@ -0,0 +1,36 @@
+from jedi.common import value as common_value
+from jedi.inference.base_value import ValueSet, NO_VALUES
+
+
+class _Value(object):
+    def __init__(self, name):
+        self.name = name
+
+    def upper(self):
+        return ValueSet([_Value(self.name.upper())])
+
+
+def test_small_and_big_sets():
+    values = [_Value(str(i)) for i in range(20)]
+    for size in (0, 1, 2, common_value._MAX_TUPLE_SIZE, 12, 20):
+        value_set = ValueSet(values[:size] + values[:size])
+        assert len(value_set) == size
+        assert set(value_set) == set(values[:size])
+
+        union = ValueSet.from_sets(ValueSet([v]) for v in values[:size])
+        assert union == value_set
+        assert hash(union) == hash(value_set)
+        assert ValueSet(values[:size] + [_Value('x')]) != value_set
+
+        assert value_set & ValueSet(values[1:3]) == ValueSet(values[1:min(size, 3)])
+        assert value_set | ValueSet(values[size:]) == ValueSet(values)
+
+
+def test_shared_sets():
+    value_set = ValueSet([_Value('a')])
+    assert value_set | NO_VALUES is value_set
+    assert ValueSet.from_sets([NO_VALUES, value_set, []]) is value_set
+    assert value_set.filter(lambda v: False) is NO_VALUES
+    assert NO_VALUES.upper() is NO_VALUES
+    upper, = value_set.upper()
+    assert upper.name == 'A'
@@ -34,18 +34,41 @@ def test_additional_dynamic_modules(monkeypatch, Script):
     assert not Script('def some_func(f):\n f.').complete()
 
 
-def test_cropped_file_size(monkeypatch, names, Script):
-    code = 'class Foo(): pass\n'
+def test_outline_file_size(monkeypatch, names, Script):
+    code = 'class Foo():\n    def foo(self):\n        x = 1\n        return x\n'
     monkeypatch.setattr(
         settings,
-        '_cropped_file_size',
+        '_outline_file_size',
         len(code)
     )
 
-    foo, = names(code + code)
-    assert foo.line == 1
+    # Big files are not cropped anymore, all the definitions are found.
+    foo1, foo2 = names(code + code)
+    assert (foo1.line, foo2.line) == (1, 5)
 
-    # It should just not crash if we are outside of the cropped range.
-    script = Script(code + code + 'Foo')
-    assert not script.infer()
-    assert 'Foo' in [c.name for c in script.complete()]
+    script = Script(code + code + 'Foo().foo')
+    assert [d.name for d in script.infer()] == ['foo']
+    assert 'foo' in [c.name for c in script.complete()]
+    # Function bodies are left away.
+    assert not Script(code + code + 'Foo().foo()').infer()
+
+
+def test_outline_file_size_in_function(monkeypatch, Script):
+    monkeypatch.setattr(settings, '_outline_file_size', 10)
+    code = 'import os\ndef f(a):\n    x = os.path\n    return x.jo\n\ndef g(): pass\ng'
+    script = Script(code)
+    parsed_lines = []
+    parse = script._parse
+
+    def parse_function(keep_line=None):
+        parsed_lines.append(keep_line)
+        parse(keep_line)
+
+    monkeypatch.setattr(script, '_parse', parse_function)
+    assert [c.name for c in script.complete(4, 15)] == ['join']
+    assert [(d.name, d.line) for d in script.goto(4, 11)] == [('x', 3)]
+    assert [(d.name, d.line) for d in script.goto(3, 4)] == [('x', 3)]
+    # At the top level the outline is still enough.
+    assert [(d.name, d.line) for d in script.goto(7, 0)] == [('g', 6)]
+    # The function is only parsed again once.
+    assert parsed_lines == [4]